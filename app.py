@@ -1,18 +1,33 @@
+import importlib
+
 import streamlit as st
 
+from core.logging import logger
 # Модули управления приложением
 from ui.app_modules.state_controller import render_save_manager_sidebar, load_initial_state, update_and_save_state
-from ui.app_modules.team_builder import render_team_builder_sidebar
-from ui.cheat_sheet import render_cheat_sheet_page
-from ui.checks import render_checks_page
-from ui.editor.editor import render_editor_page
-from ui.leveling import render_leveling_page
-from ui.profile.main import render_profile_page
-from ui.relationships import render_relationships_page
-# Страницы
-from ui.simulator.simulator import render_simulator_page
 from ui.styles import apply_styles
-from ui.tree_view import render_skill_tree_page
+
+# Страницы: пункт меню -> (модуль, функция отрисовки).
+# Модуль страницы импортируется только когда ее открывают.
+PAGES = {
+    "⚔️ Simulator": ("ui.simulator.simulator", "render_simulator_page"),
+    "👤 Profile": ("ui.profile.main", "render_profile_page"),
+    "🌳 Skill Tree": ("ui.tree_view", "render_skill_tree_page"),
+    "📈 Leveling": ("ui.leveling", "render_leveling_page"),
+    "🛠️ Card Editor": ("ui.editor.editor", "render_editor_page"),
+    "🎲 Checks": ("ui.checks", "render_checks_page"),
+    "❤️ Relationships": ("ui.relationships", "render_relationships_page"),
+    "📚 Cheat Sheet": ("ui.cheat_sheet", "render_cheat_sheet_page"),
+}
+
+
+def _page_renderer(page: str):
+    module_name, func_name = PAGES.get(page, PAGES["🛠️ Card Editor"])
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+# 0. Лог пишется в файл пачками из фонового потока (повторный вызов ничего не делает)
+logger.start_background_flush()
 
 # 1. Применяем CSS
 apply_styles()
@@ -24,40 +39,11 @@ render_save_manager_sidebar()
 load_initial_state()
 
 # 4. Навигация
-pages = [
-    "⚔️ Simulator",
-    "👤 Profile",
-    "🌳 Skill Tree",
-    "📈 Leveling",
-    "🛠️ Card Editor",
-    "🎲 Checks",
-    "❤️ Relationships",  # <--- НОВЫЙ ПУНКТ
-    "📚 Cheat Sheet"
-]
-page = st.sidebar.radio("Go to", pages, key="nav_page", on_change=update_and_save_state)
+page = st.sidebar.radio("Go to", list(PAGES), key="nav_page", on_change=update_and_save_state)
 
 # 5. Маршрутизация
 if "Simulator" in page:
+    from ui.app_modules.team_builder import render_team_builder_sidebar
     render_team_builder_sidebar() # Доп. панель только для симулятора
-    render_simulator_page()
-
-elif "Profile" in page:
-    render_profile_page()
-
-elif "Checks" in page:
-    render_checks_page()
-
-elif "Leveling" in page:
-    render_leveling_page()
-
-elif "Skill Tree" in page:
-    render_skill_tree_page()
-
-elif "Cheat Sheet" in page:
-    render_cheat_sheet_page()
-
-elif "Relationships" in page:
-    render_relationships_page()
 
-else:
-    render_editor_page()
\ No newline at end of file
+_page_renderer(page)()
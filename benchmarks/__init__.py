@@ -0,0 +1,9 @@
+"""
+Бенчмарки горячих путей боя (броски, стычки, пересчет статов, библиотека, сохранения).
+
+Запуск из корня проекта:
+    python -m benchmarks                       # все замеры
+    python -m benchmarks -k clash -n 100       # только имена с "clash", по 100 вызовов
+    python -m benchmarks --save base.json      # сохранить результаты
+    python -m benchmarks --compare base.json   # сравнить с сохраненными (код 1 при регрессии)
+"""
@@ -0,0 +1,49 @@
+import argparse
+import sys
+
+from core.logging import logger
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LoR combat benchmarks")
+    parser.add_argument("-k", "--filter", default=None, help="Запускать только бенчмарки, чье имя содержит строку")
+    parser.add_argument("-n", "--number", type=int, default=None, help="Число замеров на бенчмарк")
+    parser.add_argument("--save", default=None, help="Сохранить результаты в JSON")
+    parser.add_argument("--compare", default=None, help="JSON с прошлыми результатами для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Допустимый рост медианы при --compare (0.2 = +20%%)")
+    parser.add_argument("--log", action="store_true", help="Не отключать логгер (замер с буферизацией логов)")
+    args = parser.parse_args(argv)
+
+    if not args.log:
+        logger.set_null_sink()
+
+    from benchmarks import bench_combat, bench_state  # noqa: F401 (регистрация бенчмарков)
+    from benchmarks.harness import run_all, format_table, save_results, load_results, find_regressions
+    from logic.battle_flow.battle_scope import set_active_battle
+
+    def progress(name):
+        print(f"  running {name}...", file=sys.stderr)
+
+    try:
+        results = run_all(args.filter, args.number, progress)
+    finally:
+        set_active_battle(None)
+
+    baseline = load_results(args.compare) if args.compare else None
+    print(format_table(results, baseline))
+
+    if args.save:
+        save_results(results, args.save)
+        print(f"Saved to {args.save}")
+
+    if baseline:
+        slow = find_regressions(results, baseline, args.threshold)
+        if slow:
+            print(f"Regressions (> +{args.threshold:.0%} median): {', '.join(slow)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
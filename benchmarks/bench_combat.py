@@ -0,0 +1,107 @@
+from benchmarks.harness import benchmark
+from benchmarks.scenarios import prepared_battle, raid_battle, first_deck_card, is_melee_attack, mass_card_id, equip
+from core.library import Library
+from logic.battle_flow.clash.clash import process_clash
+from logic.battle_flow.mass_attack import process_mass_attack
+from logic.battle_flow.onesided.onesided import process_onesided
+from logic.battle_flow.interaction_graph import InteractionGraph
+from logic.clash import ClashSystem
+from logic.context import RollContext
+from logic.mechanics.rolling.rolling import create_roll_context
+from logic.scripts.card_special import summon_ally
+
+SUMMON_UNIT = "Экс Машинариум"
+
+
+def _duel():
+    """Лима (S1) против Азгика (S1): первые атакующие карты из колод."""
+    session = prepared_battle(plan=False)
+    attacker, defender = session.team_left[0], session.team_right[0]
+    a_slot = equip(attacker, first_deck_card(attacker, is_melee_attack))
+    d_slot = equip(defender, first_deck_card(defender, is_melee_attack))
+    return session, attacker, defender, a_slot, d_slot
+
+
+# === БРОСКИ ===
+
+def _setup_roll():
+    _, attacker, defender, _, _ = _duel()
+    return attacker, defender, attacker.current_card.dice_list[0]
+
+
+@benchmark("roll.create_roll_context", setup=_setup_roll, number=2000, group="combat")
+def bench_create_roll_context(attacker, defender, die):
+    create_roll_context(attacker, defender, die)
+
+
+# === СТОЛКНОВЕНИЯ ===
+
+def _setup_clash():
+    _, attacker, defender, a_slot, d_slot = _duel()
+    return ClashSystem(), attacker, defender, a_slot['speed'], d_slot['speed']
+
+
+@benchmark("clash.process_clash", setup=_setup_clash, number=300, group="combat")
+def bench_process_clash(engine, attacker, defender, spd_a, spd_d):
+    process_clash(engine, attacker, defender, "Clash", True, spd_a, spd_d)
+
+
+def _setup_onesided():
+    _, attacker, defender, a_slot, d_slot = _duel()
+    defender.current_card = None
+    return ClashSystem(), attacker, defender, a_slot['speed'], d_slot['speed']
+
+
+@benchmark("clash.process_onesided", setup=_setup_onesided, number=300, group="combat")
+def bench_process_onesided(engine, attacker, defender, spd_a, spd_d):
+    process_onesided(engine, attacker, defender, "One-Sided", spd_a, spd_d)
+
+
+def _setup_mass():
+    session = prepared_battle()
+    source = session.team_left[0]
+    slot = equip(source, Library.get_card(mass_card_id()))
+    action = {'source': source, 'slot_data': slot}
+    return ClashSystem(), action, session.team_right
+
+
+@benchmark("clash.process_mass_attack", setup=_setup_mass, number=300, group="combat")
+def bench_process_mass_attack(engine, action, opposing_team):
+    process_mass_attack(engine, action, opposing_team, "Mass Atk", executed_slots=set())
+
+
+# === ПЛАНИРОВАНИЕ ===
+
+def _setup_redirections():
+    session = prepared_battle()
+    return session.team_left, session.team_right
+
+
+@benchmark("planning.calculate_redirections", setup=_setup_redirections, number=1000, group="planning")
+def bench_calculate_redirections(team_left, team_right):
+    InteractionGraph(team_left, team_right).resolve_redirections()
+
+
+def _setup_raid():
+    session = raid_battle()
+    return ClashSystem(session.rng), session.team_left, session.team_right
+
+
+@benchmark("planning.prepare_turn[raid]", setup=_setup_raid, number=50, group="planning")
+def bench_prepare_turn_raid(engine, team_left, team_right):
+    engine.prepare_turn(team_left, team_right)
+
+
+# === ПРИЗЫВ ===
+
+def _setup_summon():
+    session = prepared_battle(plan=False)
+    session.roster  # Ростер грузится с диска при первом обращении - не в замер
+    source = session.team_left[0]
+    return RollContext(source=source, target=None, dice=None), session.team_left
+
+
+@benchmark("summon.summon_ally", setup=_setup_summon, number=200, group="combat")
+def bench_summon_ally(ctx, team):
+    summon_ally(ctx, {"unit_name": SUMMON_UNIT})
+    team.pop()
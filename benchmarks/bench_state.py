@@ -0,0 +1,80 @@
+from benchmarks.harness import benchmark
+from benchmarks.scenarios import prepared_battle
+from core.calculations import recalculate_unit_stats
+from core.library import Library
+from logic.state import codec
+from logic.state.snapshot_maker import SnapshotMaker
+from logic.state.snapshot_restorer import SnapshotRestorer
+
+
+# === СТАТЫ ===
+
+def _setup_unit():
+    return prepared_battle(plan=False).team_right[0],
+
+
+@benchmark("stats.recalculate_unit_stats", setup=_setup_unit, number=1000, group="stats")
+def bench_recalculate_cached(unit):
+    recalculate_unit_stats(unit)
+
+
+@benchmark("stats.recalculate_unit_stats[force]", setup=_setup_unit, number=500, group="stats")
+def bench_recalculate_forced(unit):
+    recalculate_unit_stats(unit, force=True)
+
+
+# === БИБЛИОТЕКА ===
+
+@benchmark("library.load_all", number=20, group="library")
+def bench_library_load_all():
+    Library.load_all()
+
+
+# === СОХРАНЕНИЯ ===
+# Сериализация как в StateFileManager.save_data / load_data, но без записи на диск.
+
+def _session_state():
+    session = prepared_battle()
+    return {
+        "team_left": session.team_left,
+        "team_right": session.team_right,
+        "round_number": session.round_number,
+        "battle_logs": session.battle_logs,
+        "turn_actions": [],
+        "executed_slots": set(),
+    }
+
+
+def _setup_save():
+    return _session_state(),
+
+
+@benchmark("state.snapshot_save", setup=_setup_save, number=200, group="state")
+def bench_snapshot_save(session_state):
+    codec.dumps(SnapshotMaker.get_state_snapshot(session_state))
+
+
+def _setup_restore():
+    data = SnapshotMaker.get_state_snapshot(_session_state())
+    return codec.dumps(data), {}
+
+
+@benchmark("state.snapshot_restore", setup=_setup_restore, number=200, group="state")
+def bench_snapshot_restore(raw, session_state):
+    SnapshotRestorer.restore_from_full(session_state, codec.loads(raw))
+
+
+@benchmark("state.dynamic_roundtrip", setup=_setup_unit, number=500, group="state")
+def bench_dynamic_roundtrip(unit):
+    unit.apply_dynamic_state(unit.get_dynamic_state())
+
+
+# === ВЕТВЛЕНИЕ БОЯ ===
+
+def _setup_fork():
+    return prepared_battle(),
+
+
+@benchmark("state.battle_fork", setup=_setup_fork, number=500, group="state")
+def bench_battle_fork(session):
+    session.fork()
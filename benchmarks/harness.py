@@ -0,0 +1,174 @@
+import contextlib
+import gc
+import io
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+
+# name -> Benchmark (заполняется декоратором @benchmark при импорте модулей bench_*)
+BENCHMARKS: Dict[str, "Benchmark"] = {}
+
+
+@dataclass
+class Benchmark:
+    """
+    Замер одной операции.
+    setup() -> tuple аргументов для op (вызывается перед каждым запуском, не входит в замер).
+    Если setup=None, op вызывается без аргументов.
+    """
+    name: str
+    op: Callable
+    setup: Optional[Callable] = None
+    number: int = 200
+    group: str = "misc"
+
+
+@dataclass
+class BenchResult:
+    name: str
+    group: str
+    number: int
+    min_us: float
+    median_us: float
+    p95_us: float
+    mean_us: float
+    # Пиковый объем выделенной памяти за одну операцию и остаток после нее
+    peak_kib: float
+    retained_kib: float
+
+
+def benchmark(name: str, setup: Callable = None, number: int = 200, group: str = "misc"):
+    """Регистрирует функцию как бенчмарк."""
+
+    def decorator(func):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' already registered")
+        BENCHMARKS[name] = Benchmark(name, func, setup, number, group)
+        return func
+
+    return decorator
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _measure_allocations(bench: Benchmark, samples: int):
+    """Средний пик и остаток памяти на операцию (tracemalloc, отдельно от замера времени)."""
+    peaks, retained = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            args = bench.setup() if bench.setup else ()
+            gc.collect()
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            bench.op(*args)
+            after, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(after - before)
+            del args
+    finally:
+        tracemalloc.stop()
+    return statistics.mean(peaks) / 1024, statistics.mean(retained) / 1024
+
+
+def run_benchmark(bench: Benchmark, number: int = None, warmup: int = 3, alloc_samples: int = 10) -> BenchResult:
+    """Прогоняет бенчмарк: прогрев, замер каждого вызова perf_counter, затем замер памяти."""
+    number = number or bench.number
+
+    for _ in range(warmup):
+        args = bench.setup() if bench.setup else ()
+        bench.op(*args)
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(number):
+            args = bench.setup() if bench.setup else ()
+            start = time.perf_counter()
+            bench.op(*args)
+            timings.append((time.perf_counter() - start) * 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    peak_kib, retained_kib = _measure_allocations(bench, min(alloc_samples, number))
+
+    return BenchResult(
+        name=bench.name,
+        group=bench.group,
+        number=number,
+        min_us=min(timings),
+        median_us=statistics.median(timings),
+        p95_us=_percentile(timings, 95),
+        mean_us=statistics.mean(timings),
+        peak_kib=peak_kib,
+        retained_kib=retained_kib,
+    )
+
+
+def run_all(pattern: str = None, number: int = None, progress: Callable[[str], None] = None) -> List[BenchResult]:
+    """Запускает все зарегистрированные бенчмарки (или те, чье имя содержит pattern)."""
+    results = []
+    for name in sorted(BENCHMARKS, key=lambda n: (BENCHMARKS[n].group, n)):
+        if pattern and pattern not in name:
+            continue
+        if progress:
+            progress(name)
+        # Движок местами печатает в stdout - не мешаем таблице результатов
+        with contextlib.redirect_stdout(io.StringIO()):
+            results.append(run_benchmark(BENCHMARKS[name], number=number))
+    return results
+
+
+# =========================================================================
+# ОТЧЕТЫ
+# =========================================================================
+
+def _fmt_time(us: float) -> str:
+    if us >= 1000:
+        return f"{us / 1000:.2f} ms"
+    return f"{us:.1f} µs"
+
+
+def format_table(results: List[BenchResult], baseline: Dict[str, dict] = None) -> str:
+    header = f"{'benchmark':<40}{'n':>6}{'min':>12}{'median':>12}{'p95':>12}{'peak KiB':>11}{'kept KiB':>10}"
+    if baseline:
+        header += f"{'vs base':>10}"
+    lines = [header, "-" * len(header)]
+
+    for r in results:
+        line = (f"{r.name:<40}{r.number:>6}{_fmt_time(r.min_us):>12}{_fmt_time(r.median_us):>12}"
+                f"{_fmt_time(r.p95_us):>12}{r.peak_kib:>11.1f}{r.retained_kib:>10.1f}")
+        if baseline:
+            base = baseline.get(r.name)
+            line += f"{(r.median_us / base['median_us'] - 1) * 100:>+9.0f}%" if base else f"{'new':>10}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def save_results(results: List[BenchResult], path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({r.name: asdict(r) for r in results}, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def find_regressions(results: List[BenchResult], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Имена бенчмарков, у которых медиана выросла больше чем на threshold (0.2 = +20%)."""
+    slow = []
+    for r in results:
+        base = baseline.get(r.name)
+        if base and r.median_us > base["median_us"] * (1 + threshold):
+            slow.append(r.name)
+    return slow
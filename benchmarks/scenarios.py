@@ -0,0 +1,84 @@
+"""
+Фиксированные сценарии для бенчмарков: реальные юниты из data/units и карты из data/cards,
+один и тот же seed при каждой подготовке.
+"""
+from functools import lru_cache
+
+from core.enums import CardType, DiceType
+from core.library import Library
+from logic.battle_flow.battle_scope import set_active_battle
+from logic.battle_flow.rounds import start_round
+from logic.simulation import BattleSession, load_team, pick_cards
+
+SEED = 1234
+TEAM_LEFT = ("Лима", "Хаски")
+TEAM_RIGHT = ("Азгик", "Рейн")
+RAID_SIZE = 20
+
+ATK_TYPES = (DiceType.SLASH, DiceType.PIERCE, DiceType.BLUNT)
+MASS_TYPES = (CardType.MASS_SUMMATION.value, CardType.MASS_INDIVIDUAL.value)
+
+
+@lru_cache(maxsize=None)
+def roster_data():
+    """Словари юнитов (читаются с диска один раз)."""
+    if not Library.get_all_cards():
+        Library.load_all()
+    return load_team(list(TEAM_LEFT)), load_team(list(TEAM_RIGHT))
+
+
+def prepared_battle(seed: int = SEED, plan: bool = True) -> BattleSession:
+    """
+    Свежий бой после броска скорости (и, если plan=True, автопилотного выбора карт).
+    Бой становится активным в battle_scope, чтобы броски шли через его RNG.
+    """
+    left, right = roster_data()
+    session = BattleSession(left, right, seed=seed)
+    set_active_battle(session)
+    session.setup()
+    start_round(session.team_left, session.team_right, logs=session.battle_logs)
+    if plan:
+        pick_cards(session.team_left, session.team_right, session.rng)
+        pick_cards(session.team_right, session.team_left, session.rng)
+    return session
+
+
+def raid_battle(size: int = RAID_SIZE, seed: int = SEED) -> BattleSession:
+    """Рейд size x size из копий тех же юнитов (одноименные бойцы в каждой команде)."""
+    left, right = roster_data()
+    session = BattleSession([left[i % len(left)] for i in range(size)],
+                            [right[i % len(right)] for i in range(size)], seed=seed)
+    set_active_battle(session)
+    session.setup()
+    start_round(session.team_left, session.team_right, logs=session.battle_logs)
+    pick_cards(session.team_left, session.team_right, session.rng)
+    pick_cards(session.team_right, session.team_left, session.rng)
+    return session
+
+
+def first_deck_card(unit, predicate):
+    """Первая карта колоды юнита, подходящая под predicate (порядок колоды фиксирован)."""
+    for card_id in getattr(unit, "deck", []) or []:
+        card = Library.get_card(card_id)
+        if card and predicate(card):
+            return card
+    return None
+
+
+def is_melee_attack(card) -> bool:
+    return card.card_type not in MASS_TYPES and any(d.dtype in ATK_TYPES for d in card.dice_list)
+
+
+@lru_cache(maxsize=None)
+def mass_card_id(card_type: str = CardType.MASS_INDIVIDUAL.value):
+    """Первая (по id) массовая карта библиотеки нужного типа."""
+    ids = sorted(c.id for c in Library.get_all_cards() if c.card_type == card_type and c.dice_list)
+    return ids[0] if ids else None
+
+
+def equip(unit, card, slot_idx: int = 0):
+    """Кладет карту в слот и делает ее текущей (как execute_single_action)."""
+    slot = unit.active_slots[slot_idx]
+    slot['card'] = card
+    unit.current_card = card
+    return slot
@@ -2,57 +2,72 @@
 from core.logging import logger, LogLevel
 from logic.calculations.attributes import apply_attribute_effects
 from logic.calculations.collectors import (
-    collect_ability_bonuses, collect_status_bonuses, collect_weapon_bonuses
+    collect_ability_bonuses, collect_status_bonuses, collect_weapon_bonuses, apply_contributions
 )
 from logic.calculations.formulas import calculate_totals, finalize_state
 # Импорт наших новых модулей
 from logic.calculations.modifiers import init_modifiers, init_bonuses
 from logic.calculations.pools import calculate_speed_dice, calculate_pools
 from logic.calculations.skills import apply_skill_effects
+from logic.calculations.stat_cache import get_stat_cache, stat_input_key, contributions_key
 from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
 from logic.character_changing.passives import PASSIVE_REGISTRY
 from logic.character_changing.talents import TALENT_REGISTRY
 
 
-def recalculate_unit_stats(unit):
+def recalculate_unit_stats(unit, force: bool = False):
     """
-    Полный пересчет всех характеристик персонажа.
+    Пересчет всех характеристик персонажа.
+    Бонусы источников собираются всегда (они могут зависеть от HP, статусов и т.д.),
+    но если они и входные данные юнита не изменились с прошлого раза,
+    результат берется из кэша без повторного расчета.
+    force=True - полный пересчет (нужен, например, для лога расчета в профиле).
     """
     # [LOG] Начало пересчета (Verbose, так как это частое событие)
-    logger.log(f"🔄 Recalculating stats for {unit.name}", LogLevel.VERBOSE, "Stats")
+    logger.log("🔄 Recalculating stats for %s", LogLevel.VERBOSE, "Stats", unit.name)
 
-    # 1. Инициализация
+    # 1. Сбор бонусов от источников
+    contributions = []
+    collect_ability_bonuses(unit, unit.passives, PASSIVE_REGISTRY, "🛡️", contributions)
+    collect_ability_bonuses(unit, unit.talents, TALENT_REGISTRY, "🌟", contributions)
+    collect_ability_bonuses(unit, unit.augmentations, AUGMENTATION_REGISTRY, "🧬", contributions)
+    collect_weapon_bonuses(unit, contributions)
+    collect_status_bonuses(unit, contributions)
+
+    # 2. Проверка кэша (ключ считаем после сбора: источники могут менять юнита)
+    cache = get_stat_cache(unit)
+    key = (stat_input_key(unit), contributions_key(contributions))
+    if not force and cache.key == key:
+        cache.restore(unit)
+        finalize_state(unit, unit.modifiers)
+        logger.log("♻️ Stats unchanged for %s (cached)", LogLevel.VERBOSE, "Stats", unit.name)
+        return []
+
+    # 3. Инициализация и распределение бонусов
     mods = init_modifiers()
     bonuses = init_bonuses(unit)
+    apply_contributions(contributions, mods, bonuses)
 
-    # 2. Сбор бонусов
-    # Мы убрали аргумент logs, подразумевая, что collectors.py теперь пишут в logger сами
-    collect_ability_bonuses(unit, unit.passives, PASSIVE_REGISTRY, "🛡️", mods, bonuses)
-    collect_ability_bonuses(unit, unit.talents, TALENT_REGISTRY, "🌟", mods, bonuses)
-    collect_ability_bonuses(unit, unit.augmentations, AUGMENTATION_REGISTRY, "🧬", mods, bonuses)
-    collect_weapon_bonuses(unit, mods, bonuses)
-    collect_status_bonuses(unit, mods, bonuses)
-
-    # 3. Расчет атрибутов
+    # 4. Расчет атрибутов
     attrs, skills = calculate_totals(unit, bonuses, mods)
 
-    # 4. Эффекты статов
+    # 5. Эффекты статов
     apply_attribute_effects(attrs, mods)
     apply_skill_effects(skills, mods)
 
-    # 5. Производные (Скорость, Пулы)
+    # 6. Производные (Скорость, Пулы)
     calculate_speed_dice(unit, skills["speed"], mods)
     calculate_pools(unit, attrs, skills, mods)
 
-    # 6. Финализация
+    # 7. Финализация
     finalize_state(unit, mods)
 
     unit.modifiers = mods
+    cache.store(key, unit)
 
     # [LOG] Завершение
-    logger.log(
-        f"✅ Stats updated for {unit.name}. HP: {unit.max_hp}, SP: {unit.max_sp}, Speed: {unit.computed_speed_dice}",
-        LogLevel.VERBOSE, "Stats")
+    logger.log("✅ Stats updated for %s. HP: %s, SP: %s, Speed: %s", LogLevel.VERBOSE, "Stats",
+               unit.name, unit.max_hp, unit.max_sp, unit.computed_speed_dice)
 
     # Больше не возвращаем список logs, так как всё уходит в BattleLogger
-    return []
\ No newline at end of file
+    return []
@@ -1,20 +1,40 @@
-from dataclasses import dataclass, field
-from typing import List, Dict
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Tuple
 
 from core.dice import Dice
 
 
-@dataclass
+@dataclass(frozen=True)
 class Card:
+    """
+    Неизменяемый шаблон карты. Один объект разделяется всеми слотами и юнитами.
+    Скрипты, меняющие кубики, создают копию через with_dice() (оверлей на раунд).
+    """
     name: str
-    dice_list: List[Dice] = field(default_factory=list)
+    dice_list: Tuple[Dice, ...] = ()
     description: str = ""
     id: str = "unknown"
     tier: int = 1
     card_type: str = "melee"
-    flags: List[str] = field(default_factory=list)
+    flags: Tuple[str, ...] = ()
     scripts: Dict[str, List[Dict]] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Списки из JSON/редактора -> кортежи
+        object.__setattr__(self, "dice_list", tuple(self.dice_list))
+        object.__setattr__(self, "flags", tuple(self.flags))
+
+    # Шаблон неизменяемый -> копировать нечего (deepcopy юнитов/слотов не плодит карты)
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def with_dice(self, dice_list) -> 'Card':
+        """Копия карты с другим набором кубиков (оригинал не меняется)."""
+        return replace(self, dice_list=tuple(dice_list))
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -22,7 +42,7 @@ class Card:
             "tier": self.tier,
             "type": self.card_type,
             "description": self.description,
-            "flags": self.flags,
+            "flags": list(self.flags),
             "scripts": self.scripts,
             "dice": [d.to_dict() for d in self.dice_list]
         }
@@ -1,8 +1,8 @@
-import random
 from typing import Dict, Any
 
 from core.logging import logger, LogLevel  # [LOG] Импорт логгера
 from core.unit.unit import Unit
+from logic.battle_flow.battle_scope import get_rng
 
 
 class CheckSystem:
@@ -36,7 +36,7 @@ class CheckSystem:
         return "Неизвестно"
 
     @staticmethod
-    def perform_check(unit: Unit, stat_key: str, difficulty: int = 0) -> Dict[str, Any]:
+    def perform_check(unit: Unit, stat_key: str, difficulty: int = 0, rng=None) -> Dict[str, Any]:
         key = stat_key.lower()
 
         # [LOG] Старт проверки
@@ -54,7 +54,7 @@ class CheckSystem:
         dc_mult = 1.3 if key == "engineering" else 1.0
 
         # 3. Расчеты
-        roll = random.randint(1, die_max)
+        roll = (rng if rng is not None else get_rng()).randint(1, die_max)
         stat_bonus = base_val // bonus_divisor
 
         # Расчет бонусов от статусов через карту
@@ -1,11 +1,11 @@
 # core/dice.py
-from dataclasses import dataclass, field
-from typing import List, Dict
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Tuple
 
 from core.enums import DiceType
 
 
-@dataclass
+@dataclass(frozen=True)
 class Dice:
     min_val: int
     max_val: int
@@ -14,21 +14,40 @@ class Dice:
     is_counter: bool = False
     # ==================
     scripts: Dict[str, List[Dict]] = field(default_factory=dict)
+    # Служебные метки (например, "talent_defense_die")
+    flags: Tuple[str, ...] = ()
 
     # === ДОБАВИТЬ ЭТОТ МЕТОД ===
     def __post_init__(self):
         """Автоматически исправляет границы, если min > max."""
+        object.__setattr__(self, "flags", tuple(self.flags))
         if self.min_val > self.max_val:
-            self.min_val, self.max_val = self.max_val, self.min_val
+            min_val, max_val = self.max_val, self.min_val
+            object.__setattr__(self, "min_val", min_val)
+            object.__setattr__(self, "max_val", max_val)
+
+    # Кубик неизменяемый и разделяется между копиями карты
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def evolve(self, **changes) -> 'Dice':
+        """Копия кубика с измененными полями (например, dtype)."""
+        return replace(self, **changes)
 
     def to_dict(self):
-        return {
+        data = {
             "type": self.dtype.value.lower(),
             "base_min": self.min_val,
             "base_max": self.max_val,
             "is_counter": self.is_counter,
             "scripts": self.scripts
         }
+        if self.flags:
+            data["flags"] = list(self.flags)
+        return data
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -44,5 +63,6 @@ class Dice:
             max_val=data.get("base_max", 1),
             dtype=dtype,
             is_counter=data.get("is_counter", False),
-            scripts=data.get("scripts", {})
+            scripts=data.get("scripts", {}),
+            flags=data.get("flags", ())
         )
\ No newline at end of file
@@ -1,4 +1,3 @@
-import copy
 import glob
 import json
 import os
@@ -8,22 +7,51 @@ from core.logging import logger, LogLevel  # [LOG]
 
 
 class Library:
+    CARDS_DIR = "data/cards"
+
     _cards = {}  # Тут хранятся ВСЕ карты (из всех файлов) для игры
     _sources = {}  # Словарь: card_id -> filename
+    _file_ids = {}  # Каталог источников: filename -> id карт в порядке файла (колоды стоек, сборки)
+    _file_mtimes = {}  # filename -> mtime файла на момент индексации
+    _by_name = {}  # Вторичный индекс: name -> key в _cards
+    _loaded = False  # Карты с диска читаются при первом обращении (ensure_loaded)
 
     @classmethod
     def register(cls, card: Card):
         """Просто добавляет карту в оперативную память"""
         key = card.id if card.id and card.id != "unknown" else card.name
+        old = cls._cards.get(key)
         cls._cards[key] = card
 
+        if old is not None and old.name != card.name:
+            cls._reindex_name(old.name)
+        # Как и раньше при линейном поиске, побеждает первая зарегистрированная карта с этим именем
+        cls._by_name.setdefault(card.name, key)
+
+    @classmethod
+    def _reindex_name(cls, name: str):
+        """Пересобирает запись индекса имени (после переименования/удаления карты)."""
+        cls._by_name.pop(name, None)
+        for key, card in cls._cards.items():
+            if card.name == name:
+                cls._by_name[name] = key
+                break
+
     @classmethod
     def get_card(cls, key: str) -> Card:
-        if key in cls._cards:
-            return copy.deepcopy(cls._cards[key])
-        for card in cls._cards.values():
-            if card.name == key:
-                return copy.deepcopy(card)
+        """
+        O(1) поиск по id или имени. Возвращает общий неизменяемый шаблон (без копирования).
+        """
+        card = cls._cards.get(key)
+        if card is not None:
+            return card
+        if not cls._loaded:
+            cls.ensure_loaded()
+            return cls.get_card(key)
+
+        name_key = cls._by_name.get(key)
+        if name_key is not None:
+            return cls._cards[name_key]
 
         try:
             name = str(key)
@@ -33,15 +61,86 @@ class Library:
 
     @classmethod
     def get_all_cards(cls):
+        cls.ensure_loaded()
         return list(cls._cards.values())
 
     @classmethod
     def get_source(cls, card_id: str) -> str:
         """Возвращает имя файла, откуда карта была загружена."""
+        cls.ensure_loaded()
         return cls._sources.get(card_id)
 
+    # === КАТАЛОГ ИСТОЧНИКОВ ===
+
+    @classmethod
+    def get_source_files(cls, refresh: bool = True) -> list:
+        """Имена файлов с картами (отсортированы). refresh=True - сверить каталог с папкой."""
+        cls.ensure_loaded()
+        if refresh:
+            cls.refresh_sources()
+        return sorted(cls._file_ids)
+
+    @classmethod
+    def get_file_ids(cls, filename: str, refresh: bool = False):
+        """
+        Id карт файла-источника в порядке файла (новый список) или None, если файла нет в каталоге.
+        Без refresh - только память (для боя); refresh=True перечитывает файл, если он изменился.
+        """
+        cls.ensure_loaded()
+        if refresh:
+            cls._refresh_file(filename)
+        ids = cls._file_ids.get(filename)
+        return list(ids) if ids is not None else None
+
+    @classmethod
+    def refresh_sources(cls):
+        """Перечитывает новые и измененные (по mtime) файлы папки карт, забывает удаленные."""
+        if not os.path.isdir(cls.CARDS_DIR):
+            return
+        present = {os.path.basename(p) for p in glob.glob(os.path.join(cls.CARDS_DIR, "*.json"))}
+        for filename in present:
+            cls._refresh_file(filename)
+        for filename in list(cls._file_ids):
+            if filename not in present:
+                cls._forget_file(filename)
+
+    @classmethod
+    def _refresh_file(cls, filename: str):
+        filepath = os.path.join(cls.CARDS_DIR, filename)
+        try:
+            mtime = os.stat(filepath).st_mtime_ns
+        except OSError:
+            cls._forget_file(filename)
+            return
+        if cls._file_mtimes.get(filename) != mtime:
+            logger.log(f"🔄 Card source changed: {filename}", LogLevel.VERBOSE, "System")
+            cls._load_single_file(filepath)
+
+    @classmethod
+    def _forget_file(cls, filename: str):
+        cls._file_ids.pop(filename, None)
+        cls._file_mtimes.pop(filename, None)
+
+    @classmethod
+    def _index_file(cls, filepath: str, cards_list: list):
+        """Запоминает порядок id карт файла и его mtime."""
+        filename = os.path.basename(filepath)
+        cls._file_ids[filename] = [c["id"] for c in cards_list if isinstance(c, dict) and c.get("id")]
+        try:
+            cls._file_mtimes[filename] = os.stat(filepath).st_mtime_ns
+        except OSError:
+            cls._file_mtimes.pop(filename, None)
+
+    @classmethod
+    def ensure_loaded(cls):
+        """Загружает data/cards один раз (раньше это делалось при импорте модуля)."""
+        if not cls._loaded:
+            cls.load_all()
+
     @classmethod
     def load_all(cls, path="data/cards"):
+        if path == "data/cards":
+            cls._loaded = True
         if not os.path.exists(path):
             os.makedirs(path, exist_ok=True)
             logger.log(f"Created directory: {path}", LogLevel.VERBOSE, "System")
@@ -75,8 +174,11 @@ class Library:
 
                 count += 1
 
+            cls._index_file(filepath, cards_list)
             logger.log(f"✔ Loaded {count} cards from {filename}", LogLevel.NORMAL, "System")
         except Exception as e:
+            # Битый файл остается в каталоге пустым, пока не изменится на диске
+            cls._index_file(filepath, [])
             logger.log(f"Error loading {filepath}: {e}", LogLevel.NORMAL, "System")
 
     @classmethod
@@ -84,6 +186,7 @@ class Library:
         """
         Сохраняет конкретную карту в конкретный файл.
         """
+        cls.ensure_loaded()
         folder = "data/cards"
         filepath = os.path.join(folder, filename)
         os.makedirs(folder, exist_ok=True)
@@ -120,14 +223,18 @@ class Library:
 
             cls.register(card)
             cls._sources[card.id] = filename
+            cls._index_file(filepath, current_data["cards"])
         except Exception as e:
             logger.log(f"Error saving card to disk: {e}", LogLevel.NORMAL, "System")
 
     @classmethod
     def delete_card(cls, card_id):
         """Удаляет карту из памяти и из файла."""
+        cls.ensure_loaded()
         if card_id in cls._cards:
-            del cls._cards[card_id]
+            card = cls._cards.pop(card_id)
+            if cls._by_name.get(card.name) == card_id:
+                cls._reindex_name(card.name)
 
         if card_id in cls._sources:
             del cls._sources[card_id]
@@ -154,6 +261,7 @@ class Library:
 
                         with open(filepath, 'w', encoding='utf-8') as f:
                             json.dump(data, f, ensure_ascii=False, indent=2)
+                        cls._index_file(filepath, new_list)
 
                         logger.log(f"🗑️ Card {card_id} deleted from {filepath}", LogLevel.NORMAL, "System")
                         return True
@@ -161,7 +269,3 @@ class Library:
                     logger.log(f"Error deleting from {filepath}: {e}", LogLevel.NORMAL, "System")
 
         return False
-
-
-# Инициализация
-Library.load_all("data/cards")
\ No newline at end of file
@@ -1,9 +1,13 @@
+import atexit
 import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 from enum import IntEnum
 
-import streamlit as st
-
 # Путь к файлу полного лога
 LOG_FILE_PATH = "data/logs/full_battle_log.txt"
 
@@ -17,14 +21,29 @@ class LogLevel(IntEnum):
     VERBOSE = 3  # Уровень 3: Полный (Триггеры пассивок, Кулдауны, Детали расчетов, Начало фаз)
 
 
+def _format_time(ts: float) -> str:
+    """Часы:Минуты:Секунды.Миллисекунды"""
+    return datetime.fromtimestamp(ts).strftime("%H:%M:%S.%f")[:-3]
+
+
 class BattleLogger:
     """
     Система логгирования.
-    - Пишет ВСЕ логи в файл data/logs/full_battle_log.txt.
+    - Отбрасывает сообщения выше min_level до любого форматирования.
+    - Пишет логи в файл data/logs/full_battle_log.txt пачками (буфер + периодический сброс
+      фоновым потоком, который запускается при первой записи в буфер - и в UI, и в headless-режиме).
     - Сохраняет логи в st.session_state для отображения в UI с фильтрацией.
+    - В headless-режиме (без Streamlit) хранит последние записи в кольцевом буфере.
+    - Null-режим (симуляции) не делает ничего.
     """
     _instance = None
 
+    # Сколько строк копить перед записью в файл и как часто сбрасывать (сек)
+    BUFFER_SIZE = 512
+    FLUSH_INTERVAL = 1.0
+    # Размер кольцевого буфера записей в headless-режиме
+    MEMORY_LIMIT = 5000
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(BattleLogger, cls).__new__(cls)
@@ -34,6 +53,25 @@ class BattleLogger:
         # Инициализация происходит один раз при создании
         if not hasattr(self, 'initialized'):
             self.ensure_log_dir()
+            self.min_level = LogLevel.VERBOSE
+            self.null_sink = False
+            # Потоковый флаг тишины (quiet): глушит логи только в своем потоке
+            self._local = threading.local()
+            # None = UI-режим (session_state), deque = headless-режим
+            self._memory_storage = None
+            self._memory_counter = 0
+            self.file_output = True
+
+            # Буфер строк для файла
+            self._pending = deque()
+            self._lock = threading.Lock()
+            self._last_flush = time.monotonic()
+            self._flusher = None
+            self._flusher_stop = threading.Event()
+            atexit.register(self.flush)
+            # В дочернем процессе (fork пула) потока сброса нет: он запустится заново при первой записи
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(after_in_child=self._reset_after_fork)
             # При первом запуске (или перезагрузке сервера) можно отбить начало сессии
             # Но файл мы будем очищать только по команде clear(), чтобы сохранять историю между реранами
             self.initialized = True
@@ -42,47 +80,169 @@ class BattleLogger:
         """Создает папку для логов, если её нет."""
         os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
 
-    def log(self, message: str, level: LogLevel = LogLevel.NORMAL, category: str = "Info"):
+    # === НАСТРОЙКА ===
+
+    def configure(self, min_level: LogLevel = None, file_output: bool = None,
+                  buffer_size: int = None, flush_interval: float = None):
+        """Меняет параметры логгера (None = оставить как есть)."""
+        if min_level is not None: self.min_level = LogLevel(min_level)
+        if file_output is not None: self.file_output = file_output
+        if buffer_size is not None: self.BUFFER_SIZE = max(1, buffer_size)
+        if flush_interval is not None: self.FLUSH_INTERVAL = flush_interval
+
+    def set_headless(self, enabled: bool = True, file_output: bool = True):
         """
-        Основной метод записи лога.
+        Переключает логгер в режим без Streamlit (симуляции, CLI).
+        file_output=False отключает запись в файл (для массовых прогонов).
+        """
+        self._memory_storage = deque(maxlen=self.MEMORY_LIMIT) if enabled else None
+        self.file_output = file_output
 
-        Args:
-            message (str): Текст сообщения.
-            level (LogLevel): Важность (MINIMAL, NORMAL, VERBOSE).
-            category (str): Категория (Combat, Effect, System, Dice...).
+    def set_null_sink(self, enabled: bool = True):
+        """Полностью отключает логирование (массовые симуляции)."""
+        if enabled: self.flush()
+        self.null_sink = enabled
+
+    @contextmanager
+    def quiet(self):
         """
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Часы:Минуты:Секунды.Миллисекунды
+        Отключает логирование только в текущем потоке (прогоны планировщика в UI).
+        Другие сессии Streamlit, работающие в соседних потоках, продолжают писать логи.
+        """
+        prev = getattr(self._local, "quiet", False)
+        self._local.quiet = True
+        try:
+            yield
+        finally:
+            self._local.quiet = prev
 
-        # 1. Запись в файл (Пишем ВСЕГДА всё подряд для дебага)
-        # Формат: [TIME] [LEVEL] [CATEGORY] Message
-        log_entry_str = f"[{timestamp}] [{level.name:<7}] [{category}] {message}\n"
+    def is_enabled(self, level: LogLevel) -> bool:
+        """Дешевая проверка перед построением дорогого сообщения."""
+        return not self.null_sink and level <= self.min_level and not getattr(self._local, "quiet", False)
+
+    def start_background_flush(self, interval: float = None):
+        """Запускает фоновый поток, сбрасывающий буфер в файл раз в interval секунд."""
+        if interval is not None: self.FLUSH_INTERVAL = interval
+        if self._flusher and self._flusher.is_alive(): return
+
+        self._flusher_stop.clear()
+
+        def loop():
+            while not self._flusher_stop.wait(self.FLUSH_INTERVAL):
+                self.flush()
 
+        self._flusher = threading.Thread(target=loop, name="BattleLoggerFlush", daemon=True)
+        self._flusher.start()
+
+    def _reset_after_fork(self):
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._flusher = None
+        self._flusher_stop = threading.Event()
+
+    def stop_background_flush(self):
+        self._flusher_stop.set()
+        self._flusher = None
+        self.flush()
+
+    # === ХРАНИЛИЩА ===
+
+    def _get_storage(self):
+        """Возвращает хранилище записей для UI (session_state или память)."""
+        # Streamlit не загружен (CLI, симуляции) -> не тянем его ради логов
+        if self._memory_storage is None and "streamlit" not in sys.modules:
+            self._memory_storage = deque(maxlen=self.MEMORY_LIMIT)
+        if self._memory_storage is not None:
+            return self._memory_storage
+
+        import streamlit as st
+        if 'battle_log_storage' not in st.session_state:
+            st.session_state['battle_log_storage'] = []
+        return st.session_state['battle_log_storage']
+
+    def flush(self):
+        """Записывает накопленные строки в файл одним вызовом."""
+        with self._lock:
+            if not self._pending:
+                return
+            lines = self._pending
+            self._pending = deque()
+            self._last_flush = time.monotonic()
+
+        # Формат: [TIME] [LEVEL] [CATEGORY] Message
+        text = "".join(
+            f"[{_format_time(ts)}] [{level.name:<7}] [{category}] {message}\n"
+            for ts, level, category, message in lines
+        )
         try:
             with open(LOG_FILE_PATH, "a", encoding="utf-8") as f:
-                f.write(log_entry_str)
+                f.write(text)
         except Exception as e:
             print(f"Logger File Error: {e}")
 
+    # === ЗАПИСЬ ===
+
+    def log(self, message: str, level: LogLevel = LogLevel.NORMAL, category: str = "Info", *args):
+        """
+        Основной метод записи лога.
+
+        Args:
+            message (str): Текст сообщения (или шаблон для args в стиле %).
+            level (LogLevel): Важность (MINIMAL, NORMAL, VERBOSE).
+            category (str): Категория (Combat, Effect, System, Dice...).
+            args: Ленивые аргументы: message % args считается, только если запись не отброшена.
+        """
+        if self.null_sink or level > self.min_level or getattr(self._local, "quiet", False):
+            return
+
+        if args:
+            message = message % args
+
+        ts = time.time()
+
+        # 1. Запись в файл (буферизованно)
+        if self.file_output:
+            with self._lock:
+                self._pending.append((ts, level, category, message))
+                need_flush = (len(self._pending) >= self.BUFFER_SIZE or
+                              time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL)
+            # Периодический сброс не должен зависеть от следующих сообщений (после stop_background_flush - не запускаем)
+            if self._flusher is None and not self._flusher_stop.is_set():
+                self.start_background_flush()
+            if need_flush:
+                self.flush()
+
         # 2. Запись в память (Session State) для UI
-        if 'battle_log_storage' not in st.session_state:
-            st.session_state['battle_log_storage'] = []
+        storage = self._get_storage()
+        if storage is self._memory_storage:
+            self._memory_counter += 1
+            entry_id = self._memory_counter
+        else:
+            entry_id = len(storage)
 
         # Сохраняем объект лога
-        ui_entry = {
-            "id": len(st.session_state['battle_log_storage']),
-            "time": timestamp,
+        storage.append({
+            "id": entry_id,
+            "time": _format_time(ts),
             "level": level,
             "category": category,
             "message": message
-        }
-
-        st.session_state['battle_log_storage'].append(ui_entry)
+        })
 
     def clear(self):
         """
         Очищает логи в памяти и перезаписывает файл (например, при кнопке Reset Battle).
         """
-        st.session_state['battle_log_storage'] = []
+        if self.null_sink:
+            return
+
+        self._get_storage().clear()
+
+        if not self.file_output:
+            return
+
+        with self._lock:
+            self._pending.clear()
 
         try:
             with open(LOG_FILE_PATH, "w", encoding="utf-8") as f:
@@ -95,11 +255,11 @@ class BattleLogger:
         Возвращает список логов для отображения, фильтруя по уровню.
         Пример: Если выбран NORMAL (2), покажет MINIMAL (1) и NORMAL (2).
         """
-        if 'battle_log_storage' not in st.session_state:
+        if self.null_sink:
             return []
 
         return [
-            entry for entry in st.session_state['battle_log_storage']
+            entry for entry in self._get_storage()
             if entry['level'] <= filter_level
         ]
 
@@ -108,10 +268,10 @@ class BattleLogger:
         Возвращает простой список сообщений (строк) из текущей сессии.
         Используется в профиле для отображения лога расчета.
         """
-        if 'battle_log_storage' not in st.session_state:
+        if self.null_sink:
             return []
-        return [entry['message'] for entry in st.session_state['battle_log_storage']]
+        return [entry['message'] for entry in self._get_storage()]
 
 
 # Глобальный экземпляр логгера для импорта в других файлах
-logger = BattleLogger()
\ No newline at end of file
+logger = BattleLogger()
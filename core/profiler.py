@@ -0,0 +1,238 @@
+import csv
+import functools
+import io
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Куда сохраняются трассировки (рядом с полным логом боя)
+TRACE_DIR = "data/logs"
+
+
+class TraceRecorder:
+    """
+    Запись вложенных интервалов (turn -> action -> clash -> roll -> hook -> script)
+    в формате Chrome Trace Event ("X"-события, время в мкс). Файл открывается
+    в chrome://tracing или https://ui.perfetto.dev.
+    """
+    # Предел событий в памяти (лишние отбрасываются и считаются в dropped)
+    MAX_EVENTS = 1_000_000
+
+    def __init__(self):
+        self.recording = False
+        self.events = []
+        self.dropped = 0
+        self._origin = 0
+        self._pid = os.getpid()
+
+    def start(self):
+        self.events = []
+        self.dropped = 0
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self.recording = True
+
+    def stop(self):
+        self.recording = False
+
+    def add(self, name: str, cat: str, start_ns: int, dur_ns: int, args: dict = None):
+        if len(self.events) >= self.MAX_EVENTS:
+            self.dropped += 1
+            return
+        event = {
+            "name": name, "cat": cat, "ph": "X",
+            "ts": (start_ns - self._origin) / 1e3, "dur": dur_ns / 1e3,
+            "pid": self._pid, "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, cat: str = "engine", args: dict = None):
+        if not self.recording:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, cat, start, time.perf_counter_ns() - start, args)
+
+    def to_dict(self) -> dict:
+        # Родительские интервалы раньше дочерних при равном ts - так их вкладывают просмотрщики
+        events = sorted(self.events, key=lambda e: (e["ts"], -e["dur"]))
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": self.dropped},
+        }
+
+    def save(self, path: str = None) -> str:
+        """Пишет трассировку в JSON (по умолчанию data/logs/trace_<время>.json) и возвращает путь."""
+        if path is None:
+            os.makedirs(TRACE_DIR, exist_ok=True)
+            path = os.path.join(TRACE_DIR, f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return path
+
+
+class MechanicProfiler:
+    """
+    Профилировщик механик (по умолчанию выключен).
+    Считает вызовы и время по ключу (вид, id механики/скрипта, хук):
+    - total: полное время вызова (вместе с вложенными хуками и скриптами);
+    - self: время без вложенных измеряемых вызовов.
+    Включается флагом enabled; трассировка интервалов - через start_trace().
+    Горячие пути проверяют только флаг active (включен профилировщик или трассировка).
+    Это глобальный отладочный переключатель процесса (один на сервер Streamlit): замеры
+    собираются со всех потоков и сессий, пока он включен.
+    """
+    _instance = None
+
+    MECHANIC = "mechanic"
+    SCRIPT = "script"
+
+    CSV_FIELDS = ("kind", "source", "hook", "calls", "total_ms", "self_ms", "avg_us", "max_us")
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(MechanicProfiler, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.enabled = False
+            self.active = False
+            self.tracer = TraceRecorder()
+            # (kind, source, hook) -> [calls, total_ns, self_ns, max_ns]
+            self._stats = {}
+            self._lock = threading.Lock()
+            self._local = threading.local()
+            self.initialized = True
+
+    def enable(self, enabled: bool = True):
+        self.enabled = enabled
+        self._update_active()
+
+    def start_trace(self):
+        self.tracer.start()
+        self._update_active()
+
+    def stop_trace(self):
+        self.tracer.stop()
+        self._update_active()
+
+    def _update_active(self):
+        self.active = self.enabled or self.tracer.recording
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    # === ЗАМЕРЫ ===
+
+    def _children(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def call(self, kind: str, source: str, hook: str, func, *args, **kwargs):
+        """Вызывает func(*args, **kwargs) и записывает время под ключом (kind, source, hook)."""
+        if not self.enabled:
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.tracer.add(f"{source}.{hook}", kind, start, time.perf_counter_ns() - start)
+
+        stack = self._children()
+        stack.append(0)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self._record((kind, source, hook), elapsed, elapsed - nested)
+            if self.tracer.recording:
+                self.tracer.add(f"{source}.{hook}", kind, start, elapsed)
+
+    def _record(self, key, elapsed: int, own: int):
+        with self._lock:
+            row = self._stats.get(key)
+            if row is None:
+                self._stats[key] = [1, elapsed, own, elapsed]
+            else:
+                row[0] += 1
+                row[1] += elapsed
+                row[2] += own
+                if elapsed > row[3]:
+                    row[3] = elapsed
+
+    # === ОТЧЕТ ===
+
+    def rows(self, sort_by: str = "total_ms") -> list:
+        """Строки отчета (словари с полями CSV_FIELDS), по убыванию sort_by."""
+        with self._lock:
+            items = [(key, list(row)) for key, row in self._stats.items()]
+        rows = []
+        for (kind, source, hook), (calls, total, own, peak) in items:
+            rows.append({
+                "kind": kind, "source": source, "hook": hook, "calls": calls,
+                "total_ms": round(total / 1e6, 3),
+                "self_ms": round(own / 1e6, 3),
+                "avg_us": round(total / calls / 1e3, 2),
+                "max_us": round(peak / 1e3, 2),
+            })
+        rows.sort(key=lambda r: r[sort_by], reverse=True)
+        return rows
+
+    def to_csv(self, sort_by: str = "total_ms") -> str:
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=self.CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(self.rows(sort_by))
+        return buf.getvalue()
+
+
+def mechanic_id(handler) -> str:
+    """Id механики, которой принадлежит связанный метод-обработчик."""
+    owner = getattr(handler, "__self__", None)
+    return getattr(owner, "id", None) or type(owner).__name__
+
+
+# Глобальный экземпляр
+profiler = MechanicProfiler()
+tracer = profiler.tracer
+
+
+def traced(name: str = None, cat: str = "engine", describe=None):
+    """
+    Декоратор: при включенной трассировке записывает вызов функции как интервал.
+    describe(*args, **kwargs) -> dict добавляет аргументы события (кто, какой картой и т.д.).
+    """
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.recording:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                extra = describe(*args, **kwargs) if describe else None
+                tracer.add(label, cat, start, time.perf_counter_ns() - start, extra)
+
+        return wrapper
+
+    return decorator
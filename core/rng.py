@@ -0,0 +1,71 @@
+import copy
+import random
+
+
+class BlockRNG(random.Random):
+    """
+    Быстрый генератор для массовых симуляций.
+    Заранее вытягивает блоки равномерных чисел из NumPy и раздает их по одному,
+    вместо вызова генератора на каждый кубик.
+    """
+
+    def __init__(self, seed=None, block_size: int = 4096):
+        import numpy  # noqa: F401 (ImportError -> make_rng откатится на random.Random)
+
+        self._block_size = block_size
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        import numpy as np
+
+        super().seed(a, version)
+        # Любой сид (строка, None) сводим к int через состояние Mersenne Twister
+        np_seed = a if isinstance(a, int) and a >= 0 else super().getrandbits(64)
+        self._np_gen = np.random.default_rng(np_seed)
+        self._block = []
+        self._pos = 0
+
+    def _refill(self):
+        self._block = self._np_gen.random(self._block_size).tolist()
+        self._pos = 0
+
+    def random(self) -> float:
+        if self._pos >= len(self._block):
+            self._refill()
+        value = self._block[self._pos]
+        self._pos += 1
+        return value
+
+    def randint(self, a: int, b: int) -> int:
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[int(self.random() * len(seq))]
+
+
+def clone_rng(rng: random.Random) -> random.Random:
+    """Независимая копия RNG в том же состоянии: оригинал и копия дальше выдают одинаковые числа."""
+    twin = type(rng).__new__(type(rng))
+    random.Random.setstate(twin, rng.getstate())
+    if isinstance(rng, BlockRNG):
+        twin._block_size = rng._block_size
+        twin._np_gen = copy.deepcopy(rng._np_gen)
+        # Блок только заменяется целиком при _refill, поэтому его можно разделить
+        twin._block = rng._block
+        twin._pos = rng._pos
+    return twin
+
+
+def make_rng(seed=None, fast: bool = False) -> random.Random:
+    """
+    Создает RNG боя.
+    fast=True -> BlockRNG на NumPy (если NumPy недоступен, обычный random.Random).
+    """
+    if fast:
+        try:
+            return BlockRNG(seed)
+        except ImportError:
+            pass
+    return random.Random(seed)
@@ -1,8 +1,16 @@
+import itertools
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 from core.enums import UnitType
 
+_unit_ids = itertools.count(1)
+
+
+def next_unit_id() -> int:
+    """Новый идентификатор юнита (уникален в пределах процесса, не сохраняется в файлы)."""
+    return next(_unit_ids)
+
 
 @dataclass
 class UnitBaseMixin:
@@ -18,6 +26,9 @@ class UnitBaseMixin:
     biography: str = ""
     total_xp: int = 0
 
+    # Идентификатор экземпляра для боевых индексов (имена могут повторяться)
+    uid: int = field(default_factory=next_unit_id, compare=False, repr=False)
+
     # === ФИНАНСЫ (DYNAMIC) ===
     money_log: List[Dict[str, Any]] = field(default_factory=list)
 
@@ -38,4 +49,9 @@ class UnitBaseMixin:
     base_hp: int = 20
     base_sp: int = 20
     base_speed_min: int = 1
-    base_speed_max: int = 4
\ No newline at end of file
+    base_speed_max: int = 4
+
+    def renew_uid(self) -> int:
+        """Выдает новый uid (для копий через deepcopy, которые становятся отдельными бойцами)."""
+        self.uid = next_unit_id()
+        return self.uid
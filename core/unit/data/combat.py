@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple, Any
 
+from core.unit.data.status_store import StatusStore
+
 # Импорт Card с защитой от циклических ссылок
 try:
     from core.card import Card
@@ -30,12 +32,14 @@ class UnitCombatMixin:
     computed_speed_dice: List[Tuple[int, int]] = field(default_factory=list)
     active_slots: List[Dict] = field(default_factory=list)
     current_card: Optional[Card] = None
+    # Слот, из которого сыграна current_card (одна карта может лежать в нескольких слотах)
+    current_slot: Optional[Dict] = None
     stored_dice: List = field(default_factory=list)
     counter_dice: List = field(default_factory=list)
 
     # === СОСТОЯНИЯ ===
     active_buffs: Dict[str, int] = field(default_factory=dict)
-    _status_effects: Dict[str, List[Dict]] = field(default_factory=dict)
+    _status_effects: StatusStore = field(default_factory=StatusStore)
     delayed_queue: List[dict] = field(default_factory=list)
 
     # Временные модификаторы боя
@@ -1,9 +1,12 @@
-import copy
-import json
-
 # Для type hinting
 from core.dice import Dice
 from core.resistances import Resistances
+from core.unit.data.status_store import StatusStore
+from logic.state.codec import clone
+
+# Производные данные интерфейса в слотах: пересчитываются при планировании и не сохраняются
+# (шансы кубиков - объекты DieOdds, в сохранении превратились бы в строки и раздували бы undo)
+UI_ONLY_SLOT_KEYS = ("ui_odds",)
 
 
 class UnitSerializationMixin:
@@ -12,32 +15,25 @@ class UnitSerializationMixin:
     """
 
     def get_dynamic_state(self) -> dict:
-        """Возвращает ТОЛЬКО меняющиеся данные (Delta)."""
-
-        def safe_copy(d):
-            try:
-                return json.loads(json.dumps(d, default=str))
-            except Exception:
-                return {}
-
+        """Возвращает ТОЛЬКО меняющиеся данные (Delta). Контейнеры копируются через codec.clone."""
         return {
             "current_hp": self.current_hp,
             "current_sp": self.current_sp,
             "current_stagger": self.current_stagger,
-            "resources": safe_copy(self.resources),
-            "cooldowns": safe_copy(self.cooldowns),
-            "card_cooldowns": safe_copy(self.card_cooldowns),
-            "active_buffs": safe_copy(self.active_buffs),
-            "_status_effects": safe_copy(self._status_effects),
-            "delayed_queue": safe_copy(self.delayed_queue),
+            "resources": clone(self.resources),
+            "cooldowns": clone(self.cooldowns),
+            "card_cooldowns": clone(self.card_cooldowns),
+            "active_buffs": clone(self.active_buffs),
+            "_status_effects": clone(self._status_effects),
+            "delayed_queue": clone(self.delayed_queue),
             "deck": list(self.deck),
             "active_slots": [self._serialize_slot(s) for s in self.active_slots],
             "stored_dice": [d.to_dict() for d in self.stored_dice],
             "counter_dice": [d.to_dict() for d in self.counter_dice],
-            "memory": safe_copy(self.memory),
+            "memory": clone(self.memory),
             "death_count": self.death_count,
             "overkill_damage": self.overkill_damage,
-            "money_log": safe_copy(self.money_log)
+            "money_log": clone(self.money_log)
         }
 
     def apply_dynamic_state(self, state: dict):
@@ -48,12 +44,12 @@ class UnitSerializationMixin:
         self.death_count = state.get("death_count", 0)
         self.overkill_damage = state.get("overkill_damage", 0)
 
-        self.resources = copy.deepcopy(state.get("resources", {}))
-        self.active_buffs = copy.deepcopy(state.get("active_buffs", {}))
-        self._status_effects = copy.deepcopy(state.get("_status_effects", {}))
-        self.delayed_queue = copy.deepcopy(state.get("delayed_queue", []))
-        self.memory = copy.deepcopy(state.get("memory", {}))
-        self.money_log = copy.deepcopy(state.get("money_log", []))
+        self.resources = clone(state.get("resources", {}))
+        self.active_buffs = clone(state.get("active_buffs", {}))
+        self._status_effects = StatusStore(clone(state.get("_status_effects", {})))
+        self.delayed_queue = clone(state.get("delayed_queue", []))
+        self.memory = clone(state.get("memory", {}))
+        self.money_log = clone(state.get("money_log", []))
         self.deck = list(state.get("deck", []))
 
         # Sanitize cooldowns
@@ -72,14 +68,6 @@ class UnitSerializationMixin:
 
     def to_dict(self):
         """Полная сериализация."""
-
-        def safe_dict_copy(d):
-            if not d: return {}
-            try:
-                return json.loads(json.dumps(d, default=str))
-            except TypeError:
-                return {}
-
         return {
             "name": self.name, "level": self.level, "rank": self.rank, "avatar": self.avatar,
             "base_intellect": self.base_intellect, "total_xp": self.total_xp,
@@ -106,7 +94,7 @@ class UnitSerializationMixin:
             "passives": list(self.passives),
             "talents": list(self.talents),
             "augmentations": list(self.augmentations),
-            "level_rolls": safe_dict_copy(self.level_rolls),
+            "level_rolls": clone(self.level_rolls) if self.level_rolls else {},
             "biography": self.biography,
             "relationships": self.relationships.copy(),
             "unit_type": self.unit_type,
@@ -169,12 +157,14 @@ class UnitSerializationMixin:
     def _serialize_slot(self, slot):
         try:
             s_copy = slot.copy()
+            for key in UI_ONLY_SLOT_KEYS:
+                s_copy.pop(key, None)
             card_obj = s_copy.get('card')
             if card_obj and hasattr(card_obj, 'id'):
                 s_copy['card'] = card_obj.id
             elif card_obj:
                 s_copy['card'] = None
-            return json.loads(json.dumps(s_copy, default=str))
+            return clone(s_copy)
         except Exception:
             return {}
 
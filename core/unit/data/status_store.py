@@ -0,0 +1,117 @@
+import copy
+from bisect import insort
+from types import MappingProxyType
+from typing import Dict, List
+
+from logic.state.codec import register_encoder
+
+
+def _duration(item: dict) -> int:
+    return item["duration"]
+
+
+class StatusStore(dict):
+    """
+    Хранилище статусов юнита: имя -> список экземпляров {"amount", "duration"}.
+    - Списки экземпляров отсортированы по возрастанию duration (при равной - в порядке наложения).
+    - totals: сумма стаков по каждому статусу (только > 0), обновляется при любом изменении.
+    - version: растет при появлении/исчезновении статуса (для кэшей хуков).
+    Остается обычным dict для сериализации и старого кода, читающего экземпляры напрямую.
+    """
+
+    def __init__(self, data: Dict[str, List[dict]] = None):
+        super().__init__()
+        self.totals: Dict[str, int] = {}
+        self.totals_view = MappingProxyType(self.totals)
+        self.version = 0
+        if data:
+            for name, instances in data.items():
+                self[name] = instances
+
+    # === ПОДДЕРЖКА СУММ ===
+
+    def recount(self, name: str):
+        """Пересчитывает сумму стаков статуса (после изменения amount у экземпляров на месте)."""
+        total = sum(i["amount"] for i in dict.get(self, name, ()))
+        if total > 0:
+            self.totals[name] = total
+        else:
+            self.totals.pop(name, None)
+
+    def set_sorted(self, name: str, instances: List[dict]):
+        """Записывает уже отсортированный по duration список (без повторной сортировки)."""
+        if name not in self:
+            self.version += 1
+        dict.__setitem__(self, name, instances)
+        self.recount(name)
+
+    def add_instance(self, name: str, amount: int, duration: int):
+        """Добавляет отдельный экземпляр, сохраняя порядок по duration."""
+        instances = dict.get(self, name)
+        if instances is None:
+            self.set_sorted(name, [{"amount": amount, "duration": duration}])
+            return
+        insort(instances, {"amount": amount, "duration": duration}, key=_duration)
+        self.totals[name] = self.totals.get(name, 0) + amount
+
+    # === ИНТЕРФЕЙС DICT ===
+
+    def __setitem__(self, name, instances):
+        self.set_sorted(name, sorted(instances, key=_duration))
+
+    def __delitem__(self, name):
+        dict.__delitem__(self, name)
+        self.totals.pop(name, None)
+        self.version += 1
+
+    def pop(self, name, *default):
+        if name in self:
+            self.version += 1
+        self.totals.pop(name, None)
+        return dict.pop(self, name, *default)
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default if default is not None else []
+        return dict.__getitem__(self, name)
+
+    def update(self, *args, **kwargs):
+        for name, instances in dict(*args, **kwargs).items():
+            self[name] = instances
+
+    def popitem(self):
+        name, instances = dict.popitem(self)
+        self.totals.pop(name, None)
+        self.version += 1
+        return name, instances
+
+    def clear(self):
+        dict.clear(self)
+        self.totals.clear()
+        self.version += 1
+
+    def __copy__(self):
+        return StatusStore(self)
+
+    def fork(self) -> "StatusStore":
+        """Независимая копия: экземпляры копируются, порядок, суммы и версия переносятся без пересортировки."""
+        twin = StatusStore()
+        for name, instances in dict.items(self):
+            dict.__setitem__(twin, name, [dict(i) for i in instances])
+        twin.totals.update(self.totals)
+        twin.version = self.version
+        return twin
+
+    def __deepcopy__(self, memo):
+        return StatusStore(copy.deepcopy(dict(self), memo))
+
+    def __reduce__(self):
+        return StatusStore, (dict(self),)
+
+
+def _encode_store(store: StatusStore) -> dict:
+    # Экземпляры - плоские {"amount", "duration"}: хватает поверхностной копии
+    return {name: [dict(i) for i in instances] for name, instances in dict.items(store)}
+
+
+register_encoder(StatusStore, _encode_store)
@@ -1,13 +1,168 @@
 from core.logging import logger, LogLevel
+from core.profiler import profiler, mechanic_id, MechanicProfiler
 from logic.statuses.status_definitions import STATUS_REGISTRY
 
+_REGISTRIES = None
+_MISSING = object()
+# (механика, имя хука) -> связанный метод или None
+_HANDLER_CACHE = {}
+
+
+def _loadout_registries():
+    """PASSIVE/TALENT/AUGMENTATION/WEAPON реестры (импорт один раз, лениво из-за циклов)."""
+    global _REGISTRIES
+    if _REGISTRIES is None:
+        from logic.character_changing.passives import PASSIVE_REGISTRY
+        from logic.character_changing.talents import TALENT_REGISTRY
+        from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
+        from logic.weapon_definitions import WEAPON_REGISTRY
+        _REGISTRIES = (PASSIVE_REGISTRY, TALENT_REGISTRY, AUGMENTATION_REGISTRY, WEAPON_REGISTRY)
+    return _REGISTRIES
+
+
+def _resolve_handler(mech, method_name):
+    """
+    Возвращает связанный метод механики или None.
+    Заглушки BaseEffect пропускаются: они ничего не делают (триггеры) или
+    возвращают значение без изменений (фильтры).
+    Механики реестров - синглтоны, поэтому результат кэшируется глобально.
+    """
+    key = (mech, method_name)
+    if key in _HANDLER_CACHE:
+        return _HANDLER_CACHE[key]
+
+    from logic.base_effect import BaseEffect
+
+    method = getattr(mech, method_name, None)
+    if not callable(method) or getattr(type(mech), method_name, None) is getattr(BaseEffect, method_name, _MISSING):
+        method = None
+    _HANDLER_CACHE[key] = method
+    return method
+
+
+class HookTable:
+    """
+    Кэш диспетчеризации хуков юнита: hook -> упорядоченный список обработчиков.
+    Экипировка (пассивки, таланты, аугментации, оружие) и набор статусов
+    кэшируются раздельно: статусы меняются гораздо чаще.
+    При копировании юнита кэш не копируется, а строится заново.
+    """
+    __slots__ = ("loadout_key", "loadout", "loadout_hooks", "status_key", "status_ids", "status_hooks")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.loadout_key = None
+        self.loadout = ()
+        self.loadout_hooks = {}
+        self.status_key = None
+        self.status_ids = ()
+        self.status_hooks = {}
+
+    def __copy__(self):
+        return HookTable()
+
+    def __deepcopy__(self, memo):
+        return HookTable()
+
+    def __reduce__(self):
+        return HookTable, ()
+
 
 class MechanicsIteratorMixin:  # <--- Имя класса должно совпадать с импортом в unit.py
     """
     Миксин, предоставляющий единый интерфейс для доступа ко всем
     источникам механик (Пассивки, Таланты, Аугментации, Статусы, Оружие).
+    Обработчики хуков кэшируются в HookTable юнита.
     """
 
+    # === КЭШ ХУКОВ ===
+
+    def invalidate_mechanics(self):
+        """Сбрасывает кэш хуков (например, после правки реестров механик; списки юнита отслеживаются сами)."""
+        table = getattr(self, "_hook_table_cache", None)
+        if table is not None:
+            table.reset()
+
+    def _get_hook_table(self) -> HookTable:
+        table = getattr(self, "_hook_table_cache", None)
+        if table is None:
+            table = self._hook_table_cache = HookTable()
+
+        # 1. Экипировка: ключ - копии списков (ловит и правки на месте той же длины).
+        # Сравнение списков строк без выделения памяти: элементы сверяются по ссылке
+        passives, talents, augmentations = self.passives, self.talents, self.augmentations
+        weapon_id = self.weapon_id
+        key = table.loadout_key
+        if key is None or key[3] != weapon_id or key[0] != passives or key[1] != talents \
+                or key[2] != augmentations:
+            table.loadout_key = (list(passives), list(talents), list(augmentations), weapon_id)
+            table.loadout = self._build_loadout(passives, talents, augmentations, weapon_id)
+            table.loadout_hooks = {}
+
+        # 2. Набор статусов (версия хранилища растет при появлении/исчезновении статуса)
+        store = self._ensure_status_storage()
+        status_key = (id(store), store.version)
+        if table.status_key != status_key:
+            table.status_key = status_key
+            table.status_ids = tuple(sid for sid in store if sid in STATUS_REGISTRY)
+            table.status_hooks = {}
+
+        return table
+
+    @staticmethod
+    def _build_loadout(passives, talents, augmentations, weapon_id) -> tuple:
+        """Порядок: Пассивки -> Таланты -> Аугментации -> Оружие."""
+        passive_reg, talent_reg, aug_reg, weapon_reg = _loadout_registries()
+        loadout = [passive_reg[pid] for pid in passives if pid in passive_reg]
+        loadout += [talent_reg[tid] for tid in talents if tid in talent_reg]
+        loadout += [aug_reg[aid] for aid in augmentations if aid in aug_reg]
+
+        if weapon_id in weapon_reg:
+            wep = weapon_reg[weapon_id]
+            if wep.passive_id and wep.passive_id in passive_reg:
+                loadout.append(passive_reg[wep.passive_id])
+        return tuple(loadout)
+
+    def _hook_handlers(self, method_name):
+        """(обработчики статусов [(status_id, method)], обработчики экипировки [method])."""
+        table = self._get_hook_table()
+
+        other = table.loadout_hooks.get(method_name)
+        if other is None:
+            other = tuple(h for h in (_resolve_handler(m, method_name) for m in table.loadout) if h)
+            table.loadout_hooks[method_name] = other
+
+        statuses = table.status_hooks.get(method_name)
+        if statuses is None:
+            statuses = tuple((sid, h) for sid, h in
+                             ((sid, _resolve_handler(STATUS_REGISTRY[sid], method_name)) for sid in table.status_ids)
+                             if h)
+            table.status_hooks[method_name] = statuses
+
+        return statuses, other
+
+    def _active_status_handlers(self, status_handlers):
+        """Снимок [(method, stack)] для статусов с ненулевым стаком."""
+        totals = self._ensure_status_storage().totals
+        active = []
+        for status_id, handler in status_handlers:
+            stack = totals.get(status_id, 0)
+            if stack > 0:
+                active.append((handler, stack))
+        return active
+
+    def iter_hook_handlers(self, method_name):
+        """Связанные методы method_name всех активных механик (Статусы -> Экипировка)."""
+        status_handlers, other = self._hook_handlers(method_name)
+        if status_handlers:
+            for handler, _ in self._active_status_handlers(status_handlers):
+                yield handler
+        yield from other
+
+    # === ОБХОД МЕХАНИК ===
+
     @property
     def mechanics(self):
         """Возвращает список всех активных механик юнита."""
@@ -18,85 +173,44 @@ class MechanicsIteratorMixin:  # <--- Имя класса должно совп
         Генератор, возвращающий все активные объекты эффектов на юните.
         Порядок: Статусы -> Пассивки -> Таланты -> Аугментации -> Оружие.
         """
-        # Локальные импорты для предотвращения циклической зависимости
-        from logic.character_changing.passives import PASSIVE_REGISTRY
-        from logic.character_changing.talents import TALENT_REGISTRY
-        from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
-        from logic.weapon_definitions import WEAPON_REGISTRY
+        table = self._get_hook_table()
 
         # 1. Статусы (У них приоритет, т.к. они часто меняют логику статов)
-        if hasattr(self, "statuses"):
-            for status_id, stack in self.statuses.items():
-                if status_id in STATUS_REGISTRY:
-                    yield STATUS_REGISTRY[status_id]
-
-        # 2. Пассивки
-        if hasattr(self, "passives"):
-            for pid in self.passives:
-                if pid in PASSIVE_REGISTRY: yield PASSIVE_REGISTRY[pid]
-
-        # 3. Таланты
-        if hasattr(self, "talents"):
-            for tid in self.talents:
-                if tid in TALENT_REGISTRY: yield TALENT_REGISTRY[tid]
-
-        # 4. Аугментации
-        if hasattr(self, "augmentations"):
-            for aid in self.augmentations:
-                if aid in AUGMENTATION_REGISTRY: yield AUGMENTATION_REGISTRY[aid]
-
-        # 5. Пассивка оружия
-        if hasattr(self, "weapon_id") and self.weapon_id in WEAPON_REGISTRY:
-            wep = WEAPON_REGISTRY[self.weapon_id]
-            if wep.passive_id and wep.passive_id in PASSIVE_REGISTRY:
-                yield PASSIVE_REGISTRY[wep.passive_id]
+        if table.status_ids:
+            totals = self._ensure_status_storage().totals
+            active = [sid for sid in table.status_ids if totals.get(sid, 0) > 0]
+            for status_id in active:
+                yield STATUS_REGISTRY[status_id]
+
+        # 2-5. Пассивки, таланты, аугментации, пассивка оружия
+        yield from table.loadout
 
     def trigger_mechanics(self, method_name, *args, **kwargs):
         """
         Запускает метод method_name у всех механик, если он существует.
         Пример: unit.trigger_mechanics("on_combat_start", unit, log_func)
         """
-        from logic.character_changing.passives import PASSIVE_REGISTRY
-        from logic.character_changing.talents import TALENT_REGISTRY
-        from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
-        from logic.weapon_definitions import WEAPON_REGISTRY
+        status_handlers, other = self._hook_handlers(method_name)
+        if profiler.active:
+            return self._trigger_mechanics_profiled(method_name, status_handlers, other, args, kwargs)
 
         # === 1. СТАТУСЫ (Передаем stack) ===
-        if hasattr(self, "statuses"):
-            for status_id, stack in self.statuses.items():
-                if status_id in STATUS_REGISTRY:
-                    mech = STATUS_REGISTRY[status_id]
-                    if hasattr(mech, method_name):
-                        getattr(mech, method_name)(*args, stack=stack, **kwargs)
+        if status_handlers:
+            for handler, stack in self._active_status_handlers(status_handlers):
+                handler(*args, stack=stack, **kwargs)
 
         # === 2. ОСТАЛЬНЫЕ МЕХАНИКИ (Без stack) ===
-        other_mechanics = []
-
-        # Пассивки
-        if hasattr(self, "passives"):
-            for pid in self.passives:
-                if pid in PASSIVE_REGISTRY: other_mechanics.append(PASSIVE_REGISTRY[pid])
-
-        # Таланты
-        if hasattr(self, "talents"):
-            for tid in self.talents:
-                if tid in TALENT_REGISTRY: other_mechanics.append(TALENT_REGISTRY[tid])
-
-        # Аугментации
-        if hasattr(self, "augmentations"):
-            for aid in self.augmentations:
-                if aid in AUGMENTATION_REGISTRY: other_mechanics.append(AUGMENTATION_REGISTRY[aid])
-
-        # Оружие
-        if hasattr(self, "weapon_id") and self.weapon_id in WEAPON_REGISTRY:
-            wep = WEAPON_REGISTRY[self.weapon_id]
-            if wep.passive_id and wep.passive_id in PASSIVE_REGISTRY:
-                other_mechanics.append(PASSIVE_REGISTRY[wep.passive_id])
-
-        # Запуск для остальных
-        for mech in other_mechanics:
-            if hasattr(mech, method_name):
-                getattr(mech, method_name)(*args, **kwargs)
+        for handler in other:
+            handler(*args, **kwargs)
+
+    def _trigger_mechanics_profiled(self, method_name, status_handlers, other, args, kwargs):
+        """trigger_mechanics с замером времени каждого обработчика (профилировщик включен)."""
+        if status_handlers:
+            for handler, stack in self._active_status_handlers(status_handlers):
+                profiler.call(MechanicProfiler.MECHANIC, mechanic_id(handler), method_name,
+                              handler, *args, stack=stack, **kwargs)
+        for handler in other:
+            profiler.call(MechanicProfiler.MECHANIC, mechanic_id(handler), method_name, handler, *args, **kwargs)
 
     def apply_mechanics_filter(self, method_name, initial_value, *args, **kwargs):
         """
@@ -105,22 +219,22 @@ class MechanicsIteratorMixin:  # <--- Имя класса должно совп
         """
         value = initial_value
 
-        # Используем переименованный метод _iter_all_mechanics
-        for mech in self._iter_all_mechanics():
-            if hasattr(mech, method_name):
-                old_val = value
-
-                # Примечание: тут мы не передаем stack явно, так как генератор не возвращает stack.
-                # Но статусы в своих методах (например, modify_incoming_damage) обычно делают:
-                # if stack == 0: stack = unit.get_status(self.id)
-                # Так что это будет работать корректно.
+        for handler in self.iter_hook_handlers(method_name):
+            old_val = value
 
-                value = getattr(mech, method_name)(self, value, *args, **kwargs)
+            # Примечание: тут мы не передаем stack явно.
+            # Статусы в своих методах (например, modify_incoming_damage) обычно делают:
+            # if stack == 0: stack = unit.get_status(self.id)
+            if profiler.active:
+                value = profiler.call(MechanicProfiler.MECHANIC, mechanic_id(handler), method_name,
+                                      handler, self, value, *args, **kwargs)
+            else:
+                value = handler(self, value, *args, **kwargs)
 
-                # Логируем, если значение изменилось
-                if value != old_val:
-                    mech_id = getattr(mech, 'id', 'Unknown')
-                    logger.log(f"Filter change by {mech_id}: {old_val} -> {value}", LogLevel.VERBOSE, "Filter")
+            # Логируем, если значение изменилось
+            if value != old_val:
+                mech_id = getattr(handler.__self__, 'id', 'Unknown')
+                logger.log("Filter change by %s: %s -> %s", LogLevel.VERBOSE, "Filter", mech_id, old_val, value)
 
         return value
 
@@ -129,17 +243,18 @@ class MechanicsIteratorMixin:  # <--- Имя класса должно совп
         Вызывает метод hook_name у всех активных механик.
         Пример: unit.trigger_hooks('on_luck_check', result=15)
         """
-        for mechanic in self._iter_all_mechanics():
-            # Проверяем, есть ли у механики нужный метод (например, on_luck_check)
-            hook_method = getattr(mechanic, hook_name, None)
-
-            if callable(hook_method):
-                try:
-                    # Вызываем метод, передавая self (юнита) первым аргументом
+        for hook_method in self.iter_hook_handlers(hook_name):
+            try:
+                # Вызываем метод, передавая self (юнита) первым аргументом
+                if profiler.active:
+                    profiler.call(MechanicProfiler.MECHANIC, mechanic_id(hook_method), hook_name,
+                                  hook_method, self, **kwargs)
+                else:
                     hook_method(self, **kwargs)
-                except Exception as e:
-                    logger.log(f"Error in hook '{hook_name}' for {mechanic.id}: {e}", LogLevel.ERROR, "System")
+            except Exception as e:
+                mech_id = getattr(hook_method.__self__, 'id', 'Unknown')
+                logger.log(f"Error in hook '{hook_name}' for {mech_id}: {e}", LogLevel.ERROR, "System")
 
     def iter_mechanics(self):
         """Публичный интерфейс для расчетов, вызывающий основной генератор."""
-        return self._iter_all_mechanics()
\ No newline at end of file
+        return self._iter_all_mechanics()
@@ -1,6 +1,5 @@
-import random
-
 from core.logging import logger, LogLevel
+from logic.battle_flow.battle_scope import get_rng
 
 
 class SpeedRollMixin:
@@ -9,8 +8,9 @@ class SpeedRollMixin:
     Требует наличия MechanicsIteratorMixin и методов проверки состояния.
     """
 
-    def roll_speed_dice(self):
-        """Генерация активных слотов на раунд."""
+    def roll_speed_dice(self, rng=None):
+        """Генерация активных слотов на раунд. rng: генератор боя (по умолчанию RNG активного боя)."""
+        rng = rng if rng is not None else get_rng()
         self.active_slots = []
         self.counter_dice = []
 
@@ -41,7 +41,7 @@ class SpeedRollMixin:
         for i, (d_min, d_max) in enumerate(self.computed_speed_dice):
             if i >= slots_to_roll: break
 
-            val = max(1, random.randint(int(d_min), int(d_max)) + speed_modifier)
+            val = max(1, rng.randint(int(d_min), int(d_max)) + speed_modifier)
             self.active_slots.append({
                 'speed': val, 'card': None, 'target_slot': None, 'is_aggro': False
             })
@@ -63,7 +63,7 @@ class SpeedRollMixin:
                 d_min, d_max = self.base_speed_min, self.base_speed_max
 
             for _ in range(extra_dice_count):
-                val = max(1, random.randint(d_min, d_max) + speed_modifier)
+                val = max(1, rng.randint(d_min, d_max) + speed_modifier)
                 self.active_slots.append({
                     'speed': val, 'card': None, 'target_slot': None,
                     'is_aggro': False, 'source_effect': 'Bonus 🌟'
@@ -1,47 +1,45 @@
 from typing import Dict, TYPE_CHECKING
 
-import streamlit as st
 
 from core.logging import logger, LogLevel
+from core.unit.data.status_store import StatusStore
 
 if TYPE_CHECKING:
     pass
 
 
 class UnitStatusMixin:
-    def _ensure_status_storage(self):
-        if not hasattr(self, "_status_effects"): self._status_effects = {}
-        if not hasattr(self, "delayed_queue"): self.delayed_queue = []
+    def _ensure_status_storage(self) -> StatusStore:
+        store = self.__dict__.get("_status_effects")
+        if type(store) is not StatusStore:
+            # Обычный dict (старые сейвы, ручной сброс) -> переводим в StatusStore
+            store = self._status_effects = StatusStore(store)
+            if not hasattr(self, "delayed_queue"): self.delayed_queue = []
+        return store
 
     @property
     def statuses(self) -> Dict[str, int]:
-        self._ensure_status_storage()
-        summary = {}
-        for name, instances in self._status_effects.items():
-            total = sum(i["amount"] for i in instances)
-            if total > 0:
-                summary[name] = total
-        return summary
+        """Суммы стаков активных статусов (живое read-only представление, без копирования)."""
+        return self._ensure_status_storage().totals_view
 
     def add_status(self, name: str, amount: int, duration: int = 1, delay: int = 0, trigger_events: bool = True):
-        self._ensure_status_storage()
+        store = self._ensure_status_storage()
         if amount <= 0: return False, None
 
-        if hasattr(self, "iter_mechanics"):
-            for mech in self.iter_mechanics():
-                if hasattr(mech, "on_before_status_add"):
-                    res = mech.on_before_status_add(self, name, amount)
-
-                    # Обработка результата (bool или tuple)
-                    if isinstance(res, tuple):
-                        allowed, msg = res
-                    else:
-                        allowed, msg = res, None
-
-                    if not allowed:
-                        # Логируем блокировку (VERBOSE)
-                        logger.log(f"🚫 {self.name}: Status {name} blocked ({msg})", LogLevel.VERBOSE, "Status")
-                        return False, msg
+        if hasattr(self, "iter_hook_handlers"):
+            for handler in self.iter_hook_handlers("on_before_status_add"):
+                res = handler(self, name, amount)
+
+                # Обработка результата (bool или tuple)
+                if isinstance(res, tuple):
+                    allowed, msg = res
+                else:
+                    allowed, msg = res, None
+
+                if not allowed:
+                    # Логируем блокировку (VERBOSE)
+                    logger.log(f"🚫 {self.name}: Status {name} blocked ({msg})", LogLevel.VERBOSE, "Status")
+                    return False, msg
         # =========================================================================
 
         if delay > 0:
@@ -51,19 +49,18 @@ class UnitStatusMixin:
             logger.log(f"⏰ {self.name}: {name} delayed for {delay} turns", LogLevel.NORMAL, "Status")
             return True, "Delayed"
 
-        if name not in self._status_effects:
-            self._status_effects[name] = []
-
         POOL_STATUSES = ["smoke", "charge", "satiety", "tremor", "self_control", "poise", "adaptation"]
 
-        if name in POOL_STATUSES and self._status_effects[name]:
+        if name in POOL_STATUSES and store.get(name):
             # Если статус уже есть, просто увеличиваем количество в первом слоте
-            self._status_effects[name][0]["amount"] += amount
+            pool = store[name][0]
+            pool["amount"] += amount
             # Обновляем длительность (берем максимум)
-            self._status_effects[name][0]["duration"] = max(self._status_effects[name][0]["duration"], duration)
+            pool["duration"] = max(pool["duration"], duration)
+            store.recount(name)
         else:
-            # Обычное поведение: добавляем новый отдельный стак
-            self._status_effects[name].append({"amount": amount, "duration": duration})
+            # Обычное поведение: добавляем новый отдельный стак (с сохранением сортировки по duration)
+            store.add_instance(name, amount, duration)
 
         # Логируем наложение (NORMAL)
         logger.log(f"🧪 {self.name}: +{amount} {name} ({duration}t)", LogLevel.NORMAL, "Status")
@@ -77,10 +74,9 @@ class UnitStatusMixin:
             # B. [NEW] ГЛОБАЛЬНЫЙ ХУК (Для наблюдателей, например Аксис)
             # Мы оповещаем всех остальных юнитов в бою, что на 'self' наложился статус
             try:
-                # Получаем списки команд из сессии (безопасный доступ)
-                team_l = st.session_state.get('team_left', [])
-                team_r = st.session_state.get('team_right', [])
-                all_units = team_l + team_r
+                # Получаем списки команд текущего боя (UI-сессия или headless)
+                from logic.battle_flow.battle_scope import current_battle
+                all_units = current_battle().all_units()
 
                 for observer in all_units:
                     # Пропускаем себя (локальный хук уже сработал) и мертвых
@@ -99,29 +95,28 @@ class UnitStatusMixin:
                             duration=duration
                         )
             except Exception as e:
-                # Заглушка на случай ошибок доступа к session_state вне контекста
+                # Заглушка на случай ошибок доступа к данным боя вне контекста
                 pass
         # ==============================================
 
         return True, None
 
     def get_status(self, name: str) -> int:
-        self._ensure_status_storage()
-        if name not in self._status_effects: return 0
-        return sum(i["amount"] for i in self._status_effects[name])
+        return self._ensure_status_storage().totals.get(name, 0)
 
     def remove_status(self, name: str, amount: int = None):
-        self._ensure_status_storage()
-        if name not in self._status_effects: return
+        store = self._ensure_status_storage()
+        if name not in store: return
 
-        current_val = self.get_status(name)
+        current_val = store.totals.get(name, 0)
 
         if amount is None:
-            del self._status_effects[name]
+            del store[name]
             logger.log(f"🧹 {self.name}: Cleared all {name} ({current_val})", LogLevel.NORMAL, "Status")
             return
 
-        items = sorted(self._status_effects[name], key=lambda x: x["duration"])
+        # Экземпляры уже отсортированы по duration: снимаем с самых коротких
+        items = store[name]
         rem = amount
         new_items = []
 
@@ -137,11 +132,11 @@ class UnitStatusMixin:
                 rem -= item["amount"]
 
         if not new_items:
-            del self._status_effects[name]
+            del store[name]
         else:
-            self._status_effects[name] = new_items
+            store.set_sorted(name, new_items)
 
         # Логируем фактическое снятие
-        removed = current_val - self.get_status(name)
+        removed = current_val - store.totals.get(name, 0)
         if removed > 0:
             logger.log(f"🧹 {self.name}: Removed {removed} {name}", LogLevel.NORMAL, "Status")
\ No newline at end of file
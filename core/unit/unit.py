@@ -18,14 +18,23 @@ class Unit(UnitData, UnitStatusMixin, UnitCombatMixin, UnitLifecycleMixin, Mecha
     Объединяет данные (UnitData) и логику (Mixins).
     """
 
-    def recalculate_stats(self):
-        """Пересчитывает характеристики на основе атрибутов, навыков и пассивок."""
+    def recalculate_stats(self, force: bool = False):
+        """
+        Пересчитывает характеристики на основе атрибутов, навыков и пассивок.
+        Если ничего не изменилось, берет результат из кэша (force=True - пересчитать заново).
+        """
         # Импорт здесь, чтобы избежать циклических ссылок
         from core.calculations import recalculate_unit_stats
 
-        logger.log(f"Recalculating stats for {self.name}", LogLevel.VERBOSE, "Stats")
+        logger.log("Recalculating stats for %s", LogLevel.VERBOSE, "Stats", self.name)
 
-        return recalculate_unit_stats(self)
+        return recalculate_unit_stats(self, force=force)
+
+    def mark_stats_dirty(self):
+        """Сбрасывает кэш статов: следующий recalculate_stats сделает полный пересчет."""
+        cache = getattr(self, "_stat_cache", None)
+        if cache is not None:
+            cache.key = None
 
     def get_total_money(self) -> int:
         """Считает текущий баланс."""
@@ -39,16 +39,19 @@ class UnitLibrary:
 
         return cls._roster
 
+    @classmethod
+    def file_path(cls, unit_name: str) -> str:
+        """Путь к файлу персонажа (имя файла формируется из имени безопасно)."""
+        safe_name = "".join(c for c in unit_name if c.isalnum() or c in (' ', '_', '-')).strip().replace(" ", "_")
+        return os.path.join(cls.DATA_PATH, f"{safe_name}.json")
+
     @classmethod
     def save_unit(cls, unit: Unit):
         """Сохраняет одного персонажа в файл."""
         if not os.path.exists(cls.DATA_PATH):
             os.makedirs(cls.DATA_PATH, exist_ok=True)
 
-        # Формируем имя файла из имени персонажа (безопасно)
-        safe_name = "".join(c for c in unit.name if c.isalnum() or c in (' ', '_', '-')).strip().replace(" ", "_")
-        filename = f"{safe_name}.json"
-        path = os.path.join(cls.DATA_PATH, filename)
+        path = cls.file_path(unit.name)
 
         try:
             with open(path, 'w', encoding='utf-8') as f:
@@ -56,6 +59,7 @@ class UnitLibrary:
             logger.log(f"💾 Saved unit: {unit.name} -> {path}", LogLevel.NORMAL, "System")
             # Обновляем кэш
             cls._roster[unit.name] = unit
+            cls._invalidate_summon(unit.name)
             return True
         except Exception as e:
             logger.log(f"Error saving unit {unit.name}: {e}", LogLevel.NORMAL, "System")
@@ -67,11 +71,10 @@ class UnitLibrary:
         # 1. Удаляем из памяти
         if unit_name in cls._roster:
             del cls._roster[unit_name]
+        cls._invalidate_summon(unit_name)
 
         # 2. Удаляем файл
-        safe_name = "".join(c for c in unit_name if c.isalnum() or c in (' ', '_', '-')).strip().replace(" ", "_")
-        filename = f"{safe_name}.json"
-        path = os.path.join(cls.DATA_PATH, filename)
+        path = cls.file_path(unit_name)
 
         if os.path.exists(path):
             try:
@@ -83,6 +86,12 @@ class UnitLibrary:
                 return False
         return True
 
+    @staticmethod
+    def _invalidate_summon(unit_name: str):
+        """Сбрасывает боевой прототип призыва этого юнита."""
+        from logic.battle_flow.summon_templates import SummonTemplates  # Лениво: logic зависит от core
+        SummonTemplates.invalidate(unit_name)
+
     @classmethod
     def get_roster(cls):
         return cls._roster
\ No newline at end of file
@@ -1,8 +1,7 @@
 # engine.py
-import random
-
 from core.dice import Dice
 from core.events import EventManager
+from core.rng import make_rng
 from core.unit.unit import Unit
 from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
 from logic.character_changing.passives import PASSIVE_REGISTRY
@@ -11,9 +10,9 @@ from logic.modifiers import RollContext
 
 
 class CombatEngine:
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, rng=None, fast_rng: bool = False):
         self.events = EventManager()
-        self.rng = random.Random(seed)
+        self.rng = rng if rng is not None else make_rng(seed, fast=fast_rng)
 
     def initialize_unit(self, unit: Unit):
         """Подключает пассивки и таланты юнита к событиям"""
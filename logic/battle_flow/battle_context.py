@@ -0,0 +1,92 @@
+from logic.battle_flow.team_index import team_index, LEFT, RIGHT
+
+
+class BattleContext:
+    """
+    Явный контекст текущего боя для механик и скриптов:
+    - команды и O(1) поиск стороны/команды юнита (через TeamIndex по uid);
+    - живые юниты сторон, номер раунда, ростер для призыва, RNG.
+    Передается в RollContext.battle и в хуки раунда (kwargs battle=...).
+    source - объект боя (BattleSession, планировщик) или None для UI, где
+    номер раунда и ростер берутся из st.session_state.
+    """
+    __slots__ = ("team_left", "team_right", "source")
+
+    def __init__(self, team_left: list, team_right: list, source=None):
+        self.team_left = team_left
+        self.team_right = team_right
+        self.source = source
+
+    def matches(self, team_left: list, team_right: list, source) -> bool:
+        return self.team_left is team_left and self.team_right is team_right and self.source is source
+
+    @property
+    def index(self):
+        return team_index(self.team_left, self.team_right)
+
+    # === ДАННЫЕ БОЯ ===
+
+    @property
+    def round_number(self) -> int:
+        if self.source is not None:
+            return self.source.round_number
+        return ui_session_state().get('round_number', 1)
+
+    @property
+    def roster(self) -> dict:
+        if self.source is not None:
+            return getattr(self.source, "roster", {}) or {}
+        return ui_session_state().get('roster', {})
+
+    # === КОМАНДЫ ===
+
+    @property
+    def teams(self) -> tuple:
+        return self.team_left, self.team_right
+
+    def all_units(self) -> list:
+        return self.team_left + self.team_right
+
+    def side_of(self, unit):
+        """LEFT/RIGHT или None, если юнит не участвует в бою."""
+        return self.index.side_of(unit)
+
+    def team_of(self, unit):
+        """Список команды юнита (или None)."""
+        return self.index.team_of(unit)
+
+    def enemy_team_of(self, unit):
+        """Список команды противника (или None)."""
+        side = self.side_of(unit)
+        if side is None:
+            return None
+        return self.team_right if side == LEFT else self.team_left
+
+    def allies_of(self, unit, include_self: bool = True) -> list:
+        """Живые юниты команды unit (проверка смерти на момент вызова)."""
+        team = self.team_of(unit) or []
+        return [u for u in team if not u.is_dead() and (include_self or u is not unit)]
+
+    def enemies_of(self, unit) -> list:
+        """Живые юниты команды противника."""
+        team = self.enemy_team_of(unit) or []
+        return [u for u in team if not u.is_dead()]
+
+    def alive(self, side: int) -> list:
+        """
+        Живые юниты стороны по индексу (обновляется в начале/конце раунда и после каждого действия).
+        Список общий - не изменять.
+        """
+        return self.index.alive(side)
+
+    def alive_units(self) -> list:
+        return self.index.alive(LEFT) + self.index.alive(RIGHT)
+
+
+def ui_session_state():
+    """Ленивый доступ к сессии Streamlit (только для UI-режима)."""
+    try:
+        import streamlit as st
+        return st.session_state
+    except Exception:
+        return {}
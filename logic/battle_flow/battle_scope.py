@@ -0,0 +1,106 @@
+import random
+import threading
+from contextlib import contextmanager
+
+from logic.battle_flow.battle_context import BattleContext, ui_session_state
+
+# Активный бой хранится per-thread, чтобы параллельные симуляции не мешали друг другу
+_scope = threading.local()
+
+
+def set_active_battle(battle):
+    """
+    Регистрирует текущий бой.
+    battle: любой объект с полями team_left, team_right, round_number (и опционально roster).
+    None возвращает поведение по умолчанию (данные из st.session_state).
+    """
+    _scope.battle = battle
+
+
+def get_active_battle():
+    return getattr(_scope, "battle", None)
+
+
+@contextmanager
+def active_battle(battle):
+    """Временно делает battle текущим боем (для headless-раннера)."""
+    previous = get_active_battle()
+    set_active_battle(battle)
+    try:
+        yield battle
+    finally:
+        set_active_battle(previous)
+
+
+def current_battle() -> BattleContext:
+    """
+    BattleContext текущего боя (активный бой потока или команды из st.session_state).
+    Контекст кэшируется per-thread, пока не сменятся списки команд или сам бой.
+    """
+    battle = get_active_battle()
+    if battle is not None:
+        team_left, team_right = battle.team_left, battle.team_right
+    else:
+        state = ui_session_state()
+        team_left, team_right = state.get('team_left', []), state.get('team_right', [])
+
+    context = getattr(_scope, "context", None)
+    if context is None or not context.matches(team_left, team_right, battle):
+        context = _scope.context = BattleContext(team_left, team_right, battle)
+    return context
+
+
+def battle_for(team_left: list, team_right: list) -> BattleContext:
+    """Контекст для конкретных списков команд (текущий бой, если команды совпадают)."""
+    context = current_battle()
+    if context.team_left is team_left and context.team_right is team_right:
+        return context
+    return BattleContext(team_left, team_right, get_active_battle())
+
+
+def battle_of(ctx) -> BattleContext:
+    """Контекст боя из RollContext (для других объектов - текущий бой)."""
+    return getattr(ctx, "battle", None) or current_battle()
+
+
+def get_teams():
+    """Возвращает (team_left, team_right) текущего боя."""
+    return current_battle().teams
+
+
+def get_all_units():
+    return current_battle().all_units()
+
+
+def get_unit_team(unit):
+    """Возвращает список команды, в которой состоит юнит (или None)."""
+    return current_battle().team_of(unit)
+
+
+def get_round_number() -> int:
+    return current_battle().round_number
+
+
+def get_roster() -> dict:
+    """Ростер для призыва юнитов (summon_ally)."""
+    return current_battle().roster
+
+
+def record_damage(source, target, amount: int, resource_type: str):
+    """Сообщает текущему бою о нанесенном уроне (для статистики симуляций)."""
+    battle = get_active_battle()
+    if battle is None or source is None or amount <= 0:
+        return
+    recorder = getattr(battle, "record_damage", None)
+    if recorder:
+        recorder(source, target, amount, resource_type)
+
+
+def get_rng():
+    """
+    RNG текущего боя (battle.rng).
+    Без активного боя (UI) возвращает глобальный модуль random.
+    """
+    battle = get_active_battle()
+    rng = getattr(battle, "rng", None) if battle is not None else None
+    return rng if rng is not None else random
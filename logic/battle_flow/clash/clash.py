@@ -1,5 +1,6 @@
 from core.enums import DiceType
 from core.logging import logger, LogLevel
+from core.profiler import traced
 from logic.battle_flow.clash.clash_one_sided import handle_one_sided_exchange
 from logic.battle_flow.clash.clash_resolution import resolve_clash_round
 # Новые модули
@@ -7,6 +8,7 @@ from logic.battle_flow.clash.clash_setup import setup_clash_parameters
 from logic.battle_flow.clash.clash_state import ClashParticipantState
 
 
+@traced(cat="clash")
 def process_clash(engine, attacker, defender, round_label, is_left, spd_a, spd_d, intent_a=True, intent_d=True):
     report = []
 
@@ -1,5 +1,6 @@
 from core.enums import DiceType
 from core.logging import logger, LogLevel
+from core.profiler import traced
 
 
 def manual_save_die(unit, die, detail_logs):
@@ -14,6 +15,7 @@ def manual_save_die(unit, die, detail_logs):
     logger.log(f"{unit.name} stored evade die (auto-save)", LogLevel.NORMAL, "Clash")
 
 
+@traced("one_sided_exchange", "clash")
 def handle_one_sided_exchange(engine, active_side, passive_side, detail_logs):
     """
     Обрабатывает ситуацию, когда у active_side ЕСТЬ кубик, а у passive_side НЕТ.
@@ -1,6 +1,13 @@
 from core.enums import DiceType
 from core.logging import logger, LogLevel
+from core.profiler import traced
 
+
+def _trace_args(engine, ctx_a, ctx_d, *args):
+    return {"a": f"{ctx_a.source.name} {ctx_a.final_value}", "d": f"{ctx_d.source.name} {ctx_d.final_value}"}
+
+
+@traced("clash_round", "clash", describe=_trace_args)
 def resolve_clash_round(engine, ctx_a, ctx_d, die_a, die_d):
     """
     Решает исход одного раунда стычки (сравнение значений).
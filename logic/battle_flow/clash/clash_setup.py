@@ -1,8 +1,10 @@
 from core.logging import logger, LogLevel
+from core.profiler import traced
 from logic.battle_flow.clash.clash_utils import check_destruction_immunity
 from logic.battle_flow.speed import calculate_speed_advantage
 
 
+@traced(cat="clash")
 def setup_clash_parameters(engine, attacker, defender, spd_a, spd_d, intent_a, intent_d):
     """
     Выполняет скрипты On Use и рассчитывает параметры скорости и разрушения кубиков.
@@ -1,4 +1,6 @@
 from core.logging import logger, LogLevel
+from core.profiler import traced
+from logic.battle_flow.battle_scope import current_battle
 from logic.battle_flow.mass_attack import process_mass_attack
 
 
@@ -22,16 +24,40 @@ def _apply_card_cooldown(unit, card):
         logger.log(f"⏳ {unit.name}: Cooldown applied to '{card.name}' ({cd_val} turns)", LogLevel.NORMAL, "Cooldown")
 
 
+def _trace_args(engine, act, executed_slots):
+    card = act['slot_data'].get('card')
+    target = act.get('target_unit')
+    return {
+        "source": f"{act['source'].name} S{act['source_idx'] + 1}",
+        "card": card.name if card else None,
+        "target": f"{target.name} S{act['target_slot_idx'] + 1}" if target else None,
+    }
+
+
+@traced("action", "action", describe=_trace_args)
 def execute_single_action(engine, act, executed_slots):
     """
     Фаза 2 (Микро): Выполнение конкретного действия из очереди.
+    executed_slots: множество (unit.uid, slot_idx) уже сыгранных слотов.
     """
+    logs = _execute_action(engine, act, executed_slots)
+
+    # Действие могло убить юнитов или изменить Провокацию
+    index = current_battle().index
+    if "mass" in act['card_type']:
+        index.refresh([act['source']] + list(act['opposing_team']))
+    else:
+        index.refresh([u for u in (act['source'], act['target_unit']) if u is not None])
+    return logs
+
+
+def _execute_action(engine, act, executed_slots):
     engine.logs = []
     source = act['source']
     s_idx = act['source_idx']
 
     # ID слота источника
-    src_id = (source.name, s_idx)
+    src_id = (source.uid, s_idx)
 
     # Если этот слот уже сыграл, пропускаем
     if src_id in executed_slots:
@@ -44,6 +70,7 @@ def execute_single_action(engine, act, executed_slots):
 
     # Загружаем карту
     source.current_card = act['slot_data'].get('card')
+    source.current_slot = act['slot_data']
     if not source.current_card:
         return []
 
@@ -87,7 +114,7 @@ def execute_single_action(engine, act, executed_slots):
         return []
 
     is_clash = False
-    tgt_id = (target.name, t_s_idx)
+    tgt_id = (target.uid, t_s_idx)
     target_slot = None
     slot_data = act['slot_data']
 
@@ -110,6 +137,7 @@ def execute_single_action(engine, act, executed_slots):
         executed_slots.add(tgt_id)
 
         target.current_card = target_slot.get('card')
+        target.current_slot = target_slot
         spd_tgt = target_slot['speed']
         intent_tgt = target_slot.get('destroy_on_speed', True)
         _apply_card_cooldown(target, target.current_card)
@@ -135,10 +163,11 @@ def execute_single_action(engine, act, executed_slots):
             spd_def_val = target_slot['speed']
             if not is_target_busy and not target.is_staggered():
                 target.current_card = target_slot.get('card')
+                target.current_slot = target_slot
             else:
-                target.current_card = None
+                target.current_card = target.current_slot = None
         else:
-            target.current_card = None
+            target.current_card = target.current_slot = None
 
         logger.log(f"🏹 One-Sided: {source.name} -> {target.name} ({'Redirected' if is_redirected else 'Direct'})",
                    LogLevel.NORMAL, "Combat")
@@ -0,0 +1,129 @@
+from core.logging import logger, LogLevel
+
+LEFT = 0
+RIGHT = 1
+
+
+class InteractionGraph:
+    """
+    Граф взаимодействий слотов на раунд.
+    Атакующие слоты индексируются по цели (юнит, слот) за один проход по команде,
+    способность "перехват при равной скорости" считается один раз на юнита.
+    Используется движком (перехваты) и UI (подписи слотов).
+    """
+    __slots__ = ("teams", "_incoming", "_equal_speed")
+
+    def __init__(self, team_left: list, team_right: list):
+        self.teams = (team_left, team_right)
+        # side атакующих -> {(target_unit_idx, target_slot_idx): [(atk_u_idx, atk_s_idx, unit, slot)]}
+        self._incoming = [None, None]
+        # id(unit) -> bool
+        self._equal_speed = {}
+
+    def incoming(self, atk_side: int) -> dict:
+        """Индекс атак стороны atk_side по слотам противника (строится лениво)."""
+        index = self._incoming[atk_side]
+        if index is None:
+            index = self._incoming[atk_side] = {}
+            for u_idx, unit in enumerate(self.teams[atk_side]):
+                if unit.is_dead(): continue
+                for s_idx, slot in enumerate(unit.active_slots):
+                    if slot.get('is_ally_target'): continue
+                    key = (slot.get('target_unit_idx', -1), slot.get('target_slot_idx', -1))
+                    entry = (u_idx, s_idx, unit, slot)
+                    bucket = index.get(key)
+                    if bucket is None:
+                        index[key] = [entry]
+                    else:
+                        bucket.append(entry)
+        return index
+
+    def attackers_of(self, def_side: int, unit_idx: int, slot_idx: int) -> list:
+        """Вражеские слоты, целящиеся в слот (unit_idx, slot_idx) стороны def_side (в порядке команды)."""
+        return self.incoming(1 - def_side).get((unit_idx, slot_idx), ())
+
+    def can_redirect_on_equal_speed(self, unit) -> bool:
+        cached = self._equal_speed.get(id(unit))
+        if cached is None:
+            cached = False
+            if hasattr(unit, "iter_hook_handlers"):
+                cached = any(handler(unit) for handler in unit.iter_hook_handlers("can_redirect_on_equal_speed"))
+            self._equal_speed[id(unit)] = cached
+        return cached
+
+    # === ПЕРЕХВАТЫ ===
+
+    def resolve_redirections(self):
+        """Перехваты для обеих сторон (сначала атакует левая команда, как раньше)."""
+        self.resolve_side(LEFT)
+        self.resolve_side(RIGHT)
+
+    def resolve_side(self, atk_side: int):
+        """
+        Рассчитывает перехваты атак стороны atk_side.
+        Правило LoR: Перехват возможен, только если Spd(Atk) > Spd(Def).
+        Исключение: Если Def уже целится в Atk (В ТОТ ЖЕ СЛОТ), то это Clash по умолчанию.
+        """
+        index = self.incoming(atk_side)
+        if not index:
+            return
+
+        for def_idx, defender in enumerate(self.teams[1 - atk_side]):
+            if defender.is_dead(): continue
+
+            for s_def_idx, s_def in enumerate(defender.active_slots):
+                attackers = index.get((def_idx, s_def_idx))
+                if not attackers: continue
+                if s_def.get('prevent_redirection'): continue
+                if s_def.get('stunned'): continue
+
+                def_spd = s_def['speed']
+                # Цель защитника (в кого он сам бьет)
+                def_target = (s_def.get('target_unit_idx', -1), s_def.get('target_slot_idx', -1))
+
+                valid_interceptors = []
+                for atk_u_idx, s_atk_idx, atk_unit, s_atk in attackers:
+                    atk_spd = s_atk['speed']
+
+                    # "Естественный Клэш" (Def тоже бьет в Atk)
+                    if def_target == (atk_u_idx, s_atk_idx):
+                        valid_interceptors.append((s_atk, atk_unit.name))
+                    elif atk_spd > def_spd or (atk_spd == def_spd and self.can_redirect_on_equal_speed(atk_unit)):
+                        valid_interceptors.append((s_atk, atk_unit.name))
+                    else:
+                        # Скорости не хватает и мы не цель защитника -> One Sided
+                        s_atk['force_clash'] = False
+                        s_atk['force_onesided'] = True
+
+                if not valid_interceptors: continue
+
+                # Кто агрессивнее/быстрее, тот и забирает клэш (сортировка устойчивая)
+                valid_interceptors.sort(key=lambda item: (1000 if item[0].get('is_aggro') else 0) + item[0]['speed'],
+                                        reverse=True)
+                best_match_slot = valid_interceptors[0][0]
+
+                for slot, name in valid_interceptors:
+                    if slot is best_match_slot:
+                        slot['force_clash'] = True
+                        slot['force_onesided'] = False
+                        logger.log(f"⚔️ Clash Confirmed: {name} intercepts {defender.name} (Slot {s_def_idx})",
+                                   LogLevel.VERBOSE, "Targeting")
+                    else:
+                        slot['force_clash'] = False
+                        slot['force_onesided'] = True
+                        logger.log(f"🏹 Forced One-Sided: {name} vs {defender.name} (Outsped by ally)",
+                                   LogLevel.VERBOSE, "Targeting")
+
+    # === ЗАПРОСЫ ДЛЯ UI ===
+
+    def interceptor_of(self, side: int, unit_idx: int, slot_idx: int):
+        """
+        Вражеский слот, перехвативший слот (unit_idx, slot_idx) стороны side:
+        (enemy, enemy_slot, enemy_slot_idx) или None. Взаимное нацеливание перехватом не считается.
+        """
+        my_slot = self.teams[side][unit_idx].active_slots[slot_idx]
+        my_target = (my_slot.get('target_unit_idx', -1), my_slot.get('target_slot_idx', -1))
+        for e_idx, e_s_idx, enemy, e_slot in self.attackers_of(side, unit_idx, slot_idx):
+            if e_slot.get('force_clash') and my_target != (e_idx, e_s_idx):
+                return enemy, e_slot, e_s_idx
+        return None
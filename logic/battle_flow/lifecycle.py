@@ -1,8 +1,7 @@
-import random
-
 from core.logging import logger, LogLevel
 from logic.battle_flow.priorities import get_action_priority
-from logic.battle_flow.targeting import calculate_redirections
+from logic.battle_flow.team_index import team_index, LEFT, RIGHT
+from logic.battle_flow.interaction_graph import InteractionGraph
 
 
 def prepare_turn(engine, team_left: list, team_right: list):
@@ -16,14 +15,18 @@ def prepare_turn(engine, team_left: list, team_right: list):
     logger.log("🔄 Preparing Turn: Collecting Actions...", LogLevel.NORMAL, "Phase")
 
     # Рассчитываем перехваты для обеих команд
-    calculate_redirections(team_left, team_right)
-    calculate_redirections(team_right, team_left)
+    InteractionGraph(team_left, team_right).resolve_redirections()
 
     logger.log("Redirections calculated.", LogLevel.VERBOSE, "Flow")
 
+    # Живые и юниты с Провокацией для авто-таргетинга (один раз на ход, а не на каждый слот)
+    index = team_index(team_left, team_right)
+    index.refresh()
+
     actions = []
 
     def collect_actions(source_team, target_team, is_left_side):
+        target_side = RIGHT if is_left_side else LEFT
         for u_idx, unit in enumerate(source_team):
             if unit.is_dead(): continue
             for s_idx, slot in enumerate(unit.active_slots):
@@ -38,7 +41,7 @@ def prepare_turn(engine, team_left: list, team_right: list):
                 base_prio = get_action_priority(card)
                 # Левая сторона получает микро-бонус приоритета при прочих равных (convention)
                 if base_prio >= 4000 and is_left_side: base_prio += 500
-                score = base_prio + slot['speed'] + random.random()
+                score = base_prio + slot['speed'] + engine.rng.random()
 
                 # --- ВЫБОР ЦЕЛИ ---
                 t_u_idx = slot.get('target_unit_idx', -1)
@@ -70,10 +73,10 @@ def prepare_turn(engine, team_left: list, team_right: list):
 
                     # Сценарий Б: Атака или Гибрид -> применяем на ВРАГА
                     else:
-                        alive_enemies = [e for e in target_team if not e.is_dead()]
+                        alive_enemies = index.alive(target_side)
                         if alive_enemies:
                             # Приоритет 1: Провокация (Taunt)
-                            taunted = [e for e in alive_enemies if e.get_status("taunt") > 0]
+                            taunted = index.taunted(target_side)
 
                             if taunted:
                                 target_unit = taunted[0]
@@ -102,9 +105,8 @@ def prepare_turn(engine, team_left: list, team_right: list):
                         'card_type': str(card.card_type).lower(),
                         'opposing_team': target_team
                     })
-                    logger.log(
-                        f"➕ Action Queued: {unit.name} -> {target_unit.name} ({card.name}, Spd: {slot['speed']}, Score: {int(score)})",
-                        LogLevel.VERBOSE, "Flow")
+                    logger.log("➕ Action Queued: %s -> %s (%s, Spd: %s, Score: %d)", LogLevel.VERBOSE, "Flow",
+                               unit.name, target_unit.name, card.name, slot['speed'], score)
 
     collect_actions(team_left, team_right, True)
     collect_actions(team_right, team_left, False)
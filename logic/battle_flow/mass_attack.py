@@ -1,13 +1,13 @@
-import random
-
 from core.enums import CardType
 from core.logging import logger, LogLevel
+from core.profiler import traced
 
 
+@traced(cat="clash")
 def process_mass_attack(engine, action, opposing_team, round_label, executed_slots=None):
     """
     Обрабатывает массовую атаку.
-    executed_slots: множество (unit_name, slot_idx), которые уже походили.
+    executed_slots: множество (unit.uid, slot_idx), которые уже походили.
     """
     source = action['source']
     card = source.current_card
@@ -30,6 +30,9 @@ def process_mass_attack(engine, action, opposing_team, round_label, executed_slo
     for log in on_use_logs:
         logger.log(f"MassAtk On Use: {log}", LogLevel.VERBOSE, "MassAtk")
 
+    # On Use мог подменить карту оверлеем (доп. кубики)
+    card = source.current_card
+
     # Перебираем всех живых врагов
     for e_idx, target in enumerate(opposing_team):
         if target.is_dead(): continue
@@ -48,7 +51,7 @@ def process_mass_attack(engine, action, opposing_team, round_label, executed_slo
                 if not s.get('card'): continue
 
                 is_executed = False
-                if executed_slots and (target.name, s_i) in executed_slots:
+                if executed_slots and (target.uid, s_i) in executed_slots:
                     is_executed = True
 
                 if not is_executed:
@@ -67,7 +70,7 @@ def process_mass_attack(engine, action, opposing_team, round_label, executed_slo
                     chosen_s_idx = s_idx
                     if slot.get('card'):
                         target_slot = slot
-                        if executed_slots and (target.name, s_idx) in executed_slots:
+                        if executed_slots and (target.uid, s_idx) in executed_slots:
                             is_undefended = True
                             logger.log(f"Targeting {target.name} (Manual S{s_idx + 1}: Executed -> One-Sided)",
                                        LogLevel.VERBOSE, "MassAtk")
@@ -83,13 +86,13 @@ def process_mass_attack(engine, action, opposing_team, round_label, executed_slo
 
         if not target_slot and not is_undefended:
             if valid_defense_slots:
-                s_idx, slot = random.choice(valid_defense_slots)
+                s_idx, slot = engine.rng.choice(valid_defense_slots)
                 target_slot = slot
                 chosen_s_idx = s_idx
                 logger.log(f"Targeting {target.name} (Auto: S{s_idx + 1} {slot['card'].name})", LogLevel.VERBOSE,
                            "MassAtk")
             elif executed_card_slots:
-                s_idx, slot = random.choice(executed_card_slots)
+                s_idx, slot = engine.rng.choice(executed_card_slots)
                 target_slot = slot
                 chosen_s_idx = s_idx
                 is_undefended = True
@@ -101,7 +104,7 @@ def process_mass_attack(engine, action, opposing_team, round_label, executed_slo
 
         # --- 3. ФИКСАЦИЯ ИСПОЛЬЗОВАНИЯ ---
         if target_slot and not is_undefended and executed_slots is not None and chosen_s_idx != -1:
-            executed_slots.add((target.name, chosen_s_idx))
+            executed_slots.add((target.uid, chosen_s_idx))
 
         if target_slot and not is_undefended:
             target_dice_list = target_slot['card'].dice_list
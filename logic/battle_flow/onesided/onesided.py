@@ -1,5 +1,6 @@
 from core.enums import DiceType
 from core.logging import logger, LogLevel
+from core.profiler import traced
 from logic.battle_flow.onesided.onesided_resolution import resolve_counter_clash, resolve_passive_defense, \
     resolve_unopposed_hit
 # Новые модули
@@ -7,6 +8,7 @@ from logic.battle_flow.onesided.onesided_setup import setup_onesided_parameters
 from logic.battle_flow.onesided.onesided_utils import fetch_next_counter, store_unused_counter
 
 
+@traced(cat="clash")
 def process_onesided(engine, source, target, round_label, spd_atk, spd_d, intent_atk=True, is_redirected=False):
     report = []
     card = source.current_card
@@ -24,6 +26,10 @@ def process_onesided(engine, source, target, round_label, spd_atk, spd_d, intent
     defender_breaks_attacker = params["defender_breaks_attacker"]
     on_use_logs = params["on_use_logs"]
 
+    # On Use скрипты могли подменить карты оверлеями (доп. кубики, смена типа)
+    card = source.current_card
+    def_card = target.current_card
+
     attacker_queue = list(card.dice_list)
     att_idx = 0
     active_counter_die = None
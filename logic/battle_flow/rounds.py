@@ -0,0 +1,185 @@
+from collections import Counter
+
+from core.enums import CardType
+from core.library import Library
+from core.profiler import traced
+from core.unit.data.status_store import StatusStore
+from logic.battle_flow.battle_scope import battle_for
+from logic.battle_flow.team_index import team_index
+from logic.statuses.status_manager import StatusManager
+
+
+def _sides(u, team_left, team_right):
+    """Возвращает (враги, союзники) для юнита."""
+    return team_index(team_left, team_right).sides_of(u)
+
+
+def _event_logger(logs, round_label, rolls, prefix):
+    """Создает log_func, который складывает события в список battle_logs."""
+
+    def log_func(msg):
+        if logs is not None:
+            logs.append({"round": round_label, "rolls": rolls, "details": f"{prefix}{msg}"})
+
+    return log_func
+
+
+def init_unit_for_battle(u, team_left, team_right, logs=None, battle=None):
+    """
+    Подготовка юнита к бою (один раз за бой):
+    начальные кулдауны карт (Tier - 1) и событие on_combat_start.
+    """
+    if u.memory.get("battle_initialized"):
+        return
+
+    u.memory["battle_initialized"] = True
+
+    if not hasattr(u, "card_cooldowns") or u.card_cooldowns is None:
+        u.card_cooldowns = {}
+
+    if getattr(u, 'deck', None):
+        # Считаем, сколько копий каждой карты
+        deck_counts = Counter(u.deck)
+
+        for card_id, count in deck_counts.items():
+            card = Library.get_card(card_id)
+            if card:
+                # Пропускаем предметы
+                if card.card_type.upper() == CardType.ITEM.name:
+                    continue
+
+                # Начальный кулдаун (Tier - 1)
+                initial_cd = max(0, card.tier - 1)
+
+                if initial_cd > 0:
+                    # Если есть "разогрев", он накладывается на ВСЕ копии карты в начале боя
+                    u.card_cooldowns[card_id] = [initial_cd] * count
+
+    # === ВЫЗОВ ON_COMBAT_START ===
+    opponents, my_allies = _sides(u, team_left, team_right)
+    log_start = _event_logger(logs, "Start", "Event", f"🚩 **{u.name}**: ")
+
+    if hasattr(u, "trigger_mechanics"):
+        u.trigger_mechanics("on_combat_start", u, log_start,
+                            enemies=opponents, allies=my_allies,
+                            battle=battle or battle_for(team_left, team_right))
+
+
+@traced(cat="round")
+def start_round(team_left, team_right, logs=None):
+    """
+    Начало раунда: события on_round_start, бросок скорости, on_speed_rolled.
+    logs: список battle_logs, куда складываются события пассивок.
+    """
+    all_units = team_left + team_right
+    battle = battle_for(team_left, team_right)
+
+    # === TRIGGERS (События начала) ===
+    for u in all_units:
+        u.recalculate_stats()
+        init_unit_for_battle(u, team_left, team_right, logs, battle)
+
+        opponents, my_allies = _sides(u, team_left, team_right)
+        log_round = _event_logger(logs, "Round Start", "Event", f"🔄 **{u.name}**: ")
+
+        if hasattr(u, "trigger_mechanics"):
+            u.trigger_mechanics("on_round_start", u, log_round,
+                                enemies=opponents, allies=my_allies, battle=battle)
+
+    # === БРОСОК КУБИКОВ ===
+    for u in all_units:
+        u.recalculate_stats()
+
+        if u.is_staggered():
+            u.active_slots = [{
+                'speed': 0, 'card': None,
+                'target_unit_idx': -1, 'target_slot_idx': -1,
+                'stunned': True, 'is_aggro': False
+            }]
+        else:
+            # Генерация случайных чисел происходит ЗДЕСЬ
+            u.roll_speed_dice()
+
+            for s in u.active_slots:
+                s['target_unit_idx'] = -1
+                s['target_slot_idx'] = -1
+                s['is_aggro'] = False
+                s['force_clash'] = False
+
+    # === SPEED ROLLED EVENTS ===
+    for u in all_units:
+        opponents, my_allies = _sides(u, team_left, team_right)
+        log_speed = _event_logger(logs, "Speed Roll", "Passive", f"⚡ **{u.name}**: ")
+
+        if hasattr(u, "trigger_mechanics"):
+            u.trigger_mechanics("on_speed_rolled", u, log_speed,
+                                enemies=opponents, allies=my_allies, battle=battle)
+
+    for u in all_units:
+        u.recalculate_stats()
+
+    # Живые/Провокация на момент планирования
+    team_index(team_left, team_right).refresh()
+
+
+@traced(cat="round")
+def end_round(team_left, team_right) -> list:
+    """
+    Конец раунда: восстановление после оглушения, on_round_end,
+    тик статусов и кулдаунов, очистка слотов.
+    Возвращает список сообщений.
+    """
+    all_units = team_left + team_right
+    battle = battle_for(team_left, team_right)
+    msg = []
+
+    def log_collector(message):
+        msg.append(message)
+
+    for u in all_units:
+        if u.active_slots and u.active_slots[0].get('stunned'):
+            u.current_stagger = u.max_stagger
+            msg.append(f"✨ {u.name} recovered!")
+
+        _, my_allies = _sides(u, team_left, team_right)
+
+        if hasattr(u, "trigger_mechanics"):
+            u.trigger_mechanics("on_round_end", u, log_collector, allies=my_allies, battle=battle)
+
+        status_logs = StatusManager.process_turn_end(u)
+        msg.extend(status_logs)
+
+        u.tick_cooldowns()
+        u.active_slots = []
+        if hasattr(u, 'stored_dice') and u.stored_dice:
+            u.stored_dice = []
+            msg.append(f"{u.name}: Stored evade dice burned.")
+
+    team_index(team_left, team_right).refresh()
+    return msg
+
+
+def reset_unit(u):
+    """Сбрасывает боевое состояние юнита к началу боя."""
+    u.memory.pop("battle_initialized", None)
+    saved_stats = u.memory.get('start_of_battle_stats')
+
+    if saved_stats:
+        u.current_hp = saved_stats['hp']
+        u.current_sp = saved_stats['sp']
+        u.current_stagger = saved_stats['stagger']
+    else:
+        u.current_hp = u.max_hp
+        u.current_stagger = u.max_stagger
+        u.current_sp = u.max_sp
+
+    u.active_buffs = {}
+    u.card_cooldowns = {}
+    u.cooldowns = {}
+    u.recalculate_stats()
+    u._status_effects = StatusStore()
+    u.delayed_queue = []
+    u.active_slots = []
+    u.overkill_damage = 0
+    u.stored_dice = []
+    u.death_count = 0
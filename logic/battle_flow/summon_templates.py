@@ -0,0 +1,98 @@
+"""
+Кэш шаблонов призыва (summon_ally).
+
+Для каждого призываемого юнита один раз строится боевой прототип:
+копия юнита из ростера без анкетных данных (биография, финансы, отношения),
+с посчитанными статами и полными HP/SP/Stagger. Призыв во время боя -
+дешевый форк прототипа (как ветвление боя), без deepcopy и recalculate_stats.
+Прототип пересобирается, когда меняется файл юнита или объект шаблона в ростере
+(новый ростер, загрузка сейва), и сбрасывается при сохранении/удалении юнита.
+"""
+import copy
+import os
+import threading
+
+from core.logging import logger, LogLevel
+from core.unit.unit_library import UnitLibrary
+
+
+class SummonTemplates:
+    # unit_name -> (ключ актуальности, прототип)
+    _templates = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _find_template(roster: dict, unit_name: str):
+        template = roster.get(unit_name)
+        if template is not None:
+            return template
+        for u in roster.values():
+            if u.name == unit_name:
+                return u
+        return None
+
+    @staticmethod
+    def _file_mtime(unit_name: str):
+        try:
+            return os.stat(UnitLibrary.file_path(unit_name)).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _build_prototype(template):
+        proto = copy.deepcopy(template)
+        # В бою не нужны и не меняются: не копируем их в каждый призыв
+        proto.biography = ""
+        proto.money_log = []
+        proto.relationships = {}
+
+        proto.recalculate_stats()
+        proto.current_hp = proto.max_hp
+        proto.current_sp = proto.max_sp
+        proto.current_stagger = proto.max_stagger
+        proto.memory['start_of_battle_stats'] = {
+            'hp': proto.max_hp,
+            'sp': proto.max_sp,
+            'stagger': proto.max_stagger
+        }
+        return proto
+
+    @classmethod
+    def prototype(cls, roster: dict, unit_name: str):
+        """Боевой прототип юнита из ростера (или None, если такого юнита нет)."""
+        template = cls._find_template(roster, unit_name)
+        if template is None:
+            return None
+
+        # Прототип привязан к объекту шаблона и версии файла: другой ростер (загрузка сейва)
+        # или измененный файл дают новый прототип. Правки шаблона сбрасывают его через save_unit
+        key = (id(template), cls._file_mtime(template.name))
+        cached = cls._templates.get(unit_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        proto = cls._build_prototype(template)
+        with cls._lock:
+            cls._templates[unit_name] = (key, proto)
+        logger.log(f"🤖 Summon template built: {template.name}", LogLevel.VERBOSE, "Summon")
+        return proto
+
+    @classmethod
+    def spawn(cls, roster: dict, unit_name: str):
+        """Новый боец из прототипа (собственные статусы, память и слоты; новый uid)."""
+        proto = cls.prototype(roster, unit_name)
+        if proto is None:
+            return None
+        from logic.simulation.fork import fork_units  # Лениво: logic.simulation импортирует скрипты карт
+        unit = fork_units([proto])[0]
+        unit.renew_uid()
+        return unit
+
+    @classmethod
+    def invalidate(cls, unit_name: str = None):
+        """Сбрасывает прототип юнита (или все прототипы)."""
+        with cls._lock:
+            if unit_name is None:
+                cls._templates.clear()
+            else:
+                cls._templates.pop(unit_name, None)
@@ -0,0 +1,171 @@
+import threading
+from collections import OrderedDict
+
+from core.logging import logger, LogLevel
+
+LEFT = 0
+RIGHT = 1
+
+# Индексы по парам команд в каждом потоке: (id(team_left), id(team_right)) -> TeamIndex
+_cache = threading.local()
+CACHE_SIZE = 8
+
+
+class TeamIndex:
+    """
+    Индексы команд боя по uid юнита:
+    - сторона и позиция юнита (вместо линейных `u in team_left`);
+    - живые и юниты с Провокацией по каждой стороне (в порядке команды).
+    Живые/Провокация обновляются через refresh(): целиком в начале и конце раунда,
+    по затронутым юнитам - после каждого действия.
+    Изменение размера команды (призыв) проверяется при каждом запросе и пересобирает индекс;
+    после правки состава на месте (замена юнита) нужен invalidate_team_index().
+    Индекс только читает юниты: uid выдаются при создании и копировании юнитов.
+    """
+    __slots__ = ("teams", "_sizes", "_where", "_alive", "_taunt", "_lists")
+
+    def __init__(self, team_left: list, team_right: list):
+        self.teams = (team_left, team_right)
+        self.rebuild()
+
+    def rebuild(self):
+        self._map()
+        self._alive = (set(), set())
+        self._taunt = (set(), set())
+        self._lists = {}
+        self.refresh()
+
+    def _map(self):
+        team_left, team_right = self.teams
+        self._sizes = (len(team_left), len(team_right))
+        # uid -> (side, idx)
+        self._where = {}
+        for side, team in enumerate(self.teams):
+            for idx, unit in enumerate(team):
+                if unit.uid in self._where:
+                    # Копия без renew_uid(): второй юнит не найдется по uid, сам uid не меняем
+                    logger.log(f"⚠️ TeamIndex: duplicate uid {unit.uid} ({unit.name})", LogLevel.MINIMAL, "System")
+                    continue
+                self._where[unit.uid] = (side, idx)
+
+    def _sync(self):
+        if self._sizes != (len(self.teams[LEFT]), len(self.teams[RIGHT])):
+            self.rebuild()
+
+    # === ПОИСК ===
+
+    def locate(self, unit):
+        """(side, idx) юнита или None, если его нет ни в одной команде."""
+        self._sync()
+        where = self._where.get(unit.uid)
+        if where is not None:
+            side, idx = where
+            if self.teams[side][idx] is unit:
+                return where
+        # Команду могли изменить на месте (замена юнита того же размера)
+        previous = self._where
+        self._map()
+        if self._where != previous:
+            self.rebuild()
+        where = self._where.get(unit.uid)
+        if where is not None and self.teams[where[0]][where[1]] is unit:
+            return where
+        return None
+
+    def side_of(self, unit):
+        where = self.locate(unit)
+        return where[0] if where else None
+
+    def team_of(self, unit):
+        """Список команды юнита (или None)."""
+        where = self.locate(unit)
+        return self.teams[where[0]] if where else None
+
+    def sides_of(self, unit):
+        """(враги, союзники) для юнита; юнит вне боя считается правым."""
+        side = self.side_of(unit)
+        if side == LEFT:
+            return self.teams[RIGHT], self.teams[LEFT]
+        return self.teams[LEFT], self.teams[RIGHT]
+
+    # === ЖИВЫЕ И ПРОВОКАЦИЯ ===
+
+    def refresh(self, units=None):
+        """Обновляет отметки живых/Провокации для units (по умолчанию - для всех юнитов боя)."""
+        if units is None:
+            units = [u for team in self.teams for u in team]
+        for unit in units:
+            where = self._where.get(unit.uid)
+            if where is None:
+                continue
+            side, idx = where
+            alive = not unit.is_dead()
+            taunt = alive and unit.get_status("taunt") > 0
+            if alive != (idx in self._alive[side]):
+                (self._alive[side].add if alive else self._alive[side].discard)(idx)
+                self._lists.pop(("alive", side), None)
+            if taunt != (idx in self._taunt[side]):
+                (self._taunt[side].add if taunt else self._taunt[side].discard)(idx)
+                self._lists.pop(("taunt", side), None)
+
+    def _ordered(self, kind: str, side: int) -> tuple:
+        """(индексы, юниты) отмеченных юнитов стороны в порядке команды (кэш до следующего изменения)."""
+        self._sync()
+        cached = self._lists.get((kind, side))
+        if cached is None:
+            marks = self._alive[side] if kind == "alive" else self._taunt[side]
+            team = self.teams[side]
+            idxs = sorted(marks)
+            cached = self._lists[(kind, side)] = (idxs, [team[i] for i in idxs])
+        return cached
+
+    def alive(self, side: int) -> list:
+        """Живые юниты стороны (в порядке команды). Список общий - не изменять."""
+        return self._ordered("alive", side)[1]
+
+    def taunted(self, side: int) -> list:
+        """Живые юниты стороны с Провокацией (в порядке команды). Список общий - не изменять."""
+        return self._ordered("taunt", side)[1]
+
+    def alive_indexed(self, side: int) -> list:
+        """[(idx, unit)] живых юнитов стороны."""
+        return list(zip(*self._ordered("alive", side)))
+
+
+def team_index(team_left: list, team_right: list) -> TeamIndex:
+    """
+    Индекс для пары команд. Индексы кэшируются per-thread по паре списков команд (LRU на
+    CACHE_SIZE пар), так что переключение между живым боем и форками планировщика их не сбрасывает.
+    """
+    last = getattr(_cache, "last", None)
+    if last is not None and last.teams[LEFT] is team_left and last.teams[RIGHT] is team_right:
+        return last
+
+    indexes = getattr(_cache, "indexes", None)
+    if indexes is None:
+        indexes = _cache.indexes = OrderedDict()
+    key = (id(team_left), id(team_right))
+    index = indexes.get(key)
+    # id списка мог достаться новому списку после сборки мусора -> сверяем сами списки
+    if index is None or index.teams[LEFT] is not team_left or index.teams[RIGHT] is not team_right:
+        index = indexes[key] = TeamIndex(team_left, team_right)
+        if len(indexes) > CACHE_SIZE:
+            indexes.popitem(last=False)
+    else:
+        indexes.move_to_end(key)
+    _cache.last = index
+    return index
+
+
+def invalidate_team_index(team: list = None):
+    """Сбрасывает индексы текущего потока с этим списком команды (None - все) после правки состава на месте."""
+    def affected(index):
+        return team is None or any(t is team for t in index.teams)
+
+    indexes = getattr(_cache, "indexes", None)
+    if indexes:
+        for key in [k for k, index in indexes.items() if affected(index)]:
+            del indexes[key]
+    last = getattr(_cache, "last", None)
+    if last is not None and affected(last):
+        _cache.last = None
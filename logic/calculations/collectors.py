@@ -1,10 +1,11 @@
 from core.logging import logger, LogLevel
+from logic.calculations.stat_cache import Contribution
 from logic.character_changing.passives import PASSIVE_REGISTRY
 from logic.statuses.status_definitions import STATUS_REGISTRY
 from logic.weapon_definitions import WEAPON_REGISTRY
 
 
-def collect_ability_bonuses(unit, source_list, registry, prefix_icon, mods, bonuses):
+def collect_ability_bonuses(unit, source_list, registry, prefix_icon, contributions):
     """
     Сбор бонусов от списков способностей (Пассивки, Таланты, Аугментации).
     """
@@ -14,21 +15,18 @@ def collect_ability_bonuses(unit, source_list, registry, prefix_icon, mods, bonu
             if hasattr(obj, "on_calculate_stats"):
                 bonus_dict = obj.on_calculate_stats(unit)
                 if bonus_dict:
-                    _apply_smart_bonuses(obj.name, bonus_dict, mods, bonuses, prefix_icon)
+                    contributions.append(Contribution(obj.name, bonus_dict, prefix_icon))
 
 
-def collect_weapon_bonuses(unit, mods, bonuses):
+def collect_weapon_bonuses(unit, contributions):
     """
     Сбор бонусов от оружия (базовые статы + встроенная пассивка).
     """
     if unit.weapon_id in WEAPON_REGISTRY:
         wep = WEAPON_REGISTRY[unit.weapon_id]
         if wep.id != "none":
-            # Логируем название оружия
-            logger.log(f"⚔️ Weapon equipped: {wep.name}", LogLevel.VERBOSE, "Stats")
-
             # 1. Обычные статы оружия
-            _apply_smart_bonuses("Weapon", wep.stats, mods, bonuses, None)
+            contributions.append(Contribution("Weapon", wep.stats, None, f"⚔️ Weapon equipped: {wep.name}"))
 
             # 2. Статы от пассивки оружия
             if wep.passive_id and wep.passive_id in PASSIVE_REGISTRY:
@@ -36,14 +34,14 @@ def collect_weapon_bonuses(unit, mods, bonuses):
                 if hasattr(p_obj, "on_calculate_stats"):
                     bonus_dict = p_obj.on_calculate_stats(unit)
                     if bonus_dict:
-                        _apply_smart_bonuses(f"{p_obj.name} (Wep)", bonus_dict, mods, bonuses, "⚔️")
+                        contributions.append(Contribution(f"{p_obj.name} (Wep)", bonus_dict, "⚔️"))
 
 
-def collect_status_bonuses(unit, mods, bonuses):
+def collect_status_bonuses(unit, contributions):
     """
     Сбор бонусов от активных статусов.
     """
-    for status_id, stack in unit.statuses.items():
+    for status_id, stack in tuple(unit.statuses.items()):
         if status_id in STATUS_REGISTRY and stack > 0:
             st_obj = STATUS_REGISTRY[status_id]
             if hasattr(st_obj, 'on_calculate_stats'):
@@ -55,7 +53,17 @@ def collect_status_bonuses(unit, mods, bonuses):
                     bonus_dict = st_obj.on_calculate_stats(unit)
 
                 if bonus_dict:
-                    _apply_smart_bonuses(st_obj.id, bonus_dict, mods, bonuses, None)
+                    contributions.append(Contribution(st_obj.id, bonus_dict, None))
+
+
+def apply_contributions(contributions, mods, bonuses):
+    """
+    Распределяет собранные бонусы по mods и bonuses.
+    """
+    for c in contributions:
+        if c.note:
+            logger.log(c.note, LogLevel.VERBOSE, "Stats")
+        _apply_smart_bonuses(c.source, c.bonuses, mods, bonuses, c.icon)
 
 
 def _apply_smart_bonuses(source_name, bonus_dict, mods, bonuses, icon):
@@ -83,13 +91,13 @@ def _apply_smart_bonuses(source_name, bonus_dict, mods, bonuses, icon):
         if is_attribute and mode == "flat":
             bonuses[stat_name] += val
             if icon:
-                logger.log(f"{icon} {source_name}: {stat_name} {val:+}", LogLevel.VERBOSE, "Stats")
+                logger.log("%s %s: %s %+g", LogLevel.VERBOSE, "Stats", icon, source_name, stat_name, val)
         else:
             # [FIX] Убрали проверку "if stat_name in mods", так как mods это defaultdict
             mods[stat_name][mode] += val
 
             # Красивый лог
-            if icon:
+            if icon and logger.is_enabled(LogLevel.VERBOSE):
                 sign = "+" if val >= 0 else ""
                 suffix = "%" if mode == "pct" else ""
                 logger.log(f"{icon} {source_name}: {stat_name.upper()} {sign}{val}{suffix}", LogLevel.VERBOSE,
@@ -0,0 +1,76 @@
+from typing import NamedTuple, Optional
+
+
+class Contribution(NamedTuple):
+    """Бонус одного источника (пассивка, талант, оружие, статус) к статам."""
+    source: str
+    bonuses: dict
+    icon: Optional[str] = None
+    # Строка лога, которая пишется при применении бонуса
+    note: Optional[str] = None
+
+
+class StatCache:
+    """
+    Результат последнего пересчета статов юнита.
+    key = (входные данные юнита, бонусы всех источников). Пока ключ не изменился,
+    mods и производные значения (пулы, кубики скорости) берутся из кэша.
+    При копировании юнита кэш не копируется.
+    """
+    __slots__ = ("key", "mods", "max_hp", "max_sp", "max_stagger", "speed_dice", "speed_dice_count")
+
+    def __init__(self):
+        self.key = None
+
+    def store(self, key, unit):
+        self.key = key
+        self.mods = unit.modifiers
+        self.max_hp, self.max_sp, self.max_stagger = unit.max_hp, unit.max_sp, unit.max_stagger
+        self.speed_dice, self.speed_dice_count = unit.computed_speed_dice, unit.speed_dice_count
+
+    def restore(self, unit):
+        unit.modifiers = self.mods
+        unit.max_hp, unit.max_sp, unit.max_stagger = self.max_hp, self.max_sp, self.max_stagger
+        unit.computed_speed_dice, unit.speed_dice_count = self.speed_dice, self.speed_dice_count
+
+    def fork(self) -> "StatCache":
+        """Копия с тем же ключом для форка боя (mods не меняются на месте, поэтому разделяются)."""
+        twin = StatCache()
+        if self.key is not None:
+            for attr in self.__slots__:
+                setattr(twin, attr, getattr(self, attr))
+        return twin
+
+    def __copy__(self):
+        return StatCache()
+
+    def __deepcopy__(self, memo):
+        return StatCache()
+
+    def __reduce__(self):
+        return StatCache, ()
+
+
+def get_stat_cache(unit) -> StatCache:
+    cache = getattr(unit, "_stat_cache", None)
+    if cache is None:
+        cache = unit._stat_cache = StatCache()
+    return cache
+
+
+def stat_input_key(unit) -> tuple:
+    """Все поля юнита, от которых зависит пересчет (кроме бонусов источников)."""
+    return (
+        tuple(unit.attributes.items()), tuple(unit.skills.items()),
+        unit.level, tuple((lvl, tuple(r.items()) if isinstance(r, dict) else r)
+                          for lvl, r in unit.level_rolls.items()),
+        unit.base_hp, unit.base_sp, unit.base_intellect, unit.base_speed_min, unit.base_speed_max,
+        unit.implants_hp_flat, unit.implants_hp_pct, unit.implants_sp_flat, unit.implants_sp_pct,
+        unit.implants_stagger_flat, unit.implants_stagger_pct, unit.talents_hp_pct, unit.talents_sp_pct,
+        tuple(unit.passives), tuple(unit.talents), tuple(unit.augmentations), unit.weapon_id,
+    )
+
+
+def contributions_key(contributions) -> tuple:
+    """Снимок бонусов (значения копируются, поэтому изменение словаря источника будет замечено)."""
+    return tuple((c.source, tuple(c.bonuses.items())) for c in contributions)
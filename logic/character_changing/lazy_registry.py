@@ -0,0 +1,149 @@
+"""
+Ленивые реестры талантов и пассивок.
+
+Реестр знает все id по манифесту (id -> модуль и класс) и импортирует модуль
+механики только при первом обращении к ней. Манифест генерируется из исходников:
+
+    python -m logic.character_changing.lazy_registry          # пересобрать манифест
+    python -m logic.character_changing.lazy_registry --check  # проверить, что он актуален
+"""
+import ast
+import importlib
+import os
+import sys
+from collections.abc import Mapping
+
+# Пакеты с механиками: имя в манифесте -> пакет
+PACKAGES = {
+    "TALENT_MANIFEST": "logic.character_changing.talents",
+    "PASSIVE_MANIFEST": "logic.character_changing.passives",
+}
+# Модули, которые не регистрируются (базовые классы, шаблоны, тестовые пассивки)
+EXCLUDED_MODULES = {"__init__", "base_passive", "test_passives", "TEMPLATE_skill_check_talents"}
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "registry_manifest.py")
+
+
+class LazyRegistry(Mapping):
+    """
+    Словарь id -> экземпляр механики, который создает экземпляры по требованию.
+    Проверка `id in registry` и список ключей не импортируют ничего.
+    Созданный экземпляр - синглтон реестра (как в прежних словарях).
+    """
+
+    def __init__(self, package: str, manifest: dict):
+        self.package = package
+        self._manifest = manifest
+        self._items = {}
+
+    def _load(self, key):
+        module_name, class_name = self._manifest[key]
+        module = importlib.import_module(f"{self.package}.{module_name}")
+        obj = self._items[key] = getattr(module, class_name)()
+        return obj
+
+    def __getitem__(self, key):
+        obj = self._items.get(key)
+        if obj is None:
+            obj = self._load(key)
+        return obj
+
+    def get(self, key, default=None):
+        obj = self._items.get(key)
+        if obj is not None:
+            return obj
+        if key in self._manifest:
+            return self._load(key)
+        return default
+
+    def __contains__(self, key):
+        return key in self._manifest
+
+    def __iter__(self):
+        return iter(self._manifest)
+
+    def __len__(self):
+        return len(self._manifest)
+
+    def keys(self):
+        return self._manifest.keys()
+
+    def loaded(self) -> dict:
+        """Уже созданные экземпляры (без импорта остальных)."""
+        return dict(self._items)
+
+
+# === ГЕНЕРАЦИЯ МАНИФЕСТА ===
+
+def _class_id(node: ast.ClassDef):
+    """Строковый атрибут `id` в теле класса (или None)."""
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign) and isinstance(stmt.value, ast.Constant) \
+                and isinstance(stmt.value.value, str) \
+                and any(isinstance(t, ast.Name) and t.id == "id" for t in stmt.targets):
+            return stmt.value.value
+    return None
+
+
+def scan_package(package: str) -> dict:
+    """id -> (модуль, класс) по исходникам пакета (без импорта модулей)."""
+    folder = os.path.join(_ROOT, *package.split("."))
+    manifest = {}
+    for filename in sorted(os.listdir(folder)):
+        module_name, ext = os.path.splitext(filename)
+        if ext != ".py" or module_name in EXCLUDED_MODULES:
+            continue
+        with open(os.path.join(folder, filename), encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename)
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            mech_id = _class_id(node)
+            if mech_id is None:
+                continue
+            if mech_id in manifest:
+                raise ValueError(f"Duplicate id '{mech_id}': {manifest[mech_id]} and {(module_name, node.name)}")
+            manifest[mech_id] = (module_name, node.name)
+    return manifest
+
+
+def render_manifest() -> str:
+    lines = [
+        "# Сгенерировано: python -m logic.character_changing.lazy_registry",
+        "# Не редактировать вручную. id механики -> (модуль пакета, класс)",
+        "",
+    ]
+    for name, package in PACKAGES.items():
+        lines.append(f"{name} = {{")
+        for mech_id, (module_name, class_name) in scan_package(package).items():
+            lines.append(f"    {mech_id!r}: ({module_name!r}, {class_name!r}),")
+        lines.append("}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    content = render_manifest()
+    current = None
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            current = f.read()
+
+    if "--check" in argv:
+        if current != content:
+            print(f"{MANIFEST_PATH} is stale, run: python -m logic.character_changing.lazy_registry")
+            return 1
+        print("Manifest is up to date")
+        return 0
+
+    if current != content:
+        with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+            f.write(content)
+    print(f"Written {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
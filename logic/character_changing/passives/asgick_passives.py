@@ -69,9 +69,9 @@ class PassiveWitnessOfGroGoroth(BasePassive):
             ally_names = unit.memory.get('cached_allies_names', [])
             if not ally_names: return
 
-            # Импортируем streamlit для доступа к глобальным спискам команд
-            import streamlit as st
-            all_units = st.session_state.get('team_left', []) + st.session_state.get('team_right', [])
+            # Глобальные списки команд текущего боя
+            from logic.battle_flow.battle_scope import current_battle
+            all_units = current_battle().all_units()
 
             # Находим живые объекты по именам
             shared_names = []
@@ -98,7 +98,6 @@ class PassiveAxisUnity(BasePassive):
 
 from core.logging import logger, LogLevel
 from logic.character_changing.passives.base_passive import BasePassive
-import streamlit as st
 
 class PassivePseudoProtagonist(BasePassive):
     id = "pseudo_protagonist"
@@ -132,8 +131,12 @@ class PassivePseudoProtagonist(BasePassive):
             logger.log(f"📚 Pseudo Protagonist: {unit.name} gained {xp_gain} XP from {check_type} roll {check_result}",
                        LogLevel.NORMAL, "System")
 
-            # Тост для игрока
-            st.toast(f"Псевдо-ГГ: +{xp_gain} XP ({check_type})!", icon="📚")
+            # Тост для игрока (только в UI)
+            try:
+                import streamlit as st
+                st.toast(f"Псевдо-ГГ: +{xp_gain} XP ({check_type})!", icon="📚")
+            except Exception:
+                pass
 
     def on_luck_check(self, unit, result: int, **kwargs):
         """
@@ -75,8 +75,8 @@ class PassiveGanitar(BasePassive):
             if log_func: log_func("❌ Ганитар: Цели не найдены в памяти.")
             return False
 
-        import streamlit as st
-        all_units = st.session_state.get('team_left', []) + st.session_state.get('team_right', [])
+        from logic.battle_flow.battle_scope import current_battle
+        all_units = current_battle().all_units()
 
         count = 0
         names = []
@@ -51,9 +51,8 @@ class PassiveStances(BasePassive):
     def _get_all_units(self):
         """Получает всех юнитов в бою (вспомогательный метод)."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
-            return (l_team or []) + (r_team or [])
+            from logic.battle_flow.battle_scope import current_battle
+            return current_battle().all_units()
         except Exception:
             return []
 
@@ -123,38 +122,24 @@ class PassiveStances(BasePassive):
         return True
 
     def _load_deck_from_file(self, unit, filename: str):
-        """Загружает колоду карт из JSON файла."""
-        import json
-        import os
-        
-        filepath = os.path.join("data", "cards", filename)
-        
-        try:
-            if not os.path.exists(filepath):
-                logger.log(
-                    f"⚠️ Файл колоды не найден: {filepath}",
-                    LogLevel.NORMAL, "Passive"
-                )
-                return
-            
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            cards_list = data.get("cards", [])
-            
-            # Заменяем колоду на новую (список ID карт)
-            unit.deck = [card.get("id") for card in cards_list if card.get("id")]
-            
-            logger.log(
-                f"🃏 {self.name}: Загружена колода из {filename} ({len(unit.deck)} карт)",
-                LogLevel.NORMAL, "Passive"
-            )
-            
-        except Exception as e:
+        """Меняет колоду на карты файла-источника (из каталога Library, без чтения диска)."""
+        from core.library import Library
+
+        deck = Library.get_file_ids(filename)
+        if deck is None:
             logger.log(
-                f"⚠️ Ошибка загрузки колоды из {filename}: {e}",
+                f"⚠️ Файл колоды не найден: {filename}",
                 LogLevel.NORMAL, "Passive"
             )
+            return
+
+        # Заменяем колоду на новую (список ID карт)
+        unit.deck = deck
+
+        logger.log(
+            f"🃏 {self.name}: Загружена колода из {filename} ({len(unit.deck)} карт)",
+            LogLevel.NORMAL, "Passive"
+        )
 
     def modify_outgoing_damage(self, unit, amount, damage_type, stack=0, log_list=None, **kwargs):
         """
@@ -362,8 +347,11 @@ class PassiveLowEndurance(BasePassive):
     def on_round_start(self, unit, *args, **kwargs):
         """Проверяет номер сцены и накладывает дебафы после 6-й сцены."""
         try:
-            import streamlit as st
-            current_round = st.session_state.get('round_number', 1)
+            battle = kwargs.get("battle")
+            if battle is None:
+                from logic.battle_flow.battle_scope import current_battle
+                battle = current_battle()
+            current_round = battle.round_number
             
             # Если это 6-я или более поздняя сцена
             if current_round >= 6:
@@ -381,7 +369,7 @@ class PassiveLowEndurance(BasePassive):
                         LogLevel.NORMAL, "Passive"
                     )
         except Exception as e:
-            # Если streamlit не доступен (например, в тестах), игнорируем
+            # Если данные боя недоступны (например, в тестах), игнорируем
             logger.log(f"⚠️ Low Endurance check error: {e}", LogLevel.VERBOSE, "Passive")
             pass
 
@@ -403,15 +391,10 @@ class PassiveHardenedBySolitude(BasePassive):
     def _has_active_allies(self, unit):
         """Проверяет наличие активных союзников на поле боя."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.battle_scope import current_battle
             
             # Определяем команду юнита
-            my_team = None
-            if unit in (l_team or []):
-                my_team = l_team
-            elif unit in (r_team or []):
-                my_team = r_team
+            my_team = current_battle().team_of(unit)
             
             if not my_team:
                 logger.log(f"🔍 Solitude: {unit.name} team not found", LogLevel.VERBOSE, "Passive")
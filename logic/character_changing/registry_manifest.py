@@ -0,0 +1,276 @@
+# Сгенерировано: python -m logic.character_changing.lazy_registry
+# Не редактировать вручную. id механики -> (модуль пакета, класс)
+
+TALENT_MANIFEST = {
+    'electrician': ('branch_10_energy', 'TalentElectrician'),
+    'pain_points': ('branch_10_energy', 'TalentPainPoints'),
+    'mechanical_energy': ('branch_10_energy', 'TalentMechanicalEnergy'),
+    'pain_shock': ('branch_10_energy', 'TalentPainShock'),
+    'emergency_protection': ('branch_10_energy', 'TalentEmergencyProtection'),
+    'static_electricity': ('branch_10_energy', 'TalentStaticElectricity'),
+    'entering_rhythm': ('branch_10_energy', 'TalentEnteringRhythm'),
+    'dirty_tricks': ('branch_10_energy', 'TalentDirtyTricks'),
+    'playing_on_nerves': ('branch_10_energy', 'TalentPlayingOnNerves'),
+    'overvoltage': ('branch_10_energy', 'TalentOvervoltage'),
+    'em_field': ('branch_10_energy', 'TalentEMField'),
+    'with_caution': ('branch_10_energy', 'TalentWithCaution'),
+    'sharp_eye': ('branch_10_energy', 'TalentSharpEye'),
+    'team_player': ('branch_10_energy', 'TalentTeamPlayer'),
+    'arrest': ('branch_10_energy', 'TalentArrest'),
+    'battery': ('branch_10_energy', 'TalentBattery'),
+    'grounding': ('branch_10_energy', 'TalentGrounding'),
+    'feint': ('branch_10_energy', 'TalentFeint'),
+    'weak_point_energy': ('branch_10_energy', 'TalentWeakPointEnergy'),
+    'rupture_application': ('branch_10_energy', 'TalentRuptureApplication'),
+    'rifting_space': ('branch_10_energy', 'TalentRiftingSpace'),
+    'capacitor': ('branch_10_energy', 'TalentCapacitor'),
+    'achilles_heel': ('branch_10_energy', 'TalentAchillesHeel'),
+    'no_mistakes': ('branch_10_energy', 'TalentNoMistakes'),
+    'short_circuit': ('branch_10_energy', 'TalentShortCircuit'),
+    'pride_of_seven': ('branch_10_energy', 'TalentPrideOfSeven'),
+    'strike_iron_hot': ('branch_11_flame', 'TalentStrikeWhileIronHot'),
+    'spark': ('branch_11_flame', 'TalentSpark'),
+    'cauterization': ('branch_11_flame', 'TalentCauterization'),
+    'hot_talent': ('branch_11_flame', 'TalentHot'),
+    'body_adaptation': ('branch_11_flame', 'TalentBodyAdaptation'),
+    'hearth_of_power': ('branch_11_flame', 'TalentHearthOfPower'),
+    'ashes_to_ashes': ('branch_11_flame', 'TalentAshesToAshes'),
+    'hellfire': ('branch_11_flame', 'TalentHellfire'),
+    'wildfire': ('branch_11_flame', 'TalentWildfire'),
+    'fiery_temper': ('branch_11_flame', 'TalentFieryTemper'),
+    'ifrit': ('branch_11_flame', 'TalentIfrit'),
+    'phoenix': ('branch_11_flame', 'TalentPhoenix'),
+    'firestorm': ('branch_11_flame', 'TalentFirestorm'),
+    'burn_me_down': ('branch_11_flame', 'TalentBurnMeDown'),
+    'projection': ('branch_12_technologist', 'TalentProjection'),
+    'hacker': ('branch_12_technologist', 'TalentHacker'),
+    'little_helper': ('branch_12_technologist', 'TalentLittleHelper'),
+    'programming_languages': ('branch_12_technologist', 'TalentProgrammingLanguages'),
+    'portable_shield': ('branch_12_technologist', 'TalentPortableShield'),
+    'energy_cycle': ('branch_12_technologist', 'TalentEnergyCycle'),
+    'modulation': ('branch_12_technologist', 'TalentModulation'),
+    'access_point': ('branch_12_technologist', 'TalentAccessPoint'),
+    'error_404': ('branch_12_technologist', 'TalentError404'),
+    'ass_hack': ('branch_12_technologist', 'TalentAssHack'),
+    'best_friends_forever': ('branch_13_roboticist', 'TalentBestFriendsForever'),
+    'little_big_trouble': ('branch_13_roboticist', 'TalentLittleBigTrouble'),
+    'cell_expander': ('branch_13_roboticist', 'TalentCellExpander'),
+    'no_first_law': ('branch_13_roboticist', 'TalentNoFirstLaw'),
+    'bright_talent': ('branch_13_roboticist', 'TalentBrightTalent'),
+    'smaller_lighter_faster': ('branch_13_roboticist', 'TalentSmallerLighterFaster'),
+    'frame_upgrade': ('branch_13_roboticist', 'TalentFrameUpgrade'),
+    'made_to_last': ('branch_13_roboticist', 'TalentMadeToLast'),
+    'chimera_core': ('branch_13_roboticist', 'TalentChimeraCore'),
+    'upshot_robot': ('branch_13_roboticist', 'TalentUpshotRobot'),
+    'quantum_hub': ('branch_13_roboticist', 'TalentQuantumHub'),
+    'jack_of_all_trades': ('branch_13_roboticist', 'TalentJackOfAllTrades'),
+    'machina_ex_deo': ('branch_13_roboticist', 'TalentMachinaExDeo'),
+    'exogenesis_protocol': ('branch_13_roboticist', 'TalentExogenesisProtocol'),
+    'multi_connection': ('branch_13_roboticist', 'TalentMultiConnection'),
+    'fight_to_the_end': ('branch_14_tremor', 'TalentFightToTheEnd'),
+    'share_with_friend': ('branch_14_tremor', 'TalentShareWithFriend'),
+    'carelessness': ('branch_14_tremor', 'TalentCarelessness'),
+    'pass_the_fare': ('branch_14_tremor', 'TalentPassTheFare'),
+    'own_tremor': ('branch_14_tremor', 'TalentOwnTremor'),
+    'readiness_for_everything': ('branch_14_tremor', 'TalentReadinessForEverything'),
+    'keep_going': ('branch_14_tremor', 'TalentKeepGoing'),
+    'resonance': ('branch_14_tremor', 'TalentResonance'),
+    'immobile': ('branch_14_tremor', 'TalentImmobile'),
+    'tremor_to_bone': ('branch_14_tremor', 'TalentTremorToBone'),
+    'keep_it_together': ('branch_1_mindgames', 'TalentKeepItTogether'),
+    'center_of_balance': ('branch_1_mindgames', 'TalentCenterOfBalance'),
+    'tea_master': ('branch_1_mindgames', 'TalentTeaMaster'),
+    'mind_power': ('branch_1_mindgames', 'TalentMindPower'),
+    'peak_sanity': ('branch_1_mindgames', 'TalentPeakSanity'),
+    'psychic_strain': ('branch_1_mindgames', 'TalentPsychicStrain'),
+    'unbearable_presence': ('branch_1_mindgames', 'TalentUnbearablePresence'),
+    'emotional_storm': ('branch_1_mindgames', 'TalentEmotionalStorm'),
+    'safe_ego': ('branch_1_mindgames', 'TalentSafeEGO'),
+    'controlled_distortion': ('branch_1_mindgames', 'TalentControlledDistortion'),
+    'scanner': ('branch_2_best', 'TalentScanner'),
+    'deep_pockets': ('branch_2_best', 'TalentDeepPockets'),
+    'logistics': ('branch_2_best', 'TalentLogistics'),
+    'ace_of_all_trades': ('branch_2_best', 'TalentAceOfAllTrades'),
+    'skill_synergy': ('branch_2_best', 'TalentSynergy'),
+    'tireless_paragon': ('branch_2_best', 'TalentTireless'),
+    'momentum': ('branch_2_best', 'TalentMomentum'),
+    'limit_breaker': ('branch_2_best', 'TalentLimitBreaker'),
+    'plot_armor': ('branch_2_best', 'TalentPlotArmor'),
+    'universal_soldier': ('branch_2_best', 'TalentUniversalSoldier'),
+    'dominant': ('branch_2_best', 'TalentDominant'),
+    'vicious_mockery': ('branch_2_best', 'TalentViciousMockery'),
+    'verbal_barrier': ('branch_2_best', 'TalentVerbalBarrier'),
+    'tactical_analysis': ('branch_2_best', 'TalentTacticalAnalysis'),
+    'know_your_enemy': ('branch_2_best', 'TalentKnowYourEnemy'),
+    'card_shuffler': ('branch_2_best', 'TalentCardShuffler'),
+    'predictive_algo': ('branch_2_best', 'TalentPredictiveAlgo'),
+    'expose_weakness': ('branch_2_best', 'TalentExposeWeakness'),
+    'poker_face_rework': ('branch_2_best', 'TalentPokerFace'),
+    'merchant_of_death': ('branch_2_best', 'TalentMerchantOfDeath'),
+    'puppet_master': ('branch_2_best', 'TalentPuppetMaster'),
+    'opt_improvisation': ('branch_2_best', 'TalentImprovisation'),
+    'opt_social_eng': ('branch_2_best', 'TalentSocialEngineer'),
+    'opt_hoarder': ('branch_2_best', 'TalentHoarder'),
+    'foresight': ('branch_2_best', 'TalentForesight'),
+    'big_guy': ('branch_3_tireless', 'TalentBigGuy'),
+    'defense': ('branch_3_tireless', 'TalentDefense'),
+    'commendable_constitution': ('branch_3_tireless', 'TalentCommendableConstitution'),
+    'big_heart': ('branch_3_tireless', 'TalentBigHeart'),
+    'rock': ('branch_3_tireless', 'TalentRock'),
+    'despiteAdversities': ('branch_3_tireless', 'TalentDespiteAdversities'),
+    'heat_resistant': ('branch_3_tireless', 'TalentHeatResistant'),
+    'adaptation_tireless': ('branch_3_tireless', 'TalentAdaptationTireless'),
+    'tough_as_steel': ('branch_3_tireless', 'TalentToughAsSteel'),
+    'defender': ('branch_3_tireless', 'TalentDefender'),
+    'survivor': ('branch_3_tireless', 'TalentSurvivor'),
+    'muscle_overstrain': ('branch_3_tireless', 'TalentMuscleOverstrain'),
+    'idol_oath': ('branch_3_tireless', 'TalentIdolOath'),
+    'surgeOfStrength': ('branch_3_tireless', 'TalentSurgeOfStrength'),
+    'no_hippocratic_oath': ('branch_4_medic', 'TalentNoHippocraticOath'),
+    'good_as_new': ('branch_4_medic', 'TalentGoodAsNew'),
+    'remedy_good': ('branch_4_medic', 'TalentRemedyGood'),
+    'cheese': ('branch_4_medic', 'TalentCheese'),
+    'confete': ('branch_4_medic', 'TalentConfete'),
+    'you_wont_die_good': ('branch_4_medic', 'TalentYouWontDieGood'),
+    'careful_neutralization': ('branch_4_medic', 'TalentCarefulNeutralization'),
+    'doing_good_work': ('branch_4_medic', 'TalentDoingGoodWork'),
+    'not_today': ('branch_4_medic', 'TalentNotToday'),
+    'mad_good_doctor': ('branch_4_medic', 'TalentMadGoodDoctor'),
+    'toxicology_weapon': ('branch_4_medic', 'TalentToxicologyWeapon'),
+    'remedy_bad': ('branch_4_medic', 'TalentRemedyBad'),
+    'organ_striking': ('branch_4_medic', 'TalentOrganStriking'),
+    'advanced_toxicology': ('branch_4_medic', 'TalentAdvancedToxicology'),
+    'you_wont_die_bad': ('branch_4_medic', 'TalentYouWontDieBad'),
+    'medical_jargon': ('branch_4_medic', 'TalentMedicalJargon'),
+    'christmas_tree': ('branch_4_medic', 'TalentChristmasTree'),
+    'insane_zeal': ('branch_4_medic', 'TalentInsaneZeal'),
+    'genius_toxicologist': ('branch_4_medic', 'TalentGeniusToxicologist'),
+    'naked_defense': ('branch_5_berseker', 'TalentNakedDefense'),
+    'vengeful_payback': ('branch_5_berseker', 'TalentVengefulPayback'),
+    'berserker_rage': ('branch_5_berseker', 'TalentBerserkerRage'),
+    'naked_defense_2': ('branch_5_berseker', 'TalentNakedDefense2'),
+    'calm_mind': ('branch_5_berseker', 'TalentCalmMind'),
+    'frenzy': ('branch_5_berseker', 'TalentFrenzy'),
+    'catch_breath': ('branch_5_berseker', 'TalentCatchBreath'),
+    'raging_fury': ('branch_5_berseker', 'TalentRagingFury'),
+    'full_concentration': ('branch_5_berseker', 'TalentFullConcentration'),
+    'naked_defense_3': ('branch_5_berseker', 'TalentNakedDefense3'),
+    'descending_into_madness': ('branch_5_berseker', 'TalentDescendingIntoMadness'),
+    'steady_hand': ('branch_5_berseker', 'TalentSteadyHand'),
+    'key_moment': ('branch_5_berseker', 'TalentKeyMoment'),
+    'second_wind_berserk': ('branch_5_berseker', 'TalentSecondWindBerserk'),
+    'die_hard': ('branch_5_berseker', 'TalentDieHard'),
+    'hiding_in_smoke': ('branch_6_smoker', 'TalentHidingInSmoke'),
+    'smoke_universality': ('branch_6_smoker', 'TalentSmokeUniversality'),
+    'aerial_foot': ('branch_6_smoker', 'TalentAerialFoot'),
+    'smoke_screen': ('branch_6_smoker', 'TalentSmokeScreen'),
+    'recycling': ('branch_6_smoker', 'TalentRecycling'),
+    'self_preservation': ('branch_6_smoker', 'TalentSelfPreservation'),
+    'cleansing': ('branch_6_smoker', 'TalentCleansing'),
+    'experienced_smoker': ('branch_6_smoker', 'TalentExperiencedSmoker'),
+    'lung_processing': ('branch_6_smoker', 'TalentLungProcessing'),
+    'to_narnia': ('branch_6_smoker', 'TalentToNarnia'),
+    'smoke_advantage': ('branch_6_smoker', 'TalentSmokeAdvantage'),
+    'vulnerability_smoke': ('branch_6_smoker', 'TalentVulnerabilitySmoke'),
+    'thick_smoke': ('branch_6_smoker', 'TalentThickSmoke'),
+    'smoke_and_mirrors': ('branch_6_smoker', 'TalentSmokeAndMirrors'),
+    'deal_with_fortune': ('branch_7_luck', 'TalentDealWithFortune'),
+    'second_chance': ('branch_7_luck', 'TalentSecondChance'),
+    'sequential_luck': ('branch_7_luck', 'TalentSequentialLuck'),
+    'lucky_bastard': ('branch_7_luck', 'TalentLuckyBastard'),
+    'not_luck_just_skill': ('branch_7_luck', 'TalentJustSkill'),
+    'raise_stakes': ('branch_7_luck', 'TalentRaiseStakes'),
+    'azino_777': ('branch_7_luck', 'TalentAzino777'),
+    'blessed_by_fate': ('branch_7_luck', 'TalentBlessedByFate'),
+    'ace_sleeve': ('branch_7_luck', 'TalentAceSleeve'),
+    'impossible_possible': ('branch_7_luck', 'TalentImpossiblePossible'),
+    'athletic': ('branch_8_military', 'TalentAthletic'),
+    'fast_hands': ('branch_8_military', 'TalentFastHands'),
+    'leader': ('branch_8_military', 'TalentLeader'),
+    'addiction_is_a_bitch': ('branch_8_military', 'TalentAddiction'),
+    'rapid_retreat': ('branch_8_military', 'TalentRapidRetreat'),
+    'combat_reload': ('branch_8_military', 'TalentCombatReload'),
+    'find_vulnerability': ('branch_8_military', 'TalentFindVulnerability'),
+    'borrowed_time': ('branch_8_military', 'TalentBorrowedTime'),
+    'iron_formation': ('branch_8_military', 'TalentIronFormation'),
+    'last_hope': ('branch_8_military', 'TalentLastHope'),
+    'athleticism_shadow': ('branch_9_shadow', 'TalentAthleticismShadow'),
+    'revenge': ('branch_9_shadow', 'TalentRevenge'),
+    'not_great_attention': ('branch_9_shadow', 'TalentNotGreatAttention'),
+    'formidable_person': ('branch_9_shadow', 'TalentFormidablePerson'),
+    'smashing_blade': ('branch_9_shadow', 'TalentSmashingBlade'),
+    'slaughter': ('branch_9_shadow', 'TalentSlaughter'),
+    'trapmaster': ('branch_9_shadow', 'TalentTrapmaster'),
+    'fast_and_silent': ('branch_9_shadow', 'TalentFastAndSilent'),
+    'aggressive_parry': ('branch_9_shadow', 'TalentAggressiveParry'),
+    'step_into_shadow': ('branch_9_shadow', 'TalentStepIntoShadow'),
+    'taste_of_victory': ('branch_9_shadow', 'TalentTasteOfVictory'),
+    'sleight_of_hand': ('branch_9_shadow', 'TalentSleightOfHand'),
+    'cat_reflexes': ('branch_9_shadow', 'TalentCatReflexes'),
+    'endurance_lessons': ('branch_9_shadow', 'TalentEnduranceLessons'),
+    'eye_for_danger': ('branch_9_shadow', 'TalentEyeForDanger'),
+    'cold_blooded': ('branch_9_shadow', 'TalentColdBlooded'),
+    'identity_thief': ('branch_9_shadow', 'TalentIdentityThief'),
+    'covering_tracks': ('branch_9_shadow', 'TalentCoveringTracks'),
+    'competent_adrenaline': ('branch_9_shadow', 'TalentCompetentAdrenaline'),
+    'knife_in_back': ('branch_9_shadow', 'TalentKnifeInBack'),
+    'oppression': ('branch_9_shadow', 'TalentOppression'),
+    'vulnerability_point': ('branch_9_shadow', 'TalentVulnerabilityPoint'),
+    'extreme_measures': ('branch_9_shadow', 'TalentExtremeMeasures'),
+    'butcher': ('branch_9_shadow', 'TalentButcher'),
+    'censer': ('link_talents', 'TalentCenser'),
+    'ardent_defense': ('link_talents', 'TalentArdentDefense'),
+    'hitman_assortment': ('link_talents', 'TalentHitmanAssortment'),
+    'thermal_energy': ('link_talents', 'TalentThermalEnergy'),
+    'scorching_mastery': ('link_talents', 'TalentScorchingMastery'),
+}
+
+PASSIVE_MANIFEST = {
+    'witness_gro_goroth': ('asgick_passives', 'PassiveWitnessOfGroGoroth'),
+    'povar': ('asgick_passives', 'PassivePovar'),
+    'distortionGroGoroth': ('asgick_passives', 'PassiveDistortionGroGoroth'),
+    'food_lover': ('asgick_passives', 'PassiveFoodLover'),
+    'axis_unity': ('axis_passives', 'PassiveAxisUnity'),
+    'pseudo_protagonist': ('axis_passives', 'PassivePseudoProtagonist'),
+    'source_access': ('axis_passives', 'PassiveSourceAccess'),
+    'meta_awareness': ('axis_passives', 'PassiveMetaAwareness'),
+    'chthonic_nature': ('axis_passives', 'PassiveChthonic'),
+    'mech_annihilator': ('equipment_passives', 'PassiveAnnihilator'),
+    'mech_banganrang': ('equipment_passives', 'PassiveBanganrang'),
+    'mech_ganitar': ('equipment_passives', 'PassiveGanitar'),
+    'mech_limagun': ('equipment_passives', 'PassiveLimagun'),
+    'mech_phantom_razors': ('equipment_passives', 'PassivePhantomRazors'),
+    'coagulation': ('equipment_passives', 'PassiveCoagulation'),
+    'fanat_stagger_recovery': ('fanat_passives', 'PassiveFanatStaggerRecovery'),
+    'fanat_anti_defense': ('fanat_passives', 'PassiveFanatAntiDefense'),
+    'fanat_mark_hunter': ('fanat_passives', 'PassiveFanatMarkHunter'),
+    'fanat_reflect': ('fanat_passives', 'PassiveFanatReflect'),
+    'fanat_unwavering': ('fanat_passives', 'PassiveFanatUnwavering'),
+    'stances': ('leila_passives', 'PassiveStances'),
+    'fear_of_healing': ('leila_passives', 'PassiveFearOfHealing'),
+    'not_economically_minded': ('leila_passives', 'PassiveNotEconomicallyMinded'),
+    'social_phobia': ('leila_passives', 'PassiveSocialPhobia'),
+    'topographic_cretinism': ('leila_passives', 'PassiveTopographicCretinism'),
+    'sharp_mind': ('leila_passives', 'PassiveSharpMind'),
+    'low_endurance': ('leila_passives', 'PassiveLowEndurance'),
+    'hardened_by_solitude': ('leila_passives', 'PassiveHardenedBySolitude'),
+    'wag_tail': ('lilith_passives', 'PassiveWagTail'),
+    'backstreet_demon': ('lilith_passives', 'PassiveBackstreetDemon'),
+    'daughter_of_backstreets': ('lilith_passives', 'PassiveDaughterOfBackstreets'),
+    'hedonism': ('lilith_passives', 'PassiveHedonism'),
+    'live_fast_die_young': ('lilith_passives', 'PassiveLiveFastDieYoung'),
+    'accelerated_learning': ('lima_passives', 'PassiveAcceleratedLearning'),
+    'art_of_self_defense': ('lima_passives', 'TalentArtOfSelfDefense'),
+    'lucky_streak': ('lima_passives', 'PassiveLuckyStreak'),
+    'four_eyes': ('lima_passives', 'PassiveFourEyes'),
+    'hunters_vedas': ('lima_passives', 'PassiveHuntersVedas'),
+    'mind_suppression': ('lima_passives', 'PassiveMindSuppression'),
+    'ship_of_theseus': ('lima_passives', 'PassiveShipOfTheseus'),
+    'wild_cityscape': ('lima_passives', 'PassiveWildCityscape'),
+    's_cells': ('rein_passives', 'PassiveSCells'),
+    'new_discovery': ('rein_passives', 'PassiveNewDiscovery'),
+    'red_lycoris': ('rein_passives', 'TalentRedLycoris'),
+    'shadow_majesty': ('rein_passives', 'TalentShadowOfMajesty'),
+    'severe_training': ('zafiel_passives', 'PassiveSevereTraining'),
+    'adaptation': ('zafiel_passives', 'PassiveAdaptation'),
+}
@@ -317,9 +317,8 @@ class TalentArrest(BasePassive):
     def _get_battle_targets(self):
         """Возвращает всех участников боя (левая + правая команды), если симулятор запущен."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams  # type: ignore
-            l_team, r_team = get_teams()
-            return (l_team or []) + (r_team or [])
+            from logic.battle_flow.battle_scope import current_battle
+            return current_battle().all_units()
         except Exception:
             return []
 
@@ -535,9 +534,8 @@ class TalentAchillesHeel(BasePassive):
     def _get_battle_targets(self):
         """Возвращает всех участников боя (враги), аналогично Аресту."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams  # type: ignore
-            l_team, r_team = get_teams()
-            return (l_team or []) + (r_team or [])
+            from logic.battle_flow.battle_scope import current_battle
+            return current_battle().all_units()
         except Exception:
             return []
 
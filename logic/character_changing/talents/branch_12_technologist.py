@@ -37,8 +37,8 @@ class TalentHacker(BasePassive):
         # Заглушка механики взлома
         # Нужно выбрать цель, кинуть дайс и сравнить
         prog = unit.skills.get("programming", 0)
-        import random
-        roll = random.randint(1, 20) + prog
+        from logic.battle_flow.battle_scope import get_rng
+        roll = get_rng().randint(1, 20) + prog
         if log_func: log_func(f"💻 **Взлом**: Бросок {roll} (1d20+{prog}).")
         logger.log(f"💻 Hacker attempt by {unit.name}: Roll {roll}", LogLevel.NORMAL, "Talent")
         return True
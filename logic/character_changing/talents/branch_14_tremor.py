@@ -1,7 +1,6 @@
-import random
-
 from core.logging import logger, LogLevel  # [NEW] Import
 from logic.character_changing.passives.base_passive import BasePassive
+from logic.battle_flow.battle_scope import get_rng
 
 
 # ==========================================
@@ -143,7 +142,7 @@ class TalentKeepGoing(BasePassive):
             tremor = unit.get_status("tremor")
             if tremor > 0:
                 # Шанс спасения (Заглушка броска, допустим d20)
-                roll = random.randint(1, 20)
+                roll = get_rng().randint(1, 20)
                 if roll < tremor:
                     # Спасение!
                     unit.current_hp = 1  # Не умираем
@@ -53,10 +53,8 @@ class TalentDefense(BasePassive):
         # 4. Создаем и добавляем кубики
         for _ in range(count):
             # Создаем кубик с динамическими значениями
-            die = Dice(base_min, base_max, DiceType.BLOCK, is_counter=True)
-
             # Флаг для работы других талантов (3.5, 3.8)
-            die.flags = ["talent_defense_die"]
+            die = Dice(base_min, base_max, DiceType.BLOCK, is_counter=True, flags=("talent_defense_die",))
 
             unit.counter_dice.append(die)
 
@@ -375,8 +375,8 @@ class TalentDieHard(BasePassive):
         # Реализуем "Иммунитет к негативу"
         # Если куб абсолютный (эмулируем каждый 3-й куб или просто рандомно 33%)
         # Для простоты: 33% шанс что куб "Абсолютный"
-        import random
-        if random.random() < 0.33:
+        from logic.battle_flow.battle_scope import get_rng
+        if get_rng().random() < 0.33:
             # Снимаем штрафы силы, если они есть (power < 0)
             # В текущей архитектуре это сложно отменить постфактум,
             # но мы можем добавить компенсирующий бонус
@@ -1,7 +1,6 @@
-import random
-
 from core.logging import logger, LogLevel  # [NEW] Import
 from logic.character_changing.passives.base_passive import BasePassive
+from logic.battle_flow.battle_scope import get_rng
 
 
 # ==========================================
@@ -97,7 +96,7 @@ class TalentJustSkill(BasePassive):
 
     def activate(self, unit, log_func, **kwargs):
         # Заглушка использования
-        roll = random.randint(1, 5) + 5
+        roll = get_rng().randint(1, 5) + 5
         if log_func: log_func(f"🎲 **Золотая кость**: +{roll} к результату!")
         logger.log(f"🎲 Golden Die: Added +{roll} to {unit.name}'s check", LogLevel.NORMAL, "Talent")
         return True
@@ -171,7 +170,7 @@ class TalentAceSleeve(BasePassive):
         # Заглушка сложности 5
         difficulty = 5
         bonus = luck // difficulty
-        roll = random.randint(1, 20) + bonus
+        roll = get_rng().randint(1, 20) + bonus
         if log_func: log_func(f"🃏 **Туз в рукаве**: {roll} (1d20+{bonus})")
         logger.log(f"🃏 Ace in the Sleeve: {unit.name} rolled {roll} (Bonus +{bonus})", LogLevel.NORMAL, "Talent")
         return True
@@ -1,10 +1,9 @@
-import random
-
 from core.enums import DiceType
 from core.logging import logger, LogLevel  # [NEW] Import
 from core.tree_data import SKILL_TREE
 from logic.character_changing.passives.base_passive import BasePassive
 from logic.context import RollContext
+from logic.battle_flow.battle_scope import get_rng
 
 
 # ==========================================
@@ -148,7 +147,7 @@ class TalentSmashingBlade(BasePassive):
             bleed_stack = 0
             rolls = []
             for _ in range(x_count):
-                r = random.randint(1, 6)
+                r = get_rng().randint(1, 6)
                 bleed_stack += r
                 rolls.append(str(r))
 
@@ -199,7 +198,7 @@ class TalentSlaughter(BasePassive):
 # 9.3 (Опц) Trapmaster
 # ==========================================
 class TalentTrapmaster(BasePassive):
-    id = "trapmaster WIP"
+    id = "trapmaster"
     name = "Trapmaster WIP"
     description = "9.3 Опц: Рецепты ловушек. Спас-бросок врага (Int) против вашего (Engineering)."
     is_active_ability = False
@@ -1,4 +1,6 @@
 from core.logging import logger, LogLevel
+from core.profiler import traced
+from logic.battle_flow.battle_scope import get_rng
 from logic.battle_flow.clash.clash_flow import ClashFlowMixin
 from logic.battle_flow.executor import execute_single_action
 from logic.battle_flow.lifecycle import prepare_turn, finalize_turn
@@ -11,28 +13,33 @@ class ClashSystem(ClashFlowMixin):
     Делегирует задачи специализированным модулям.
     """
 
-    def __init__(self):
+    def __init__(self, rng=None):
         self.logs = []
+        # RNG боя: явно переданный, RNG активного боя или глобальный random (UI)
+        self.rng = rng if rng is not None else get_rng()
 
     def log(self, message):
         self.logs.append(message)
         # Можно дублировать в системный лог, если нужно
         # logger.log(message, LogLevel.VERBOSE, "Engine")
 
-    # Статический метод для доступа из UI (precalculate_interactions)
+    # Статический метод для внешнего кода (обе стороны сразу: InteractionGraph.resolve_redirections)
     @staticmethod
     def calculate_redirections(atk_team: list, def_team: list):
         return calculate_redirections(atk_team, def_team)
 
+    @traced(cat="turn")
     def prepare_turn(self, team_left: list, team_right: list):
         return prepare_turn(self, team_left, team_right)
 
     def execute_single_action(self, act, executed_slots):
         return execute_single_action(self, act, executed_slots)
 
+    @traced(cat="turn")
     def finalize_turn(self, all_units: list):
         return finalize_turn(self, all_units)
 
+    @traced(cat="turn")
     def resolve_turn(self, team_left: list, team_right: list):
         """
         ГЛАВНЫЙ МЕТОД (Pipeline).
@@ -37,6 +37,21 @@ class RollContext:
     is_critical: bool = False
     is_disadvantage: bool = False
 
+    # Контекст боя (команды, раунд); определяется при первом обращении к ctx.battle
+    _battle: Optional['BattleContext'] = field(default=None, repr=False)
+
+    @property
+    def battle(self) -> 'BattleContext':
+        """BattleContext боя, в котором сделан бросок (команды, живые, номер раунда)."""
+        if self._battle is None:
+            from logic.battle_flow.battle_scope import current_battle
+            self._battle = current_battle()
+        return self._battle
+
+    @battle.setter
+    def battle(self, value: 'BattleContext'):
+        self._battle = value
+
     # =========================================================================
     # ОСНОВНЫЕ МЕТОДЫ БРОСКА
     # =========================================================================
@@ -150,7 +165,7 @@ class RollContext:
                 obj.on_roll(self, stack=stack)
 
         # 2. Статусы
-        for status_id, amount in self.source.statuses.items():
+        for status_id, amount in tuple(self.source.statuses.items()):
             if amount > 0 and status_id in STATUS_REGISTRY:
                 st_obj = STATUS_REGISTRY[status_id]
                 if hasattr(st_obj, "on_roll"):
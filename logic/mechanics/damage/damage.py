@@ -1,4 +1,5 @@
 from core.logging import logger, LogLevel
+from core.profiler import traced
 from logic.calculations.base_calc import get_modded_value
 from logic.mechanics.damage.damage_calc import _calculate_resistance, _calculate_outgoing_damage
 # Импортируем из новых модулей
@@ -36,6 +37,7 @@ def _apply_stagger_side_damage(target, attacker_ctx, final_amt):
     logger.log(f"😵 {target.name} took {stg_dmg} Stagger Side-Damage (Res: {res_stg:.2f})", LogLevel.MINIMAL, "Damage")
 
 
+@traced(cat="damage")
 def deal_direct_damage(source_ctx, target, amount: int, dmg_type: str, trigger_event_func):
     """Наносит прямой урон (эффекты, скрипты и т.д.) без конвертации типов."""
     if amount <= 0: return
@@ -111,6 +113,7 @@ def deal_direct_damage(source_ctx, target, amount: int, dmg_type: str, trigger_e
         )
 
 
+@traced(cat="damage")
 def apply_damage(attacker_ctx, defender_ctx, dmg_type="hp",
                  trigger_event_func=None, script_runner_func=None):
     """
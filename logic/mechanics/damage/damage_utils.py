@@ -1,4 +1,5 @@
 from core.logging import logger, LogLevel
+from logic.battle_flow.battle_scope import record_damage
 
 def _check_death_threshold(unit, current_val, max_val, resource_name):
     if current_val <= 0:
@@ -33,6 +34,7 @@ def _apply_resource_damage(target, amount: int, resource_type: str, source_ctx,
 
         if source_ctx: source_ctx.log.append(hit_msg)
         logger.log(f"💥 {target.name} took {amount} HP Damage", LogLevel.MINIMAL, "Damage")
+        record_damage(source_ctx.source if source_ctx else None, target, amount, "hp")
 
     elif resource_type == "sp":
         new_val = target.current_sp - amount
@@ -43,4 +45,5 @@ def _apply_resource_damage(target, amount: int, resource_type: str, source_ctx,
             if target.current_sp == 0 and target.overkill_damage > 0:
                 source_ctx.log.append(f"🤯 **PANIC/DEATH**: Overkill {target.overkill_damage}")
 
-        logger.log(f"🧠 {defender_name_safe(target)} took {amount} SP Damage (White)", LogLevel.MINIMAL, "Damage")
\ No newline at end of file
+        logger.log(f"🧠 {defender_name_safe(target)} took {amount} SP Damage (White)", LogLevel.MINIMAL, "Damage")
+        record_damage(source_ctx.source if source_ctx else None, target, amount, "sp")
\ No newline at end of file
@@ -0,0 +1,291 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from core.enums import CardType, DiceType
+from logic.battle_flow.clash.clash_utils import check_destruction_immunity
+from logic.battle_flow.speed import calculate_speed_advantage
+from logic.calculations.base_calc import get_modded_value
+from logic.context import RollContext
+from logic.mechanics.rolling.rolling_calc import apply_roll_modifiers
+
+ATK_TYPES = (DiceType.SLASH, DiceType.PIERCE, DiceType.BLUNT)
+MASS_TYPES = (CardType.MASS_SUMMATION.value, CardType.MASS_INDIVIDUAL.value)
+
+# Режим броска: худший из 2 / обычный / лучший из 2
+DISADVANTAGE, NORMAL, ADVANTAGE = -1, 0, 1
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """
+    Распределение итогового значения кубика: P(value = low + i) = pmf[i].
+    low может быть дробным (процентные модификаторы силы).
+    """
+    low: float
+    pmf: np.ndarray
+
+    @property
+    def values(self) -> np.ndarray:
+        return np.arange(self.low, self.low + len(self.pmf))
+
+    @property
+    def mean(self) -> float:
+        return float(self.values @ self.pmf)
+
+    def prob_below(self, values: np.ndarray) -> np.ndarray:
+        """P(X < v) для каждого v из values."""
+        cdf = np.concatenate(([0.0], np.cumsum(self.pmf)))
+        return cdf[np.searchsorted(self.values, values, side="left")]
+
+
+@dataclass(frozen=True)
+class DieOdds:
+    """Исход одной пары кубиков (с точки зрения первой стороны)."""
+    win: float
+    draw: float
+    loss: float
+    # Ожидаемый урон HP / Stagger, нанесенный противнику и полученный от него
+    dmg_dealt: float = 0.0
+    dmg_taken: float = 0.0
+    stagger_dealt: float = 0.0
+    stagger_taken: float = 0.0
+
+
+# =========================================================================
+# РАСПРЕДЕЛЕНИЯ
+# =========================================================================
+
+@lru_cache(maxsize=1024)
+def _base_pmf(min_val: int, max_val: int, mode: int) -> Tuple[int, np.ndarray]:
+    """Базовый бросок safe_randint с учетом Преимущества/Помехи (max/min из двух)."""
+    if min_val > max_val:
+        min_val, max_val = max_val, min_val
+    n = max_val - min_val + 1
+    cdf = np.arange(1, n + 1) / n
+
+    if mode == ADVANTAGE:
+        cdf = cdf ** 2
+    elif mode == DISADVANTAGE:
+        cdf = 1.0 - (1.0 - cdf) ** 2
+
+    pmf = np.diff(cdf, prepend=0.0)
+    pmf.setflags(write=False)
+    return min_val, pmf
+
+
+def static_roll_bonus(unit, die, card=None) -> int:
+    """
+    Прибавка к броску, известная до боя: статы и оружие (как в apply_roll_modifiers)
+    плюс Сила/Стойкость/Ослабление атаки. Скрипты карт и прочие хуки on_roll не учитываются.
+    """
+    if card is not None and "unchangeable" in card.flags:
+        return 0
+
+    ctx = RollContext(source=unit, target=None, dice=die)
+    apply_roll_modifiers(ctx, unit, die)
+    bonus = ctx.final_value
+
+    if die.dtype in ATK_TYPES:
+        bonus += unit.get_status("strength") - unit.get_status("attack_power_down")
+    elif die.dtype in (DiceType.BLOCK, DiceType.EVADE):
+        bonus += unit.get_status("endurance")
+    return bonus
+
+
+def roll_distribution(unit, die, card=None, mode: int = NORMAL) -> Distribution:
+    """Точное распределение итогового значения кубика юнита."""
+    base_min, base_max = die.min_val, die.max_val
+    if hasattr(unit, "apply_mechanics_filter"):
+        base_min = unit.apply_mechanics_filter("modify_dice_min", base_min, die=die)
+        base_max = unit.apply_mechanics_filter("modify_dice_max", base_max, die=die)
+
+    low, pmf = _base_pmf(base_min, base_max, mode)
+
+    # Паралич срезает бросок до минимума кубика
+    if unit.get_status("paralysis") > 0:
+        low, pmf = die.min_val, np.ones(1)
+
+    return Distribution(low + static_roll_bonus(unit, die, card), pmf)
+
+
+def _roll_modes(unit, count: int, is_disadvantage: bool) -> List[int]:
+    """Режим каждого броска: стаки advantage тратятся по одному на бросок (как в calculate_base_roll)."""
+    adv_stacks = unit.get_status("advantage")
+    modes = []
+    for _ in range(count):
+        has_adv = adv_stacks > 0
+        if has_adv:
+            adv_stacks -= 1
+        if is_disadvantage and has_adv:
+            modes.append(NORMAL)
+        elif is_disadvantage:
+            modes.append(DISADVANTAGE)
+        else:
+            modes.append(ADVANTAGE if has_adv else NORMAL)
+    return modes
+
+
+# =========================================================================
+# УРОН
+# =========================================================================
+
+def _hit_damage(attacker, target, die, values: np.ndarray) -> np.ndarray:
+    """HP урон удара значением v (damage_deal, damage_take, сопротивление, порог)."""
+    dmg = np.maximum(0, values + get_modded_value(0, "damage_deal", attacker.modifiers))
+    dmg = np.maximum(0, dmg - get_modded_value(0, "damage_take", target.modifiers))
+
+    res = getattr(target.hp_resists, die.dtype.value.lower(), 1.0)
+    if target.is_staggered():
+        res = max(res, 2.0)
+    dmg = (dmg * res).astype(int)
+
+    threshold = get_modded_value(0, "damage_threshold", target.modifiers)
+    return np.where(dmg < threshold, 0, dmg)
+
+
+def _expected_win_damage(dist_w: Distribution, dist_l: Distribution, winner, loser, die) -> float:
+    """E[урон победителя] = sum_v P(W=v) * P(L<v) * dmg(v)."""
+    values = dist_w.values
+    return float(np.sum(dist_w.pmf * dist_l.prob_below(values) * _hit_damage(winner, loser, die, values)))
+
+
+def _expected_margin(diffs: np.ndarray, diff_pmf: np.ndarray) -> float:
+    """E[max(0, A - B)] по распределению разности."""
+    return float(np.sum(diff_pmf * np.maximum(diffs, 0)))
+
+
+def die_odds(unit_a, die_a, dist_a: Distribution, unit_b, die_b, dist_b: Distribution) -> DieOdds:
+    """Исход столкновения двух кубиков (правила resolve_clash_round)."""
+    # Распределение A - B: свертка pmf_a с перевернутым pmf_b
+    diff_pmf = np.convolve(dist_a.pmf, dist_b.pmf[::-1])
+    diffs = np.arange(len(diff_pmf)) + (dist_a.low - (dist_b.low + len(dist_b.pmf) - 1))
+
+    win = float(diff_pmf[diffs > 0].sum())
+    draw = float(diff_pmf[diffs == 0].sum())
+    loss = max(0.0, 1.0 - win - draw)
+
+    atk_a, atk_b = die_a.dtype in ATK_TYPES, die_b.dtype in ATK_TYPES
+    dmg_dealt = dmg_taken = stg_dealt = stg_taken = 0.0
+
+    # Атака против атаки или уворота -> полный урон победителя
+    if atk_a and (atk_b or die_b.dtype == DiceType.EVADE):
+        dmg_dealt = _expected_win_damage(dist_a, dist_b, unit_a, unit_b, die_a)
+    if atk_b and (atk_a or die_a.dtype == DiceType.EVADE):
+        dmg_taken = _expected_win_damage(dist_b, dist_a, unit_b, unit_a, die_b)
+
+    # Атака против блока -> урон выдержке проигравшему на разницу
+    if (atk_a and die_b.dtype == DiceType.BLOCK) or (die_a.dtype == DiceType.BLOCK and atk_b):
+        stg_dealt = _expected_margin(diffs, diff_pmf)
+        stg_taken = _expected_margin(-diffs, diff_pmf)
+
+    return DieOdds(win, draw, loss, dmg_dealt, dmg_taken, stg_dealt, stg_taken)
+
+
+def _unopposed_odds(unit, die, dist: Distribution, target, reverse: bool = False) -> DieOdds:
+    """Кубик без пары: атака бьет односторонне, защита ничего не делает."""
+    dmg = 0.0
+    if die.dtype in ATK_TYPES:
+        dmg = float(np.sum(dist.pmf * _hit_damage(unit, target, die, dist.values)))
+    if reverse:
+        return DieOdds(0.0, 0.0, 1.0, dmg_taken=dmg)
+    return DieOdds(1.0, 0.0, 0.0, dmg_dealt=dmg)
+
+
+# =========================================================================
+# КАРТЫ
+# =========================================================================
+
+def _card_dice(card) -> list:
+    return list(card.dice_list) if card is not None else []
+
+
+def clash_odds(unit_a, card_a, unit_b, card_b, adv_a: bool = False, adv_d: bool = False,
+               destroy_a: bool = False, destroy_d: bool = False) -> List[DieOdds]:
+    """
+    Покубиковые шансы столкновения карт (с точки зрения unit_a).
+    adv_a/adv_d, destroy_a/destroy_d - результат calculate_speed_advantage.
+    Кубики сравниваются попарно по порядку, переброс (recycle) уворотов не учитывается.
+    """
+    dice_a = [] if destroy_a else _card_dice(card_a)
+    dice_b = [] if destroy_d else _card_dice(card_b)
+    modes_a = _roll_modes(unit_a, len(dice_a), adv_a)
+    modes_b = _roll_modes(unit_b, len(dice_b), adv_d)
+
+    result = []
+    for i in range(max(len(dice_a), len(dice_b))):
+        die_a = dice_a[i] if i < len(dice_a) else None
+        die_b = dice_b[i] if i < len(dice_b) else None
+        dist_a = roll_distribution(unit_a, die_a, card_a, modes_a[i]) if die_a else None
+        dist_b = roll_distribution(unit_b, die_b, card_b, modes_b[i]) if die_b else None
+
+        if die_a and die_b:
+            result.append(die_odds(unit_a, die_a, dist_a, unit_b, die_b, dist_b))
+        elif die_a:
+            result.append(_unopposed_odds(unit_a, die_a, dist_a, unit_b))
+        else:
+            result.append(_unopposed_odds(unit_b, die_b, dist_b, unit_a, reverse=True))
+    return result
+
+
+def onesided_odds(unit, card, target, is_disadvantage: bool = False) -> List[DieOdds]:
+    """Односторонняя атака: каждый атакующий кубик попадает (контр-кубики цели не учитываются)."""
+    dice = _card_dice(card)
+    modes = _roll_modes(unit, len(dice), is_disadvantage)
+    return [_unopposed_odds(unit, d, roll_distribution(unit, d, card, m), target) for d, m in zip(dice, modes)]
+
+
+def summarize_odds(odds: List[DieOdds]) -> Optional[dict]:
+    """Сводка для UI: средний шанс победы кубика и суммарный ожидаемый урон."""
+    if not odds:
+        return None
+    return {
+        "win": sum(o.win for o in odds) / len(odds),
+        "dmg_dealt": sum(o.dmg_dealt for o in odds),
+        "dmg_taken": sum(o.dmg_taken for o in odds),
+        "stagger_dealt": sum(o.stagger_dealt for o in odds),
+        "stagger_taken": sum(o.stagger_taken for o in odds),
+        "dice": odds,
+    }
+
+
+# =========================================================================
+# ШАНСЫ ДЛЯ СЛОТОВ (скорость -> помеха/разрушение, как в setup_*_parameters)
+# =========================================================================
+
+def has_dice(card) -> bool:
+    return card is not None and card.card_type not in MASS_TYPES and bool(card.dice_list)
+
+
+def slot_clash_odds(me, my_slot, enemy, e_slot) -> Optional[dict]:
+    """Шансы столкновения карт двух слотов (сводка summarize_odds)."""
+    my_card = my_slot.get('card')
+    e_card = e_slot.get('card') if e_slot else None
+    if not has_dice(my_card) and not has_dice(e_card):
+        return None
+    if not has_dice(e_card):
+        return slot_onesided_odds(me, my_slot, enemy, e_slot)
+
+    adv_a, adv_d, destroy_a, destroy_d = calculate_speed_advantage(
+        my_slot['speed'], e_slot['speed'],
+        my_slot.get('destroy_on_speed', True), e_slot.get('destroy_on_speed', True)
+    )
+    if destroy_d and check_destruction_immunity(me):
+        destroy_d, adv_a = False, True
+    if destroy_a and check_destruction_immunity(enemy):
+        destroy_a, adv_d = False, True
+
+    return summarize_odds(clash_odds(me, my_card if has_dice(my_card) else None, enemy, e_card,
+                                     adv_a, adv_d, destroy_a, destroy_d))
+
+
+def slot_onesided_odds(me, my_slot, enemy, e_slot) -> Optional[dict]:
+    """Ожидаемый урон односторонней атаки слота (сводка summarize_odds)."""
+    my_card = my_slot.get('card')
+    if not has_dice(my_card):
+        return None
+    spd_d = e_slot['speed'] if e_slot else 0
+    adv_atk, _, _, _ = calculate_speed_advantage(my_slot['speed'], spd_d, my_slot.get('destroy_on_speed', True), True)
+    return summarize_odds(onesided_odds(me, my_card, enemy, adv_atk))
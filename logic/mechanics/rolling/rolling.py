@@ -1,10 +1,16 @@
 from core.logging import logger, LogLevel
+from core.profiler import traced
 from logic.context import RollContext
 # Импортируем логику из новых файлов
 from logic.mechanics.rolling.rolling_calc import calculate_base_roll, apply_roll_modifiers
 from logic.mechanics.scripts import process_card_scripts
 
 
+def _trace_args(source, target, die, *args, **kwargs):
+    return {"unit": getattr(source, "name", "?"), "die": getattr(getattr(die, "dtype", None), "name", "?")}
+
+
+@traced("roll_context", "roll", describe=_trace_args)
 def create_roll_context(source, target, die, is_disadvantage=False) -> RollContext:
     if not die: return None
 
@@ -62,6 +68,6 @@ def create_roll_context(source, target, die, is_disadvantage=False) -> RollConte
     if hasattr(ctx, 'get_formatted_roll_log'):
         formula_text = ctx.get_formatted_roll_log()
         ctx.log.insert(0, formula_text)
-        logger.log(f"🎲 Final: {ctx.final_value} ({formula_text})", LogLevel.VERBOSE, "Roll")
+        logger.log("🎲 Final: %s (%s)", LogLevel.VERBOSE, "Roll", ctx.final_value, formula_text)
 
     return ctx
\ No newline at end of file
@@ -48,7 +48,7 @@ def calculate_base_roll(source, base_min, base_max, is_disadvantage):
         # Обычный
         roll = safe_randint(base_min, base_max)
         base_val = roll
-        logger.log(f"🎲 {source.name}: Rolled {roll} [{base_min}-{base_max}]", LogLevel.VERBOSE, "Roll")
+        logger.log("🎲 %s: Rolled %s [%s-%s]", LogLevel.VERBOSE, "Roll", source.name, roll, base_min, base_max)
 
     return roll, base_val, log_prefix, final_is_disadvantage
 
@@ -1,9 +1,10 @@
-import random
+from logic.battle_flow.battle_scope import get_rng
+
 
 def safe_randint(min_val: int, max_val: int) -> int:
     """
     Безопасный рандом: если min > max, меняет их местами.
     """
     if min_val > max_val:
-        return random.randint(max_val, min_val)
-    return random.randint(min_val, max_val)
\ No newline at end of file
+        return get_rng().randint(max_val, min_val)
+    return get_rng().randint(min_val, max_val)
\ No newline at end of file
@@ -1,8 +1,16 @@
 from core.logging import logger, LogLevel
+from core.profiler import profiler, MechanicProfiler
 from logic.context import RollContext
 from logic.scripts.card_scripts import SCRIPTS_REGISTRY
 
 
+def _run_script(script_id: str, trigger: str, ctx: RollContext, params: dict):
+    if profiler.active:
+        profiler.call(MechanicProfiler.SCRIPT, script_id, trigger, SCRIPTS_REGISTRY[script_id], ctx, params)
+    else:
+        SCRIPTS_REGISTRY[script_id](ctx, params)
+
+
 def process_card_scripts(trigger: str, ctx: RollContext):
     """Запускает скрипты, привязанные к конкретному кубику."""
     die = ctx.dice
@@ -13,7 +21,7 @@ def process_card_scripts(trigger: str, ctx: RollContext):
         params = script_data.get("params", {})
         if script_id in SCRIPTS_REGISTRY:
             logger.log(f"📜 Dice Script Trigger ({trigger}): {script_id}", LogLevel.VERBOSE, "Scripts")
-            SCRIPTS_REGISTRY[script_id](ctx, params)
+            _run_script(script_id, trigger, ctx, params)
 
 
 def process_card_self_scripts(trigger: str, source, target, custom_log_list=None, card_override=None):
@@ -34,7 +42,7 @@ def process_card_self_scripts(trigger: str, source, target, custom_log_list=None
         params = script_data.get("params", {})
         if script_id in SCRIPTS_REGISTRY:
             logger.log(f"📜 Card Script Trigger ({trigger}): {script_id}", LogLevel.VERBOSE, "Scripts")
-            SCRIPTS_REGISTRY[script_id](ctx, params)
+            _run_script(script_id, trigger, ctx, params)
 
 
 def trigger_unit_event(event_name, unit, *args, **kwargs):
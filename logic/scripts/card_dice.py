@@ -1,8 +1,8 @@
-import copy
 from typing import TYPE_CHECKING
 
 from core.enums import DiceType
 from core.logging import logger, LogLevel
+from logic.scripts.utils import _override_card
 
 if TYPE_CHECKING:
     from logic.context import RollContext
@@ -32,10 +32,8 @@ def repeat_dice_by_status(ctx: 'RollContext', params: dict):
     count = min(val, limit)
     if count > 0 and card.dice_list and len(card.dice_list) > die_idx:
         base_die = card.dice_list[die_idx]
-        new_dice = []
-        for _ in range(count):
-            new_dice.append(copy.deepcopy(base_die))
-        card.dice_list.extend(new_dice)
+        # Кубики неизменяемы -> повторы разделяют один объект
+        _override_card(unit, card.with_dice(card.dice_list + (base_die,) * count))
         if ctx.log: ctx.log.append(f"♻️ **{unit.name}** repeats dice {count} times (Status: {status_name})")
         logger.log(f"♻️ Dice Repeated {count} times due to {status_name}", LogLevel.VERBOSE, "Scripts")
 
@@ -67,15 +65,16 @@ def adaptive_damage_type(ctx: 'RollContext', params: dict):
     # 1. Если вызвано на конкретном кубике (on_roll)
     if ctx.dice:
         if ctx.dice.dtype != best_type:
-            ctx.dice.dtype = best_type
+            ctx.dice = ctx.dice.evolve(dtype=best_type)
             applied = True
 
     # 2. Если вызвано на карте (on_use), меняем все кубики карты
     elif ctx.source.current_card:
-        for d in ctx.source.current_card.dice_list:
-            if d.dtype != best_type:
-                d.dtype = best_type
-                applied = True
+        card = ctx.source.current_card
+        new_dice = tuple(d.evolve(dtype=best_type) if d.dtype != best_type else d for d in card.dice_list)
+        if any(a is not b for a, b in zip(new_dice, card.dice_list)):
+            _override_card(ctx.source, card.with_dice(new_dice))
+            applied = True
 
     if applied:
         msg = f"🔄 **Adaptive**: Dmg Type -> {best_type.name} (Res: {max_mult}x)"
@@ -1,10 +1,10 @@
-import copy
 import uuid
 from typing import TYPE_CHECKING
 
-import streamlit as st
-
 from core.logging import logger, LogLevel
+from logic.battle_flow.battle_scope import battle_of
+from logic.battle_flow.summon_templates import SummonTemplates
+from logic.battle_flow.team_index import invalidate_team_index
 
 if TYPE_CHECKING:
     from logic.context import RollContext
@@ -19,15 +19,8 @@ def apply_axis_team_buff(ctx: 'RollContext', params: dict):
     status = params.get("status")
     duration = int(params.get("duration", 1))
 
-    # 1. Определяем команду
-    my_team = []
-    if 'team_left' in st.session_state and source in st.session_state['team_left']:
-        my_team = st.session_state['team_left']
-    elif 'team_right' in st.session_state and source in st.session_state['team_right']:
-        my_team = st.session_state['team_right']
-
-    # 2. Ищем других живых союзников
-    other_allies = [u for u in my_team if u is not source and not u.is_dead()]
+    # 1-2. Другие живые союзники из команды кастующего
+    other_allies = battle_of(ctx).allies_of(source, include_self=False)
 
     if other_allies:
         for ally in other_allies:
@@ -55,11 +48,8 @@ def summon_ally(ctx: 'RollContext', params: dict):
         return
 
     # 1. Определяем команду
-    target_team_list = None
-    if 'team_left' in st.session_state and source in st.session_state['team_left']:
-        target_team_list = st.session_state['team_left']
-    elif 'team_right' in st.session_state and source in st.session_state['team_right']:
-        target_team_list = st.session_state['team_right']
+    battle = battle_of(ctx)
+    target_team_list = battle.team_of(source)
 
     if target_team_list is None: return
 
@@ -69,39 +59,19 @@ def summon_ally(ctx: 'RollContext', params: dict):
         logger.log(f"🚫 Summon failed for {source.name}: Team is full", LogLevel.NORMAL, "Summon")
         return
 
-    # 2. Ищем шаблон в Ростере
-    roster = st.session_state.get('roster', {})
-    template_unit = roster.get(unit_name)
+    # 2-3. Боец из кэшированного прототипа (шаблон из Ростера)
+    new_unit = SummonTemplates.spawn(battle.roster, unit_name)
 
-    if not template_unit:
-        for u in roster.values():
-            if u.name == unit_name:
-                template_unit = u
-                break
-
-    if not template_unit:
+    if new_unit is None:
         if ctx.log is not None: ctx.log.append(f"🚫 Summon Error: '{unit_name}' not found")
         return
 
-    # 3. Создаем копию
-    new_unit = copy.deepcopy(template_unit)
     unique_suffix = str(uuid.uuid4())[:4]
-    new_unit.name = f"{template_unit.name} ({unique_suffix})"
-
-    # Инициализация боя
-    new_unit.recalculate_stats()
-    new_unit.current_hp = new_unit.max_hp
-    new_unit.current_sp = new_unit.max_sp
-    new_unit.current_stagger = new_unit.max_stagger
-
-    new_unit.memory['start_of_battle_stats'] = {
-        'hp': new_unit.max_hp,
-        'sp': new_unit.max_sp,
-        'stagger': new_unit.max_stagger
-    }
+    new_unit.name = f"{new_unit.name} ({unique_suffix})"
 
     # 4. Добавляем в команду
     target_team_list.append(new_unit)
+    invalidate_team_index(target_team_list)
 
     msg = f"🤖 **Summon**: {new_unit.name} прибыл!"
     if ctx.log is not None: ctx.log.append(msg)
@@ -1,8 +1,7 @@
-import copy
 from typing import TYPE_CHECKING
 
 from core.logging import logger, LogLevel
-from logic.scripts.utils import _check_conditions
+from logic.scripts.utils import _check_conditions, _override_card
 
 if TYPE_CHECKING:
     from logic.context import RollContext
@@ -89,10 +88,8 @@ def repeat_dice_by_luck(ctx: 'RollContext', params: dict):
     # Берем первый кубик как шаблон
     template_die = card.dice_list[0]
 
-    # Добавляем копии
-    for _ in range(repeats):
-        new_die = copy.deepcopy(template_die)
-        card.dice_list.append(new_die)
+    # Добавляем копии (шаблон карты не меняется, создаем оверлей)
+    _override_card(ctx.source, card.with_dice(card.dice_list + (template_die,) * repeats))
 
     # Логируем и в UI, и в системный лог
     ctx.log.append(f"🍀 **Серия ударов**: Удача {luck} дала +{repeats} доп. кубиков!")
@@ -1,8 +1,8 @@
-import random
 from typing import TYPE_CHECKING
 
 from core.logging import logger, LogLevel
 from logic.scripts.utils import _check_conditions, _resolve_value, _get_targets
+from logic.battle_flow.battle_scope import get_rng
 
 if TYPE_CHECKING:
     from logic.context import RollContext
@@ -183,7 +183,7 @@ def remove_random_status(ctx: 'RollContext', params: dict):
 
     if not active_statuses: return
 
-    chosen_status = random.choice(active_statuses)
+    chosen_status = get_rng().choice(active_statuses)
     amount = int(params.get("amount", 1))
 
     target.remove_status(chosen_status, amount)
@@ -1,9 +1,7 @@
-import random
 from typing import TYPE_CHECKING
 
-import streamlit as st
-
 from core.logging import logger, LogLevel
+from logic.battle_flow.battle_scope import battle_of, get_rng
 
 if TYPE_CHECKING:
     pass
@@ -110,14 +108,9 @@ def _get_targets(ctx, target_mode: str):
         return res
     elif target_mode == "all_allies":
         source = ctx.source
-        my_team = []
-        if 'team_left' in st.session_state and source in st.session_state['team_left']:
-            my_team = st.session_state['team_left']
-        elif 'team_right' in st.session_state and source in st.session_state['team_right']:
-            my_team = st.session_state['team_right']
-
-        if not my_team: return [source]
-        return [u for u in my_team if not u.is_dead()]
+        battle = battle_of(ctx)
+        if battle.side_of(source) is None: return [source]
+        return battle.allies_of(source)
 
     return []
 
@@ -126,7 +119,7 @@ def _check_conditions(unit, params) -> bool:
     """Проверяет вероятность и требования к статам."""
     # 1. Вероятность (0.01 = 1%)
     prob = float(params.get("probability", 1.0))
-    if prob < 1.0 and random.random() > prob:
+    if prob < 1.0 and get_rng().random() > prob:
         logger.log(f"🎲 Script chance failed ({prob})", LogLevel.VERBOSE, "Scripts")
         return False
 
@@ -139,4 +132,22 @@ def _check_conditions(unit, params) -> bool:
             logger.log(f"🚫 Script requirement failed: {req_stat} {unit_val} < {req_val}", LogLevel.VERBOSE, "Scripts")
             return False
 
-    return True
\ No newline at end of file
+    return True
+
+def _override_card(unit, new_card):
+    """
+    Подменяет текущую карту юнита измененной копией (оверлей на раунд).
+    Шаблоны карт из Library неизменяемы, поэтому скрипты, меняющие кубики,
+    создают копию и ставят ее и в current_card, и в слот, из которого карта сыграна
+    (unit.current_slot). Если слот неизвестен - в первый слот с этой картой.
+    """
+    old_card = unit.current_card
+    unit.current_card = new_card
+    slot = getattr(unit, "current_slot", None)
+    if slot is not None and slot.get('card') is old_card:
+        slot['card'] = new_card
+        return
+    for slot in getattr(unit, "active_slots", []) or []:
+        if slot.get('card') is old_card:
+            slot['card'] = new_card
+            break
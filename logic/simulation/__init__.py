@@ -0,0 +1,3 @@
+from logic.simulation.session import BattleSession, BattleResult, load_team, pick_cards
+from logic.simulation.fork import fork_teams, fork_units, fork_value
+from logic.simulation.planner import suggest_plan, lookahead_cards, TurnPlan
@@ -0,0 +1,73 @@
+"""
+Headless-запуск боев без Streamlit.
+
+Пример:
+    python -m logic.simulation --left Лима --right Рейн --fights 10 --seed 42
+"""
+import argparse
+from collections import Counter
+
+from core.logging import logger
+from core.profiler import profiler
+from logic.simulation.session import BattleSession, load_team
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless LoR battle runner")
+    parser.add_argument("--left", nargs="+", required=True, help="Юниты/файлы команд левой стороны")
+    parser.add_argument("--right", nargs="+", required=True, help="Юниты/файлы команд правой стороны")
+    parser.add_argument("--fights", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-rounds", type=int, default=30)
+    parser.add_argument("--log-file", action="store_true", help="Писать лог в data/logs/full_battle_log.txt")
+    parser.add_argument("--profile", type=int, nargs="?", const=20, default=None, metavar="TOP",
+                        help="Замерять время механик и скриптов, вывести TOP строк (по умолчанию 20)")
+    parser.add_argument("--profile-csv", default=None, help="Сохранить полный отчет профилировщика в CSV")
+    parser.add_argument("--trace", nargs="?", const="", default=None, metavar="PATH",
+                        help="Записать трассировку в формате Chrome trace (по умолчанию data/logs/trace_*.json)")
+    args = parser.parse_args(argv)
+
+    if args.log_file:
+        logger.set_headless(True, file_output=True)
+    else:
+        logger.set_null_sink()
+
+    if args.profile is not None or args.profile_csv:
+        profiler.reset()
+        profiler.enable()
+    if args.trace is not None:
+        profiler.start_trace()
+
+    left, right = load_team(args.left), load_team(args.right)
+    outcomes = Counter()
+
+    for i in range(args.fights):
+        seed = None if args.seed is None else args.seed + i
+        result = BattleSession(left, right, seed=seed, max_rounds=args.max_rounds).run()
+        outcomes[result.winner] += 1
+        print(f"#{i + 1}: winner={result.winner} rounds={result.rounds} hp={result.hp_left}")
+
+    print(f"Total: left={outcomes['left']} right={outcomes['right']} draw={outcomes['draw']}")
+
+    if args.trace is not None:
+        profiler.stop_trace()
+        print(f"Trace saved to {profiler.tracer.save(args.trace or None)}")
+
+    if profiler.enabled:
+        _print_profile(args.profile or 20)
+        if args.profile_csv:
+            with open(args.profile_csv, "w", encoding="utf-8", newline="") as f:
+                f.write(profiler.to_csv())
+            print(f"Profile saved to {args.profile_csv}")
+
+
+def _print_profile(top: int):
+    rows = profiler.rows()
+    print(f"\n{'kind':<9} {'source':<28} {'hook':<34} {'calls':>7} {'total ms':>10} {'self ms':>10}")
+    for r in rows[:top]:
+        print(f"{r['kind']:<9} {str(r['source'])[:28]:<28} {r['hook'][:34]:<34} "
+              f"{r['calls']:>7} {r['total_ms']:>10.2f} {r['self_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
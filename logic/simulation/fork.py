@@ -0,0 +1,129 @@
+"""
+Быстрое ветвление живого боя (для превью "что если" и поиска с перебором ходов).
+
+Юниты копируются поштучно по полям, без сериализации и recalculate_stats:
+- карты, кубики и строки неизменяемые и разделяются;
+- контейнеры (слоты, статусы, кулдауны, память) копируются, ссылки на юниты, слоты
+  и списки команд внутри них переводятся на копии через общий memo (id оригинала -> копия);
+- кэш статов переносится вместе с ключом, кэш хуков строится заново.
+"""
+import copy
+from collections import defaultdict
+from enum import Enum
+
+from core.card import Card
+from core.dice import Dice
+from core.resistances import Resistances
+from core.unit.data.status_store import StatusStore
+from core.unit.mixins.mechanics import HookTable
+from core.unit.unit import Unit
+from logic.calculations.stat_cache import StatCache
+
+# Значения, которые можно разделять между копиями (кортежи здесь хранят только числа и строки)
+_SHARED = frozenset((str, int, float, bool, type(None), tuple, frozenset, Card, Dice))
+# Поля юнита, которые в бою не меняются на месте: modifiers заменяется целиком при пересчете,
+# анкетные данные правятся только в редакторах профиля (не в бою)
+_SHARED_FIELDS = frozenset(("modifiers", "level_rolls", "relationships", "money_log"))
+
+
+def _fork_dict(v, memo):
+    if not v and id(v) not in memo:
+        return {}
+    twin = memo.get(id(v))
+    if twin is None:
+        twin = memo[id(v)] = {k: (x if type(x) in _SHARED else fork_value(x, memo)) for k, x in v.items()}
+    return twin
+
+
+def _fork_list(v, memo):
+    if not v and id(v) not in memo:
+        return []
+    twin = memo.get(id(v))
+    if twin is None:
+        twin = memo[id(v)] = [x if type(x) in _SHARED else fork_value(x, memo) for x in v]
+    return twin
+
+
+def _fork_unit(v, memo):
+    # Юнит вне переданных команд (например, призыв из ростера) форкается целиком
+    twin = memo.get(id(v))
+    if twin is None:
+        twin = _new_twin(v, memo)
+        _fill_twin(v, twin, memo)
+    return twin
+
+
+def _fork_defaultdict(v, memo):
+    twin = memo.get(id(v))
+    if twin is None:
+        twin = memo[id(v)] = defaultdict(v.default_factory)
+        for k, x in v.items():
+            twin[k] = x if type(x) in _SHARED else fork_value(x, memo)
+    return twin
+
+
+_FORKERS = {
+    dict: _fork_dict,
+    list: _fork_list,
+    set: lambda v, memo: set(v),
+    StatusStore: lambda v, memo: v.fork(),
+    StatCache: lambda v, memo: v.fork(),
+    HookTable: lambda v, memo: HookTable(),
+    Resistances: lambda v, memo: Resistances(v.slash, v.pierce, v.blunt),
+    defaultdict: _fork_defaultdict,
+    Unit: _fork_unit,
+}
+
+
+def fork_value(value, memo: dict):
+    """Копия значения из состояния боя (ссылки на уже форкнутые юниты/слоты берутся из memo)."""
+    t = type(value)
+    if t in _SHARED:
+        return value
+    forker = _FORKERS.get(t)
+    if forker is not None:
+        return forker(value, memo)
+    if isinstance(value, Enum):
+        return value
+    if isinstance(value, Unit):
+        return _fork_unit(value, memo)
+    # Неизвестный тип: обычный deepcopy с тем же memo (ссылки на юниты сохранятся)
+    return copy.deepcopy(value, memo)
+
+
+def _new_twin(unit, memo):
+    twin = object.__new__(type(unit))
+    memo[id(unit)] = twin
+    return twin
+
+
+def _fill_twin(unit, twin, memo):
+    fields = twin.__dict__
+    for name, value in unit.__dict__.items():
+        if type(value) in _SHARED or name in _SHARED_FIELDS:
+            fields[name] = value
+        else:
+            fields[name] = fork_value(value, memo)
+
+
+def fork_units(units: list, memo: dict = None) -> list:
+    """Независимые копии юнитов. Сначала создаются все копии, чтобы перекрестные ссылки указывали на них."""
+    memo = {} if memo is None else memo
+    twins = [memo[id(u)] if id(u) in memo else _new_twin(u, memo) for u in units]
+    for unit, twin in zip(units, twins):
+        if not twin.__dict__:
+            _fill_twin(unit, twin, memo)
+    return twins
+
+
+def fork_teams(team_left: list, team_right: list, memo: dict = None):
+    """
+    Копии обеих команд. memo можно передать дальше в fork_value,
+    например для turn_actions (source/target_unit/slot_data перейдут на копии).
+    """
+    memo = {} if memo is None else memo
+    twins = fork_units(list(team_left) + list(team_right), memo)
+    left, right = twins[:len(team_left)], twins[len(team_left):]
+    memo[id(team_left)] = left
+    memo[id(team_right)] = right
+    return left, right
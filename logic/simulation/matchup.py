@@ -0,0 +1,257 @@
+"""
+Monte Carlo симуляция матчапов: N боев команды A против команды B в пуле процессов.
+
+Пример:
+    python -m logic.simulation.matchup --left Лима --right Рейн --fights 10000
+    python -m logic.simulation.matchup --all-pairs --fights 1000 --workers 8
+"""
+import argparse
+import itertools
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+
+from core.logging import logger
+from logic.simulation.session import BattleSession, load_team, UNITS_DIR
+
+# 95% доверительный интервал
+Z_95 = 1.96
+DEFAULT_CHUNK = 250
+
+
+@dataclass
+class RunningStat:
+    """Сумма и сумма квадратов: среднее и доверительный интервал без хранения выборки."""
+    n: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+
+    def add(self, value: float):
+        self.n += 1
+        self.total += value
+        self.total_sq += value * value
+
+    def merge(self, other: 'RunningStat'):
+        self.n += other.n
+        self.total += other.total
+        self.total_sq += other.total_sq
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.n if self.n else 0.0
+
+    @property
+    def ci(self) -> float:
+        """Полуширина 95% интервала для среднего."""
+        if self.n < 2: return 0.0
+        var = max(0.0, (self.total_sq - self.total * self.total / self.n) / (self.n - 1))
+        return Z_95 * math.sqrt(var / self.n)
+
+
+def wilson_interval(successes: int, n: int, z: float = Z_95):
+    """Интервал Уилсона для доли (устойчив при долях около 0 и 1)."""
+    if n == 0: return 0.0, 0.0
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+@dataclass
+class MatchupStats:
+    """Агрегированная статистика матчапа (сливается из чанков воркеров)."""
+    fights: int = 0
+    wins: dict = field(default_factory=lambda: {"left": 0, "right": 0, "draw": 0})
+    rounds: RunningStat = field(default_factory=RunningStat)
+    damage_dealt: dict = field(default_factory=dict)
+    stagger_count: dict = field(default_factory=dict)
+
+    def add_result(self, result):
+        self.fights += 1
+        self.wins[result.winner] += 1
+        self.rounds.add(result.rounds)
+
+        for key, dmg in result.damage_dealt.items():
+            self.damage_dealt.setdefault(key, RunningStat()).add(dmg)
+            self.stagger_count.setdefault(key, RunningStat()).add(result.stagger_count.get(key, 0))
+
+    def merge(self, other: 'MatchupStats'):
+        self.fights += other.fights
+        for k, v in other.wins.items():
+            self.wins[k] = self.wins.get(k, 0) + v
+        self.rounds.merge(other.rounds)
+        for src, dst in ((other.damage_dealt, self.damage_dealt), (other.stagger_count, self.stagger_count)):
+            for key, stat in src.items():
+                dst.setdefault(key, RunningStat()).merge(stat)
+
+    def mirrored(self) -> 'MatchupStats':
+        """Та же статистика с переставленными сторонами (бои B слева против A -> A против B)."""
+        def swap(key: str) -> str:
+            side, sep, rest = key.partition(":")
+            return {"left": "right", "right": "left"}.get(side, side) + sep + rest
+
+        twin = MatchupStats(fights=self.fights, rounds=replace(self.rounds))
+        twin.wins = {swap(k): v for k, v in self.wins.items()}
+        twin.damage_dealt = {swap(k): replace(v) for k, v in self.damage_dealt.items()}
+        twin.stagger_count = {swap(k): replace(v) for k, v in self.stagger_count.items()}
+        return twin
+
+    def win_rate(self, side: str = "left"):
+        """(доля побед, нижняя граница, верхняя граница)."""
+        wins = self.wins.get(side, 0)
+        low, high = wilson_interval(wins, self.fights)
+        return (wins / self.fights if self.fights else 0.0), low, high
+
+    def summary(self) -> str:
+        lines = [f"Fights: {self.fights}"]
+        for side in ("left", "right", "draw"):
+            rate, low, high = self.win_rate(side)
+            lines.append(f"  {side:<5}: {rate:6.1%}  [{low:.1%} .. {high:.1%}]")
+        lines.append(f"  rounds: {self.rounds.mean:.2f} ± {self.rounds.ci:.2f}")
+        for key in sorted(self.damage_dealt):
+            dmg = self.damage_dealt[key]
+            stg = self.stagger_count[key]
+            lines.append(f"  {key}: dmg {dmg.mean:.1f} ± {dmg.ci:.1f}, staggers {stg.mean:.2f} ± {stg.ci:.2f}")
+        return "\n".join(lines)
+
+
+def chunk_seed(seed: int, worker_index: int) -> int:
+    """Детерминированный сид чанка (не зависит от числа процессов и порядка выполнения)."""
+    return random.Random(f"{seed}:{worker_index}").getrandbits(63)
+
+
+def _run_chunk(left_data: list, right_data: list, seed: int, worker_index: int, fights: int,
+               max_rounds: int, fast_rng: bool = False) -> MatchupStats:
+    """Воркер: проводит fights боев. Каждый бой получает свой сид из генератора чанка."""
+    logger.set_null_sink()
+
+    seeds = random.Random(chunk_seed(seed, worker_index))
+    stats = MatchupStats()
+    for _ in range(fights):
+        session = BattleSession(left_data, right_data, seed=seeds.getrandbits(63), max_rounds=max_rounds,
+                                fast_rng=fast_rng)
+        stats.add_result(session.run())
+    return stats
+
+
+def _plan_chunks(fights: int, chunk_size: int):
+    return [(i, min(chunk_size, fights - i * chunk_size)) for i in range(math.ceil(fights / chunk_size))]
+
+
+def _submit_matchup(pool, left_data: list, right_data: list, fights: int, seed: int, max_rounds: int,
+                    chunk_size: int, fast_rng: bool) -> list:
+    """Ставит чанки матчапа в пул, не дожидаясь результатов."""
+    return [pool.submit(_run_chunk, left_data, right_data, seed, idx, n, max_rounds, fast_rng)
+            for idx, n in _plan_chunks(fights, chunk_size)]
+
+
+def _gather(futures: list) -> MatchupStats:
+    # Сливаем в порядке чанков -> одинаковые суммы при одинаковом сиде
+    stats = MatchupStats()
+    for fut in futures:
+        stats.merge(fut.result())
+    return stats
+
+
+def run_matchup(left, right, fights: int = 1000, seed: int = 0, workers: int = None,
+                max_rounds: int = 30, chunk_size: int = DEFAULT_CHUNK, executor=None,
+                fast_rng: bool = False) -> MatchupStats:
+    """
+    Проводит fights боев left против right.
+    Бои режутся на чанки фиксированного размера; индекс чанка = индекс воркера для сида,
+    поэтому результат воспроизводим при любом числе процессов.
+    executor: готовый пул (для серии матчапов), иначе создается свой.
+    fast_rng: NumPy-генератор с предвыборкой блоков (core.rng.BlockRNG).
+    """
+    left_data, right_data = load_team(left), load_team(right)
+
+    if workers == 1 and executor is None:
+        stats = MatchupStats()
+        for idx, n in _plan_chunks(fights, chunk_size):
+            stats.merge(_run_chunk(left_data, right_data, seed, idx, n, max_rounds, fast_rng))
+        return stats
+
+    own_pool = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        return _gather(_submit_matchup(pool, left_data, right_data, fights, seed, max_rounds, chunk_size, fast_rng))
+    finally:
+        if own_pool:
+            pool.shutdown()
+
+
+def roster_refs(path: str = UNITS_DIR) -> list:
+    """Файлы юнитов с колодой (без колоды юнит не может сражаться)."""
+    refs = []
+    for filename in sorted(os.listdir(path)):
+        if not filename.endswith(".json"): continue
+        data = load_team(os.path.join(path, filename))
+        if data and data[0].get("deck"):
+            refs.append(os.path.join(path, filename))
+    return refs
+
+
+def run_all_pairs(refs: list = None, fights: int = 1000, seed: int = 0, workers: int = None,
+                  max_rounds: int = 30, chunk_size: int = DEFAULT_CHUNK, fast_rng: bool = False) -> dict:
+    """
+    Матчапы для всех пар ростера. Возвращает {(left, right): MatchupStats}.
+    Движок несимметричен по сторонам (порядок разрешения, ничьи скорости), поэтому половина боев
+    пары идет с переставленными сторонами; результат сводится к ориентации (left, right).
+    """
+    refs = refs or roster_refs()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Сначала ставим в очередь чанки всех пар, потом собираем: пул не простаивает на хвосте каждой пары
+        pending = {}
+        for left, right in itertools.combinations(refs, 2):
+            left_data, right_data = load_team(left), load_team(right)
+            direct = _submit_matchup(pool, left_data, right_data, fights - fights // 2, seed,
+                                     max_rounds, chunk_size, fast_rng)
+            swapped = _submit_matchup(pool, right_data, left_data, fights // 2, seed,
+                                      max_rounds, chunk_size, fast_rng)
+            pending[(left, right)] = (direct, swapped)
+
+        results = {}
+        for pair, (direct, swapped) in pending.items():
+            stats = _gather(direct)
+            stats.merge(_gather(swapped).mirrored())
+            results[pair] = stats
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo matchup simulator")
+    parser.add_argument("--left", nargs="+")
+    parser.add_argument("--right", nargs="+")
+    parser.add_argument("--all-pairs", action="store_true", help="Все пары юнитов из data/units")
+    parser.add_argument("--fights", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-rounds", type=int, default=30)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    parser.add_argument("--fast-rng", action="store_true", help="NumPy RNG с блочной предвыборкой")
+    args = parser.parse_args(argv)
+
+    logger.set_null_sink()
+
+    if args.all_pairs:
+        results = run_all_pairs(fights=args.fights, seed=args.seed, workers=args.workers,
+                                max_rounds=args.max_rounds, chunk_size=args.chunk_size, fast_rng=args.fast_rng)
+        for (left, right), stats in results.items():
+            rate, low, high = stats.win_rate("left")
+            print(f"{os.path.basename(left)} vs {os.path.basename(right)}: "
+                  f"{rate:.1%} [{low:.1%} .. {high:.1%}], rounds {stats.rounds.mean:.2f}")
+        return
+
+    if not args.left or not args.right:
+        parser.error("--left and --right are required (or use --all-pairs)")
+
+    stats = run_matchup(args.left, args.right, args.fights, args.seed, args.workers,
+                        args.max_rounds, args.chunk_size, fast_rng=args.fast_rng)
+    print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
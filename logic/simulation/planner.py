@@ -0,0 +1,398 @@
+"""
+Планировщик хода: подбирает карту и цель (юнит + слот) для каждого слота команды.
+
+1. Для каждого слота перебираются доступные карты (колода минус кулдауны) x цели.
+   Варианты ранжируются аналитически (dice_odds), для прогонов остаются TARGETS_PER_CARD
+   лучших целей каждой карты.
+2. Расстановка улучшается локальными ходами (подъем): замена варианта в слоте, обмен
+   и перенос карт между слотами одного юнита. Каждый вариант оценивается средним итогом
+   хода по одинаковому набору сидов (общие случайные числа), ход проигрывается на форке
+   боя (BattleSession.fork) через ClashSystem.resolve_turn.
+3. Из локального оптимума поиск перезапускается со случайно измененной лучшей расстановки,
+   пока не кончится бюджет времени; возвращается лучший найденный план.
+
+Пустые слоты противника в прогонах заполняются автопилотом pick_cards.
+workers > 1 - прогоны кандидатов раздаются пулу процессов.
+"""
+import itertools
+import pickle
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from core.library import Library
+from core.logging import logger, LogLevel
+from logic.battle_flow.battle_scope import active_battle
+from logic.clash import ClashSystem
+from logic.mechanics.rolling.dice_odds import slot_clash_odds, MASS_TYPES
+from logic.simulation.session import BattleSession, pick_cards
+
+DEFAULT_BUDGET = 0.8
+DEFAULT_ROLLOUTS = 8
+TARGETS_PER_CARD = 3
+# Сколько перезапусков подряд без новых прогонов (все соседи уже оценены) до остановки
+MAX_IDLE_RESTARTS = 20
+
+# Оценка хода: урон по HP + вес урона по выдержке + бонус за убийство
+STAGGER_WEIGHT = 0.5
+KILL_BONUS = 30.0
+
+_POOL = None
+_POOL_WORKERS = 0
+# Состояние боя в процессе-воркере: (pickle состояния, обертка боя)
+_WORKER_BASE = None
+
+
+@dataclass(frozen=True)
+class SlotChoice:
+    """Выбор для одного слота: карта и цель (индексы в команде противника, -1 - без цели)."""
+    unit_idx: int
+    slot_idx: int
+    card_id: Optional[str]
+    target_unit_idx: int = -1
+    target_slot_idx: int = -1
+
+
+@dataclass
+class TurnPlan:
+    choices: List[SlotChoice] = field(default_factory=list)
+    # Средняя оценка хода (больше - лучше для планирующей команды)
+    score: float = 0.0
+    # Оценка расстановки, с которой начинался поиск
+    baseline: float = 0.0
+    rollouts: int = 0
+    elapsed: float = 0.0
+
+    def apply(self, team: list):
+        """Раскладывает карты и цели плана по слотам команды."""
+        for c in self.choices:
+            slot = team[c.unit_idx].active_slots[c.slot_idx]
+            _assign(slot, Library.get_card(c.card_id) if c.card_id else None, c.target_unit_idx, c.target_slot_idx)
+
+
+def _assign(slot: dict, card, t_unit: int, t_slot: int):
+    slot['card'] = card
+    slot['target_unit_idx'] = t_unit
+    slot['target_slot_idx'] = t_slot
+    slot['is_ally_target'] = False
+
+
+def _card_id(card):
+    return getattr(card, 'id', card) if card else None
+
+
+# =========================================================================
+# КАНДИДАТЫ
+# =========================================================================
+
+def _open_slots(team: list) -> list:
+    """(unit_idx, slot_idx) слотов, которые можно планировать."""
+    keys = []
+    for u_idx, unit in enumerate(team):
+        if unit.is_dead(): continue
+        for s_idx, slot in enumerate(unit.active_slots):
+            if slot.get('stunned') or slot.get('locked'): continue
+            keys.append((u_idx, s_idx))
+    return keys
+
+
+def _deck_cards(unit) -> list:
+    """Доступные карты юнита (без учета других слотов) и число свободных копий."""
+    deck_counts = Counter(getattr(unit, 'deck', []) or [])
+    cards = []
+    for cid in sorted(deck_counts):
+        timers = unit.card_cooldowns.get(cid, [])
+        if isinstance(timers, int): timers = [timers]
+        free = deck_counts[cid] - len(timers)
+        card = Library.get_card(cid) if free > 0 else None
+        if card and str(card.card_type).lower() != "item":
+            cards.append((card, free))
+    return cards
+
+
+def _targets(unit, enemies: list) -> list:
+    """Допустимые цели (как в селекторе UI): живые, с учетом провокации и невидимости."""
+    alive = [(i, e) for i, e in enumerate(enemies) if not e.is_dead()]
+    if any(e.get_status("taunt") > 0 for _, e in alive):
+        alive = [(i, e) for i, e in alive if e.get_status("taunt") > 0]
+    if unit.get_status("invisibility") <= 0:
+        alive = [(i, e) for i, e in alive if e.get_status("invisibility") <= 0]
+    return [(i, s_idx) for i, e in alive for s_idx in range(len(e.active_slots))] or [(i, -1) for i, _ in alive]
+
+
+def _heuristic(unit, slot, card, enemies, t_unit, t_slot) -> float:
+    """Быстрая аналитическая оценка варианта (ожидаемый урон из dice_odds)."""
+    if t_unit < 0:
+        return 0.0
+    enemy = enemies[t_unit]
+    e_slot = enemy.active_slots[t_slot] if 0 <= t_slot < len(enemy.active_slots) else None
+    try:
+        odds = slot_clash_odds(unit, dict(slot, card=card), enemy, e_slot)
+    except Exception:
+        return 0.0
+    if not odds:
+        return 0.0
+    return (odds["dmg_dealt"] - odds["dmg_taken"]
+            + STAGGER_WEIGHT * (odds["stagger_dealt"] - odds["stagger_taken"]))
+
+
+def _slot_options(team: list, enemies: list, key) -> list:
+    """
+    Кандидаты слота: (card_id, t_unit, t_slot) по убыванию эвристики.
+    Для каждой карты - TARGETS_PER_CARD лучших целей.
+    """
+    unit = team[key[0]]
+    slot = unit.active_slots[key[1]]
+    targets = _targets(unit, enemies)
+    per_card = []
+    for card, _ in _deck_cards(unit):
+        flags = getattr(card, 'flags', ()) or ()
+        if card.card_type in MASS_TYPES or ("friendly" in flags and "offensive" not in flags):
+            # Цели назначит prepare_turn, аналитической оценки нет
+            per_card.append([(0.0, (card.id, -1, -1))])
+            continue
+        scored = [(_heuristic(unit, slot, card, enemies, t_unit, t_slot), (card.id, t_unit, t_slot))
+                  for t_unit, t_slot in targets]
+        if scored:
+            per_card.append(sorted(scored, key=lambda x: -x[0])[:TARGETS_PER_CARD])
+
+    scored = sorted((item for opts in per_card for item in opts), key=lambda x: -x[0])
+    return [opt for _, opt in scored]
+
+
+def _fits_deck(team: list, plan: dict, key, card_id) -> bool:
+    """Хватает ли свободных копий карты с учетом других слотов того же юнита."""
+    if card_id is None:
+        return True
+    unit = team[key[0]]
+    free = dict((c.id, n) for c, n in _deck_cards(unit)).get(card_id, 0)
+    used = sum(1 for k, opt in plan.items() if k[0] == key[0] and k != key and opt[0] == card_id)
+    locked = sum(1 for s in unit.active_slots if s.get('locked') and _card_id(s.get('card')) == card_id)
+    return free - used - locked > 0
+
+
+# =========================================================================
+# ПРОГОНЫ
+# =========================================================================
+
+def _unit_value(unit) -> float:
+    return unit.current_hp + STAGGER_WEIGHT * unit.current_stagger - (0.0 if not unit.is_dead() else KILL_BONUS)
+
+
+def _base_battle(team: list, enemies: list) -> BattleSession:
+    """Обертка над живыми командами: сама не меняется, от нее делаются форки."""
+    base = BattleSession([], [])
+    base.team_left, base.team_right = team, enemies
+    return base
+
+
+def _rollout(base: BattleSession, plan: dict, seed: int) -> float:
+    """Один ход на форке боя. Возвращает (потери противника) - (свои потери)."""
+    fork = base.fork()
+    fork.rng = random.Random(seed)
+
+    for (u_idx, s_idx), (card_id, t_unit, t_slot) in plan.items():
+        slot = fork.team_left[u_idx].active_slots[s_idx]
+        _assign(slot, Library.get_card(card_id) if card_id else None, t_unit, t_slot)
+
+    with active_battle(fork):
+        pick_cards(fork.team_right, fork.team_left, fork.rng, only_empty=True)
+        ClashSystem().resolve_turn(fork.team_left, fork.team_right)
+
+    mine = sum(_unit_value(f) - _unit_value(o) for f, o in zip(fork.team_left, base.team_left))
+    theirs = sum(_unit_value(f) - _unit_value(o) for f, o in zip(fork.team_right, base.team_right))
+    return mine - theirs
+
+
+def _evaluate(base: BattleSession, plan: dict, seeds: list) -> Optional[float]:
+    total = 0.0
+    for seed in seeds:
+        try:
+            total += _rollout(base, plan, seed)
+        except Exception as e:
+            logger.log(f"🧭 Planner rollout failed: {e}", LogLevel.VERBOSE, "Planner")
+            return None
+    return total / len(seeds)
+
+
+def _evaluate_batch(state: bytes, plans: list, seeds: list) -> list:
+    """Воркер пула: оценки нескольких планов. Команды пересобираются из to_dict один раз на состояние."""
+    global _WORKER_BASE
+    logger.set_null_sink()
+    if _WORKER_BASE is None or _WORKER_BASE[0] != state:
+        from core.unit.unit import Unit
+        if not Library.get_all_cards():
+            Library.load_all()
+        team_data, enemies_data = pickle.loads(state)
+        _WORKER_BASE = (state, _base_battle([Unit.from_dict(d) for d in team_data],
+                                            [Unit.from_dict(d) for d in enemies_data]))
+    base = _WORKER_BASE[1]
+    return [_evaluate(base, plan, seeds) for plan in plans]
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _POOL, _POOL_WORKERS
+    if _POOL is None or _POOL_WORKERS != workers:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False)
+        _POOL = ProcessPoolExecutor(max_workers=workers)
+        _POOL_WORKERS = workers
+    return _POOL
+
+
+# =========================================================================
+# ПОИСК
+# =========================================================================
+
+def _moves(keys: list) -> list:
+    """Группы локальных ходов: ("slot", key) - замена варианта, ("pair", a, b) - обмен/перенос между слотами юнита."""
+    moves = [("slot", key) for key in keys]
+    moves += [("pair", a, b) for a, b in itertools.combinations(keys, 2) if a[0] == b[0]]
+    return moves
+
+
+def _candidates(team: list, plan: dict, move: tuple, options: dict) -> list:
+    """Соседние расстановки plan для группы ходов move."""
+    if move[0] == "slot":
+        key = move[1]
+        return [{**plan, key: opt} for opt in options[key]
+                if opt != plan[key] and _fits_deck(team, plan, key, opt[0])]
+
+    _, a, b = move
+    cands = []
+    if plan[a] != plan[b]:
+        # Обмен: карты (с целями) меняются слотами - важна скорость слота
+        cands.append({**plan, a: plan[b], b: plan[a]})
+    for src, dst in ((a, b), (b, a)):
+        if plan[src][0] is None or plan[src][0] == plan[dst][0]:
+            continue
+        # Перенос: карта src уходит в dst, src получает лучший другой подходящий вариант
+        moved = {**plan, dst: plan[src]}
+        for opt in options[src]:
+            if opt[0] != plan[src][0] and _fits_deck(team, moved, src, opt[0]):
+                cands.append({**moved, src: opt})
+                break
+    return cands
+
+
+def _perturb(team: list, plan: dict, keys: list, options: dict, rng: random.Random) -> dict:
+    """Случайно меняет около трети слотов плана (старт для перезапуска поиска)."""
+    plan = dict(plan)
+    for key in rng.sample(keys, max(1, len(keys) // 3)):
+        partners = [k for k in keys if k[0] == key[0] and k != key and plan[k] != plan[key]]
+        if partners and rng.random() < 0.5:
+            other = rng.choice(partners)
+            plan[key], plan[other] = plan[other], plan[key]
+            continue
+        fitting = [opt for opt in options[key] if opt != plan[key] and _fits_deck(team, plan, key, opt[0])]
+        if fitting:
+            plan[key] = rng.choice(fitting)
+    return plan
+
+
+def suggest_plan(team: list, enemies: list, budget: float = DEFAULT_BUDGET, rollouts: int = DEFAULT_ROLLOUTS,
+                 seed: int = None, workers: int = 1) -> TurnPlan:
+    """
+    Ищет расстановку карт и целей для слотов team против enemies за budget секунд.
+    Сама команда не меняется: план применяется через TurnPlan.apply.
+    """
+    start = time.perf_counter()
+    deadline = start + budget
+    rng = random.Random(seed)
+    seeds = [rng.getrandbits(63) for _ in range(rollouts)]
+
+    keys = _open_slots(team)
+    if not keys:
+        return TurnPlan(elapsed=time.perf_counter() - start)
+
+    # Прогоны глушат логи только в этом потоке: логи других сессий UI не трогаем
+    with logger.quiet():
+        options = {key: _slot_options(team, enemies, key) for key in keys}
+        moves = _moves(keys)
+
+        # Стартовая расстановка: текущие карты игрока, пустые слоты - лучший вариант эвристики
+        plan = {}
+        for key in keys:
+            slot = team[key[0]].active_slots[key[1]]
+            current = _card_id(slot.get('card'))
+            if current:
+                plan[key] = (current, slot.get('target_unit_idx', -1), slot.get('target_slot_idx', -1))
+            else:
+                fitting = [opt for opt in options[key] if _fits_deck(team, plan, key, opt[0])]
+                plan[key] = fitting[0] if fitting else (None, -1, -1)
+
+        base = _base_battle(team, enemies)
+        pool = _get_pool(workers) if workers and workers > 1 else None
+        state = pickle.dumps(([u.to_dict() for u in team], [u.to_dict() for u in enemies])) if pool else None
+        cache = {}
+        count = 0
+
+        def score_many(plans: list) -> list:
+            nonlocal count
+            todo = list({tuple(sorted(p.items())): p for p in plans
+                         if tuple(sorted(p.items())) not in cache}.values())
+            if pool and len(todo) > 1:
+                chunks = [todo[i::workers] for i in range(workers)]
+                futures = [pool.submit(_evaluate_batch, state, chunk, seeds) for chunk in chunks if chunk]
+                results = [r for fut in futures for r in fut.result()]
+                todo = [p for chunk in chunks for p in chunk]
+            else:
+                results = []
+                for p in todo:
+                    if time.perf_counter() > deadline:
+                        break
+                    results.append(_evaluate(base, p, seeds))
+                todo = todo[:len(results)]
+            for p, r in zip(todo, results):
+                cache[tuple(sorted(p.items()))] = r
+            count += len(todo) * len(seeds)
+            return [cache.get(tuple(sorted(p.items()))) for p in plans]
+
+        def ascend(plan: dict, value: float):
+            """Подъем до локального оптимума (или дедлайна)."""
+            improved = True
+            while improved and time.perf_counter() < deadline:
+                improved = False
+                for move in moves:
+                    if time.perf_counter() > deadline:
+                        break
+                    candidates = _candidates(team, plan, move, options)
+                    for cand, cand_value in zip(candidates, score_many(candidates)):
+                        if cand_value is not None and cand_value > value + 1e-9:
+                            plan, value, improved = cand, cand_value, True
+            return plan, value
+
+        baseline = score_many([plan])[0]
+        plan, best = ascend(plan, baseline if baseline is not None else float("-inf"))
+
+        # Остаток бюджета - перезапуски из случайно измененного лучшего плана
+        idle = 0
+        while time.perf_counter() < deadline and idle < MAX_IDLE_RESTARTS:
+            evaluated = count
+            start_plan = _perturb(team, plan, keys, options, rng)
+            start_value = score_many([start_plan])[0]
+            cand, value = ascend(start_plan, start_value if start_value is not None else float("-inf"))
+            if value > best + 1e-9:
+                plan, best = cand, value
+            idle = idle + 1 if count == evaluated else 0
+
+    elapsed = time.perf_counter() - start
+    result = TurnPlan(
+        choices=[SlotChoice(k[0], k[1], *plan[k]) for k in keys],
+        score=best if best != float("-inf") else 0.0,
+        baseline=baseline if baseline is not None else 0.0,
+        rollouts=count,
+        elapsed=elapsed,
+    )
+    logger.log(f"🧭 Planner: {len(keys)} slots, {count} rollouts in {elapsed:.2f}s, "
+               f"score {result.baseline:+.1f} -> {result.score:+.1f}", LogLevel.NORMAL, "Planner")
+    return result
+
+
+def lookahead_cards(team: list, enemies: list, rng: random.Random, budget: float = DEFAULT_BUDGET):
+    """Планировщик с сигнатурой pick_cards (для BattleSession(planner=...) и ИИ противника)."""
+    plan = suggest_plan(team, enemies, budget=budget, seed=rng.getrandbits(63))
+    plan.apply(team)
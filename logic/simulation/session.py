@@ -0,0 +1,256 @@
+import contextlib
+import copy
+import json
+import os
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+
+from core.library import Library
+from core.logging import logger, LogLevel
+from core.rng import make_rng, clone_rng
+from core.unit.unit import Unit
+from logic.battle_flow.battle_scope import active_battle
+from logic.battle_flow.rounds import start_round, end_round, reset_unit
+from logic.clash import ClashSystem
+from logic.simulation.fork import fork_teams
+
+UNITS_DIR = "data/units"
+
+
+def _resolve_unit_path(ref: str) -> str:
+    """Ищет файл юнита: прямой путь, имя файла или имя юнита в data/units."""
+    candidates = [ref, os.path.join(UNITS_DIR, ref)]
+    if not ref.endswith(".json"):
+        safe_name = "".join(c for c in ref if c.isalnum() or c in (' ', '_', '-')).strip().replace(" ", "_")
+        candidates += [f"{ref}.json", os.path.join(UNITS_DIR, f"{safe_name}.json")]
+
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(f"Unit file not found: {ref}")
+
+
+def load_team(ref) -> list:
+    """
+    Загружает описание команды (список словарей юнитов).
+    ref может быть:
+    - путем к JSON юнита (словарь) или команды (список словарей / имен файлов);
+    - именем юнита из data/units;
+    - списком таких ссылок.
+    """
+    if isinstance(ref, (list, tuple)):
+        team = []
+        for item in ref:
+            team.extend(load_team(item))
+        return team
+
+    if isinstance(ref, dict):
+        return [ref]
+
+    with open(_resolve_unit_path(ref), 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        return [data]
+    return load_team(data)
+
+
+@dataclass
+class BattleResult:
+    """Итог одного боя."""
+    winner: str  # "left", "right" или "draw"
+    rounds: int
+    seed: int = None
+    # Ключ: "left:Имя" / "right:Имя"
+    damage_dealt: dict = field(default_factory=dict)
+    damage_taken: dict = field(default_factory=dict)
+    stagger_count: dict = field(default_factory=dict)
+    hp_left: dict = field(default_factory=dict)
+
+
+def pick_cards(team: list, enemies: list, rng: random.Random, only_empty: bool = False):
+    """
+    Простой автопилот: раскладывает доступные карты по слотам и выбирает цели.
+    Учитывает кулдауны и число копий карты в колоде (как селектор карт в UI).
+    only_empty=True - слоты с уже выбранной картой не трогаются.
+    """
+    # (индекс, юнит): одноименные копии врагов различаются по позиции
+    alive_enemies = [(i, e) for i, e in enumerate(enemies) if not e.is_dead()]
+    taunted = [(i, e) for i, e in alive_enemies if e.get_status("taunt") > 0]
+
+    for unit in team:
+        if unit.is_dead(): continue
+        deck_counts = Counter(getattr(unit, 'deck', []) or [])
+        used = Counter()
+
+        for slot in unit.active_slots:
+            if slot.get('stunned'): continue
+            if only_empty and slot.get('card'):
+                used[slot['card'].id] += 1
+                continue
+
+            available = []
+            for cid in sorted(deck_counts):
+                timers = unit.card_cooldowns.get(cid, [])
+                if isinstance(timers, int): timers = [timers]
+                if deck_counts[cid] - len(timers) - used[cid] > 0:
+                    card = Library.get_card(cid)
+                    if card and str(card.card_type).lower() != "item":
+                        available.append(card)
+
+            if not available: continue
+            card = rng.choice(available)
+            used[card.id] += 1
+            slot['card'] = card
+
+            flags = getattr(card, 'flags', [])
+            if "friendly" in flags and "offensive" not in flags:
+                # Цель назначит авто-таргетинг в prepare_turn (на себя)
+                continue
+
+            if not alive_enemies: continue
+            t_idx, target = taunted[0] if taunted else rng.choice(alive_enemies)
+
+            slot['target_unit_idx'] = t_idx
+            slot['target_slot_idx'] = rng.randrange(len(target.active_slots)) if target.active_slots else -1
+
+
+class BattleSession:
+    """
+    Headless-бой без Streamlit: полный цикл раундов для двух команд.
+    Использует те же этапы, что и симулятор (start_round -> resolve_turn -> end_round).
+    quiet=True - бой не пишет лог (только в своем потоке, через logger.quiet()).
+    """
+
+    def __init__(self, left_data: list, right_data: list, seed: int = None, max_rounds: int = 30,
+                 planner=None, quiet: bool = False, fast_rng: bool = False):
+        self.left_data = left_data
+        self.right_data = right_data
+        self.seed = seed
+        self.max_rounds = max_rounds
+        # planner(team, enemies, rng) -> расставляет карты и цели в слотах
+        self.planner = planner or pick_cards
+        self.quiet = quiet
+        self.fast_rng = fast_rng
+
+        # Единый RNG боя: через battle_scope его используют броски, скорость, скрипты и автопилот
+        self.rng = make_rng(seed, fast=fast_rng)
+        self.team_left = []
+        self.team_right = []
+        self.round_number = 1
+        self.battle_logs = []
+        self._roster = None
+        self._damage_dealt = {}
+
+    @classmethod
+    def from_files(cls, left, right, **kwargs):
+        return cls(load_team(left), load_team(right), **kwargs)
+
+    @property
+    def roster(self) -> dict:
+        """
+        Ростер для призывов (грузится только при первом обращении).
+        Только шаблоны для SummonTemplates: общий ростер библиотеки, чтобы бои процесса делили прототипы.
+        """
+        if self._roster is None:
+            from core.unit.unit_library import UnitLibrary
+            self._roster = UnitLibrary.get_roster() or UnitLibrary.load_all()
+        return self._roster
+
+    @staticmethod
+    def _build_unit(data: dict) -> Unit:
+        unit = Unit.from_dict(data)
+        unit.memory.pop('start_of_battle_stats', None)
+        reset_unit(unit)
+        return unit
+
+    def setup(self):
+        """Создает свежие копии юнитов с полным HP/SP/Stagger."""
+        self.rng = make_rng(self.seed, fast=self.fast_rng)
+        self.team_left = [self._build_unit(d) for d in self.left_data]
+        self.team_right = [self._build_unit(d) for d in self.right_data]
+        self.round_number = 1
+        self.battle_logs = []
+        self._damage_dealt = {}
+
+    def fork(self, memo: dict = None) -> "BattleSession":
+        """
+        Независимая ветка боя: команды, слоты, статусы, кулдауны и состояние RNG.
+        Исходный бой и ветка дальше живут отдельно. memo (id оригинала -> копия) можно
+        передать в fork_value, чтобы перенести на ветку объекты вроде turn_actions.
+        """
+        memo = {} if memo is None else memo
+        twin = copy.copy(self)
+        twin.team_left, twin.team_right = fork_teams(self.team_left, self.team_right, memo)
+        twin.rng = clone_rng(self.rng)
+        twin.battle_logs = list(self.battle_logs)
+        twin._damage_dealt = {id(memo[k]) if k in memo else k: v for k, v in self._damage_dealt.items()}
+        return twin
+
+    def record_damage(self, source, target, amount: int, resource_type: str):
+        """Вызывается из damage_utils через battle_scope (учитываем только HP)."""
+        if resource_type == "hp":
+            self._damage_dealt[id(source)] = self._damage_dealt.get(id(source), 0) + amount
+
+    def winner(self):
+        left_dead = all(u.is_dead() for u in self.team_left)
+        right_dead = all(u.is_dead() for u in self.team_right)
+        if left_dead and right_dead: return "draw"
+        if right_dead: return "left"
+        if left_dead: return "right"
+        return None
+
+    def play_round(self, stats: dict = None):
+        """Один раунд: бросок скорости, выбор карт, разрешение хода, конец раунда."""
+        start_round(self.team_left, self.team_right, logs=self.battle_logs)
+
+        self.planner(self.team_left, self.team_right, self.rng)
+        self.planner(self.team_right, self.team_left, self.rng)
+
+        staggered_before = {id(u) for u in self.team_left + self.team_right if u.is_staggered()}
+        self.battle_logs.extend(ClashSystem().resolve_turn(self.team_left, self.team_right))
+
+        if stats is not None:
+            for key, u in self._keyed_units():
+                if id(u) not in staggered_before and u.is_staggered():
+                    stats[key] = stats.get(key, 0) + 1
+
+        end_round(self.team_left, self.team_right)
+        self.round_number += 1
+
+    def _keyed_units(self):
+        """Пары (ключ, юнит). Одноименные юниты различаются суффиксом #индекс."""
+        for side, team in (("left", self.team_left), ("right", self.team_right)):
+            seen = set()
+            for idx, u in enumerate(team):
+                key = f"{side}:{u.name}"
+                if key in seen: key = f"{key}#{idx}"
+                seen.add(key)
+                yield key, u
+
+    def run(self) -> BattleResult:
+        """Проводит бой до победы одной из сторон или лимита раундов."""
+        with active_battle(self), (logger.quiet() if self.quiet else contextlib.nullcontext()):
+            self.setup()
+            start_hp = {key: u.current_hp for key, u in self._keyed_units()}
+            stagger_count = {}
+
+            result = None
+            while result is None and self.round_number <= self.max_rounds:
+                self.play_round(stagger_count)
+                result = self.winner()
+
+        rounds = self.round_number - 1
+        logger.log(f"🏁 Headless battle finished: {result or 'draw'} in {rounds} rounds (seed={self.seed})",
+                   LogLevel.MINIMAL, "Simulation")
+
+        return BattleResult(
+            winner=result or "draw",
+            rounds=rounds,
+            seed=self.seed,
+            damage_dealt={key: self._damage_dealt.get(id(u), 0) for key, u in self._keyed_units()},
+            damage_taken={key: max(0, start_hp.get(key, 0) - u.current_hp) for key, u in self._keyed_units()},
+            stagger_count=stagger_count,
+            hp_left={key: u.current_hp for key, u in self._keyed_units()},
+        )
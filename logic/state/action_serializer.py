@@ -1,9 +1,15 @@
+from logic.battle_flow.team_index import team_index
+
+_SIDES = ("left", "right")
+
+
 class ActionSerializer:
     @staticmethod
     def _find_unit_index(unit, team_left, team_right):
-        if unit in team_left: return "left", team_left.index(unit)
-        if unit in team_right: return "right", team_right.index(unit)
-        return None, -1
+        if unit is None: return None, -1
+        where = team_index(team_left, team_right).locate(unit)
+        if where is None: return None, -1
+        return _SIDES[where[0]], where[1]
 
     @staticmethod
     def _get_unit_by_index(ref, team_left, team_right):
@@ -63,4 +69,29 @@ class ActionSerializer:
                 'card_type': s_act['card_type'],
                 'opposing_team': opposing_team
             })
-        return restored
\ No newline at end of file
+        return restored
+
+    @staticmethod
+    def serialize_executed_slots(executed_slots, team_left, team_right):
+        """(uid, slot_idx) -> [side, unit_idx, slot_idx]: uid не переживает перезагрузку."""
+        by_uid = {u.uid: (side, idx) for side, team in zip(_SIDES, (team_left, team_right))
+                  for idx, u in enumerate(team)}
+        serialized = []
+        for uid, slot_idx in executed_slots:
+            ref = by_uid.get(uid)
+            if ref: serialized.append([ref[0], ref[1], slot_idx])
+        return serialized
+
+    @staticmethod
+    def restore_executed_slots(items, team_left, team_right):
+        """Обратно в множество (uid, slot_idx). Старые сейвы хранят [имя юнита, slot_idx]."""
+        restored = set()
+        for item in items or []:
+            if len(item) == 3:
+                unit = ActionSerializer._get_unit_by_index(item[:2], team_left, team_right)
+                if unit: restored.add((unit.uid, item[2]))
+            elif len(item) == 2:
+                for unit in team_left + team_right:
+                    if unit.name == item[0]:
+                        restored.add((unit.uid, item[1]))
+        return restored
@@ -0,0 +1,140 @@
+import atexit
+import threading
+import time
+
+from core.logging import logger, LogLevel
+from logic.state.file_manager import StateFileManager
+
+
+class _PendingSave:
+    __slots__ = ("data", "first_ts", "last_ts", "count")
+
+    def __init__(self, data, now):
+        self.data = data
+        self.first_ts = now
+        self.last_ts = now
+        self.count = 1
+
+
+class AutosaveWorker:
+    """
+    Отложенная запись сейвов (write-behind).
+    - submit() только запоминает последний слепок для файла и сразу возвращается.
+    - Серия сохранений подряд сливается в одну запись: файл пишется после DEBOUNCE сек тишины,
+      но не позже MAX_DELAY сек после первого несохраненного слепка.
+    - Запись идет в фоновом потоке через writer (по умолчанию атомарный StateFileManager.save_data).
+    - flush() дописывает все немедленно (вызывается перед чтением сейва и при выходе).
+    """
+    DEBOUNCE = 0.3
+    MAX_DELAY = 2.0
+
+    def __init__(self, writer=None):
+        self._writer = writer or StateFileManager.save_data
+        # filename -> _PendingSave
+        self._pending = {}
+        self._cond = threading.Condition()
+        # Запись одного файла не должна обгонять другую (старый слепок поверх нового)
+        self._io_lock = threading.Lock()
+        self._thread = None
+        self._stopping = False
+        atexit.register(self.stop)
+
+    # === ПУБЛИЧНЫЙ ИНТЕРФЕЙС ===
+
+    def submit(self, filename: str, data: dict):
+        """Ставит слепок в очередь на запись (предыдущий несохраненный слепок файла заменяется)."""
+        now = time.monotonic()
+        with self._cond:
+            item = self._pending.get(filename)
+            if item is None:
+                self._pending[filename] = _PendingSave(data, now)
+            else:
+                item.data, item.last_ts = data, now
+                item.count += 1
+            self._ensure_thread()
+            self._cond.notify()
+
+    def flush(self, filename: str = None):
+        """Синхронно записывает ожидающие слепки (все или только filename)."""
+        with self._cond:
+            names = [filename] if filename is not None else list(self._pending)
+        for name in names:
+            self._write(name)
+
+    def discard(self, filename: str):
+        """Отменяет ожидающую запись (например, перед удалением файла)."""
+        with self._io_lock, self._cond:
+            self._pending.pop(filename, None)
+
+    def has_pending(self, filename: str = None) -> bool:
+        with self._cond:
+            return bool(self._pending) if filename is None else filename in self._pending
+
+    def stop(self):
+        """Останавливает поток и дописывает все несохраненное."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        self.flush()
+        with self._cond:
+            self._stopping = False
+            self._thread = None
+
+    # === ФОНОВЫЙ ПОТОК ===
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="StateAutosave", daemon=True)
+            self._thread.start()
+
+    def _due_names(self):
+        """Ждет, пока какие-то файлы станут готовы к записи. None - поток надо завершить."""
+        while True:
+            if self._stopping:
+                return None
+            if not self._pending:
+                self._cond.wait()
+                continue
+
+            now = time.monotonic()
+            due, next_ts = [], None
+            for name, item in self._pending.items():
+                ts = min(item.last_ts + self.DEBOUNCE, item.first_ts + self.MAX_DELAY)
+                if ts <= now:
+                    due.append(name)
+                elif next_ts is None or ts < next_ts:
+                    next_ts = ts
+            if due:
+                return due
+            self._cond.wait(next_ts - now)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                names = self._due_names()
+            if names is None:
+                return
+            for name in names:
+                self._write(name)
+
+    def _write(self, filename: str):
+        with self._io_lock:
+            with self._cond:
+                item = self._pending.pop(filename, None)
+            if item is None:
+                return
+
+            start = time.perf_counter()
+            try:
+                self._writer(item.data, filename)
+            except Exception as e:
+                logger.log(f"💾 Autosave failed for '{filename}': {e}", LogLevel.MINIMAL, "State")
+                return
+            logger.log(f"💾 Autosave '{filename}': {item.count} save(s) -> 1 write "
+                       f"({(time.perf_counter() - start) * 1000:.1f} ms)", LogLevel.VERBOSE, "State")
+
+
+autosaver = AutosaveWorker()
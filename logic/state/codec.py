@@ -0,0 +1,176 @@
+"""
+Кодек слепков состояния.
+
+clone(obj) - быстрая замена json.loads(json.dumps(obj, default=str)) и copy.deepcopy
+для данных сейвов: диспетчеризация по точному типу, ключи словарей приводятся к str как в JSON.
+
+dumps/loads - версионный бинарный формат файлов data/states:
+    b"LORS" | версия (1 байт) | формат (1 байт: 0 - JSON, 1 - msgpack) | флаги (1 байт: 1 - zlib) | данные
+JSON кодируется через orjson, если он установлен; msgpack используется, только если нет orjson.
+loads() без заголовка читает обычный JSON (старые сейвы).
+"""
+import json
+import zlib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MAGIC = b"LORS"
+VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+FORMAT_JSON = 0
+FORMAT_MSGPACK = 1
+FLAG_ZLIB = 1
+
+COMPRESS_LEVEL = 6
+
+
+class CodecError(ValueError):
+    """Поврежденные или неподдерживаемые данные сейва."""
+
+
+# =========================================================================
+# КОПИРОВАНИЕ
+# =========================================================================
+
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+_JSON_KEYS = {True: "true", False: "false", None: "null"}
+
+
+def _key(k):
+    if type(k) is str:
+        return k
+    if k is None or k is True or k is False:
+        return _JSON_KEYS[k]
+    if isinstance(k, str):
+        return str.__str__(k)
+    if isinstance(k, float):
+        return repr(float(k))
+    if isinstance(k, int):
+        return str(int(k))
+    return str(k)
+
+
+def _clone_dict(d) -> dict:
+    return {(k if type(k) is str else _key(k)): (v if type(v) in _SCALARS else clone(v)) for k, v in d.items()}
+
+
+def _clone_list(items) -> list:
+    return [v if type(v) in _SCALARS else clone(v) for v in items]
+
+
+# Кодировщики по точному типу (register_encoder добавляет свои, например для StatusStore)
+_ENCODERS = {
+    dict: _clone_dict,
+    list: _clone_list,
+    tuple: _clone_list,
+}
+
+
+def register_encoder(cls, encoder):
+    """Регистрирует кодировщик для типа: encoder(obj) -> JSON-совместимое значение."""
+    _ENCODERS[cls] = encoder
+
+
+def clone(obj):
+    """JSON-совместимая глубокая копия (неизвестные объекты превращаются в str, как default=str)."""
+    t = type(obj)
+    if t in _SCALARS:
+        return obj
+    encoder = _ENCODERS.get(t)
+    if encoder is not None:
+        return encoder(obj)
+    if isinstance(obj, dict):
+        return _clone_dict(obj)
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return _clone_list(obj)
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    return str(obj)
+
+
+# =========================================================================
+# ФАЙЛОВЫЙ ФОРМАТ
+# =========================================================================
+
+def _default(obj):
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+def _dump_json(data) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except (TypeError, orjson.JSONEncodeError):
+            pass  # Например, int больше 64 бит - пусть разбирается стандартный json
+    return json.dumps(data, ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def _load_json(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
+
+
+def preferred_format() -> int:
+    return FORMAT_MSGPACK if orjson is None and msgpack is not None else FORMAT_JSON
+
+
+def dumps(data, compress: bool = True, fmt: int = None) -> bytes:
+    """Сериализует данные в бинарный формат сейва."""
+    fmt = preferred_format() if fmt is None else fmt
+    if fmt == FORMAT_MSGPACK:
+        if msgpack is None:
+            raise CodecError("msgpack is not installed")
+        payload = msgpack.packb(data, default=_default, use_bin_type=True)
+    else:
+        payload = _dump_json(data)
+
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, COMPRESS_LEVEL)
+        flags |= FLAG_ZLIB
+    return MAGIC + bytes((VERSION, fmt, flags)) + payload
+
+
+def loads(raw: bytes):
+    """Читает бинарный формат или старый JSON (без заголовка)."""
+    if not raw.startswith(MAGIC):
+        try:
+            return _load_json(raw)
+        except ValueError as e:
+            raise CodecError(f"Invalid legacy JSON: {e}") from e
+
+    if len(raw) < HEADER_SIZE:
+        raise CodecError("Truncated header")
+    version, fmt, flags = raw[len(MAGIC):HEADER_SIZE]
+    if version > VERSION:
+        raise CodecError(f"Unsupported state version {version}")
+
+    payload = raw[HEADER_SIZE:]
+    try:
+        if flags & FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        if fmt == FORMAT_JSON:
+            return _load_json(payload)
+        if fmt == FORMAT_MSGPACK:
+            if msgpack is None:
+                raise CodecError("State was saved with msgpack, but msgpack is not installed")
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    except CodecError:
+        raise
+    except Exception as e:
+        raise CodecError(f"Corrupted state payload: {e}") from e
+    raise CodecError(f"Unknown state format {fmt}")
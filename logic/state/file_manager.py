@@ -1,63 +1,125 @@
 import glob
-import json
 import os
+import tempfile
+
+from logic.state import codec
 
 STATES_DIR = "data/states"
+# Бинарный формат (logic/state/codec). Старые .json читаются и заменяются при следующем сохранении
+STATE_EXT = ".state"
+LEGACY_EXT = ".json"
 
 class StateFileManager:
     @staticmethod
     def ensure_dir():
         if not os.path.exists(STATES_DIR):
             os.makedirs(STATES_DIR, exist_ok=True)
-            default_path = os.path.join(STATES_DIR, "default.json")
-            if not os.path.exists(default_path):
-                with open(default_path, "w", encoding="utf-8") as f:
-                    json.dump({}, f)
+            if StateFileManager._existing_path("default") is None:
+                StateFileManager._write_bytes(StateFileManager.state_path("default"), codec.dumps({}))
+
+    @staticmethod
+    def state_path(name):
+        return os.path.join(STATES_DIR, f"{name}{STATE_EXT}")
+
+    @staticmethod
+    def legacy_path(name):
+        return os.path.join(STATES_DIR, f"{name}{LEGACY_EXT}")
+
+    @staticmethod
+    def _existing_path(name):
+        """Путь к файлу сейва: если есть и бинарный, и старый JSON - берется более свежий."""
+        paths = [p for p in (StateFileManager.state_path(name), StateFileManager.legacy_path(name))
+                 if os.path.exists(p)]
+        return max(paths, key=os.path.getmtime) if paths else None
 
     @staticmethod
     def get_available_states():
         StateFileManager.ensure_dir()
-        files = glob.glob(os.path.join(STATES_DIR, "*.json"))
-        names = [os.path.splitext(os.path.basename(f))[0] for f in files]
+        names = set()
+        for ext in (STATE_EXT, LEGACY_EXT):
+            for f in glob.glob(os.path.join(STATES_DIR, f"*{ext}")):
+                names.add(os.path.splitext(os.path.basename(f))[0])
         return sorted(names)
 
     @staticmethod
     def create_new_state(name):
         StateFileManager.ensure_dir()
-        filename = f"{name}.json"
-        path = os.path.join(STATES_DIR, filename)
-        if not os.path.exists(path):
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump({}, f)
+        if StateFileManager._existing_path(name) is None:
+            StateFileManager._write_bytes(StateFileManager.state_path(name), codec.dumps({}))
             return True
         return False
 
+    @staticmethod
+    def history_path(name, gen=0):
+        """Побочный файл истории ходов (сжатые старые записи UndoHistory)."""
+        return os.path.join(STATES_DIR, f".{name}.undo.{gen}")
+
+    @staticmethod
+    def prune_history(name, below_gen=None):
+        """
+        Удаляет побочные файлы истории поколений младше below_gen (None - все).
+        Более новые поколения не трогаются: их может использовать еще не сохраненная история.
+        """
+        prefix = f".{name}.undo."
+        for path in glob.glob(os.path.join(glob.escape(STATES_DIR), glob.escape(prefix) + "*")):
+            gen = os.path.basename(path)[len(prefix):]
+            if not gen.isdigit() or (below_gen is not None and int(gen) >= below_gen):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
     @staticmethod
     def delete_state(name):
-        path = os.path.join(STATES_DIR, f"{name}.json")
-        if os.path.exists(path):
-            os.remove(path)
-            return True
-        return False
+        for side_file in glob.glob(os.path.join(glob.escape(STATES_DIR), glob.escape(f".{name}.undo.") + "*")):
+            os.remove(side_file)
+        deleted = False
+        for path in (StateFileManager.state_path(name), StateFileManager.legacy_path(name)):
+            if os.path.exists(path):
+                os.remove(path)
+                deleted = True
+        return deleted
 
     @staticmethod
-    def load_json(filename="default"):
+    def load_data(filename="default"):
         StateFileManager.ensure_dir()
-        target_file = os.path.join(STATES_DIR, f"{filename}.json")
-        if not os.path.exists(target_file):
+        target_file = StateFileManager._existing_path(filename)
+        if target_file is None:
             return {}
         try:
-            with open(target_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(target_file, "rb") as f:
+                return codec.loads(f.read())
         except Exception:
             return {}
 
     @staticmethod
-    def save_json(data, filename="default"):
+    def save_data(data, filename="default"):
+        """Атомарная запись в бинарном формате; старый JSON этого сейва после записи удаляется."""
         StateFileManager.ensure_dir()
-        target_file = os.path.join(STATES_DIR, f"{filename}.json")
         try:
-            with open(target_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            StateFileManager._write_bytes(StateFileManager.state_path(filename), codec.dumps(data))
+            legacy = StateFileManager.legacy_path(filename)
+            if os.path.exists(legacy):
+                os.remove(legacy)
+            # Манифест истории с новым поколением записан - старые поколения побочного файла больше не нужны
+            history = data.get("undo_history")
+            if isinstance(history, dict) and history.get("gen"):
+                StateFileManager.prune_history(filename, history["gen"])
         except Exception as e:
-            print(f"Error saving state to {filename}: {e}")
\ No newline at end of file
+            print(f"Error saving state to {filename}: {e}")
+
+    @staticmethod
+    def _write_bytes(target_file, raw: bytes):
+        """Временный файл в той же папке + os.replace (без полузаписанных сейвов)."""
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target_file),
+                                            prefix=f".{os.path.basename(target_file)}.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, target_file)
+            tmp_path = None
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -14,12 +14,16 @@ class SnapshotMaker:
             "phase": session_state.get('phase', 'roll'),
             "round_number": session_state.get('round_number', 1),
             "turn_message": session_state.get('turn_message', ""),
-            "battle_logs": session_state.get('battle_logs', []),
+            "battle_logs": list(session_state.get('battle_logs', [])),
             "script_logs": session_state.get('script_logs', ""),
 
             "turn_phase": session_state.get('turn_phase', 'planning'),
             "action_idx": session_state.get('action_idx', 0),
-            "executed_slots": list(session_state.get('executed_slots', [])),
+            "executed_slots": ActionSerializer.serialize_executed_slots(
+                session_state.get('executed_slots', []),
+                session_state.get('team_left', []),
+                session_state.get('team_right', [])
+            ),
 
             "turn_actions": ActionSerializer.serialize_actions(
                 session_state.get('turn_actions', []),
@@ -44,7 +48,7 @@ class SnapshotMaker:
             "phase": session_state.get('phase', 'roll'),
             "round_number": session_state.get('round_number', 1),
             "turn_message": session_state.get('turn_message', ""),
-            "battle_logs": session_state.get('battle_logs', []),
+            "battle_logs": list(session_state.get('battle_logs', [])),
 
             "turn_actions": ActionSerializer.serialize_actions(
                 session_state.get('turn_actions', []),
@@ -54,5 +58,9 @@ class SnapshotMaker:
 
             "turn_phase": session_state.get('turn_phase', 'planning'),
             "action_idx": session_state.get('action_idx', 0),
-            "executed_slots": list(session_state.get('executed_slots', [])),
+            "executed_slots": ActionSerializer.serialize_executed_slots(
+                session_state.get('executed_slots', []),
+                session_state.get('team_left', []),
+                session_state.get('team_right', [])
+            ),
         }
\ No newline at end of file
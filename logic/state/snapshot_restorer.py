@@ -1,5 +1,6 @@
 from core.unit.unit import Unit
 from logic.state.action_serializer import ActionSerializer
+from logic.state.undo_history import UndoHistory
 
 
 class SnapshotRestorer:
@@ -79,7 +80,8 @@ class SnapshotRestorer:
         except:
             pass
 
-        if "undo_stack" in data: session_state['undo_stack'] = data["undo_stack"]
+        if "undo_history" in data or "undo_stack" in data:
+            session_state['undo_history'] = UndoHistory.load(data, session_state.get("current_state_file", "default"))
 
         raw_actions = data.get('turn_actions', [])
         session_state['turn_actions'] = ActionSerializer.restore_actions(raw_actions, team_left,
@@ -95,6 +97,5 @@ class SnapshotRestorer:
         session_state['turn_phase'] = data.get('turn_phase', 'planning')
         session_state['action_idx'] = data.get('action_idx', 0)
 
-        session_state['executed_slots'] = set()
-        for item in data.get('executed_slots', []):
-            session_state['executed_slots'].add(tuple(item))
\ No newline at end of file
+        session_state['executed_slots'] = ActionSerializer.restore_executed_slots(
+            data.get('executed_slots', []), session_state.get('team_left', []), session_state.get('team_right', []))
\ No newline at end of file
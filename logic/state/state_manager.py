@@ -1,4 +1,5 @@
 from logic.state.action_serializer import ActionSerializer
+from logic.state.autosave import autosaver
 from logic.state.file_manager import StateFileManager
 from logic.state.snapshot_maker import SnapshotMaker
 from logic.state.snapshot_restorer import SnapshotRestorer
@@ -14,14 +15,33 @@ class StateManager:
     ensure_dir = StateFileManager.ensure_dir
     get_available_states = StateFileManager.get_available_states
     create_new_state = StateFileManager.create_new_state
-    delete_state = StateFileManager.delete_state
-    load_state = StateFileManager.load_json
 
     @staticmethod
-    def save_state(session_state, filename="default"):
+    def delete_state(name):
+        autosaver.discard(name)
+        return StateFileManager.delete_state(name)
+
+    @staticmethod
+    def load_state(filename="default"):
+        # Несохраненный слепок этого файла дописываем до чтения
+        autosaver.flush(filename)
+        return StateFileManager.load_data(filename)
+
+    @staticmethod
+    def save_state(session_state, filename="default", wait=False):
+        """
+        Слепок снимается сразу, а запись в файл откладывается и сливается
+        с соседними сохранениями (autosaver). wait=True - записать немедленно.
+        """
         data = SnapshotMaker.get_state_snapshot(session_state)
-        data["undo_stack"] = session_state.get("undo_stack", [])
-        StateFileManager.save_json(data, filename)
+        history = session_state.get("undo_history")
+        if history is not None:
+            data["undo_history"] = history.to_dict()
+        autosaver.submit(filename, data)
+        if wait:
+            autosaver.flush(filename)
+
+    flush_saves = autosaver.flush
 
     # === Snapshots ===
     get_state_snapshot = SnapshotMaker.get_state_snapshot
@@ -32,4 +52,5 @@ class StateManager:
 
     # === Helpers (проброс для совместимости) ===
     restore_actions = ActionSerializer.restore_actions
-    _serialize_actions = ActionSerializer.serialize_actions
\ No newline at end of file
+    _serialize_actions = ActionSerializer.serialize_actions
+    restore_executed_slots = ActionSerializer.restore_executed_slots
\ No newline at end of file
@@ -0,0 +1,370 @@
+import os
+
+from core.logging import logger, LogLevel
+from logic.state import codec
+from logic.state.codec import clone
+from logic.state.file_manager import StateFileManager
+
+# Ключи UI, которые не нужны для отката боя
+_UI_KEYS = ("page", "profile_unit", "leveling_unit", "tree_unit", "checks_unit")
+_TEAMS = ("team_left", "team_right")
+_MISSING = object()
+
+
+def _unit_diff(prev: dict, cur: dict) -> dict:
+    """Структурный дифф юнита: измененные верхнеуровневые поля + удаленные ключи."""
+    changed = {k: v for k, v in cur.items() if prev.get(k, _MISSING) != v}
+    removed = [k for k in prev if k not in cur]
+    diff = {}
+    if changed: diff["set"] = changed
+    if removed: diff["del"] = removed
+    return diff
+
+
+def _apply_unit_diff(unit_data: dict, diff: dict):
+    unit_data.update(diff.get("set", {}))
+    for k in diff.get("del", ()):
+        unit_data.pop(k, None)
+
+
+class _SpillFile:
+    """
+    Сжатые (codec.dumps) записи старых ходов в побочном файле data/states/.<name>.undo.<gen>.
+    Без имени сейва записи хранятся в буфере в памяти.
+    Ссылка на запись - [offset, length]. При сжатии файла gen растет; старый файл остается, пока
+    на диске не сохранен манифест с новым gen (StateFileManager.save_data), или до следующей загрузки.
+    """
+    COMPACT_MIN_GARBAGE = 64 * 1024
+
+    def __init__(self, name: str = None, gen: int = 0):
+        self.name = name
+        self.gen = gen
+        self._buffer = bytearray() if name is None else None
+        self.live_bytes = 0
+        self.garbage_bytes = 0
+
+    @property
+    def path(self):
+        return StateFileManager.history_path(self.name, self.gen) if self.name is not None else None
+
+    def _write_blob(self, blob: bytes) -> list:
+        if self._buffer is not None:
+            offset = len(self._buffer)
+            self._buffer += blob
+        else:
+            StateFileManager.ensure_dir()
+            with open(self.path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(blob)
+        self.live_bytes += len(blob)
+        return [offset, len(blob)]
+
+    def _read_blob(self, ref) -> bytes:
+        offset, length = ref
+        if self._buffer is not None:
+            return bytes(self._buffer[offset:offset + length])
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def append(self, record: dict) -> list:
+        return self._write_blob(codec.dumps(record))
+
+    def read(self, ref) -> dict:
+        return codec.loads(self._read_blob(ref))
+
+    def release(self, ref):
+        self.live_bytes -= ref[1]
+        self.garbage_bytes += ref[1]
+
+    def needs_compaction(self) -> bool:
+        return self.garbage_bytes > max(self.live_bytes, self.COMPACT_MIN_GARBAGE)
+
+    def compact(self, refs: list) -> list:
+        """Переписывает живые записи в новый файл, возвращает их новые ссылки."""
+        blobs = [self._read_blob(ref) for ref in refs]
+        self.gen += 1
+        if self._buffer is not None:
+            self._buffer = bytearray()
+        else:
+            # Новое поколение пишется с нуля (мог остаться файл от прерванного сеанса)
+            StateFileManager.ensure_dir()
+            open(self.path, "wb").close()
+        self.live_bytes = self.garbage_bytes = 0
+        return [self._write_blob(blob) for blob in blobs]
+
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+        if self._buffer is not None:
+            self._buffer = bytearray()
+        self.live_bytes = self.garbage_bytes = 0
+
+
+class _Entry:
+    __slots__ = ("id", "round", "kind", "record", "ref")
+
+    def __init__(self, entry_id, round_number, kind, record=None, ref=None):
+        self.id = entry_id
+        self.round = round_number
+        self.kind = kind  # "key" - полный кадр, "delta" - дифф к предыдущей записи
+        self.record = record  # dict в памяти (свежие записи)
+        self.ref = ref  # ссылка в _SpillFile (старые записи)
+
+
+class UndoHistory:
+    """
+    История ходов для "машины времени" симулятора.
+    - Каждые KEYFRAME_EVERY записей (и при смене состава команд) - полный кадр,
+      между ними - диффы юнитов относительно предыдущей записи.
+    - battle_logs хранятся отдельно от состояния: запись хранит только новые строки,
+      если предыдущий лог является их префиксом.
+    - В памяти остаются HOT_ENTRIES последних записей, остальные сжимаются в побочный файл.
+    - Не больше MAX_ENTRIES записей: самая старая удаляется, следующая становится полным кадром.
+    """
+    KEYFRAME_EVERY = 10
+    HOT_ENTRIES = 5
+    MAX_ENTRIES = 50
+    VERSION = 1
+
+    def __init__(self, name: str = None, gen: int = 0):
+        self.name = name
+        self._spill = _SpillFile(name, gen)
+        self._entries = []
+        self._next_id = 0
+        # Кэш последней записи для построения диффа: (юниты по командам, battle_logs)
+        self._prev = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def rounds(self) -> list:
+        return [e.round for e in self._entries]
+
+    # === ДОБАВЛЕНИЕ ===
+
+    def push(self, snapshot: dict):
+        """Добавляет полный слепок (SnapshotMaker.get_state_snapshot) как новую запись."""
+        state = {k: v for k, v in snapshot.items() if k not in _UI_KEYS and k not in ("battle_logs", "script_logs")}
+        logs = list(snapshot.get("battle_logs", []))
+        units = {team: state.pop(f"{team}_data", []) for team in _TEAMS}
+
+        prev = self._ensure_prev()
+        kind = "key"
+        if prev is not None and self._since_keyframe() < self.KEYFRAME_EVERY - 1 and \
+                all([u.get("name") for u in units[t]] == [u.get("name") for u in prev[0][t]] for t in _TEAMS):
+            kind = "delta"
+
+        if kind == "key":
+            for team in _TEAMS:
+                state[f"{team}_data"] = units[team]
+        else:
+            for team in _TEAMS:
+                state[f"{team}_diff"] = [_unit_diff(p, c) for p, c in zip(prev[0][team], units[team])]
+
+        record = {"state": state, "script_logs": snapshot.get("script_logs", "")}
+        prev_logs = prev[1] if prev is not None else None
+        if prev_logs is not None and len(logs) >= len(prev_logs) and logs[:len(prev_logs)] == prev_logs:
+            record["logs_base"] = True
+            record["logs_tail"] = logs[len(prev_logs):]
+        else:
+            record["logs_tail"] = logs
+
+        entry = _Entry(self._next_id, snapshot.get("round_number", 1), kind, record=record)
+        self._next_id += 1
+        self._entries.append(entry)
+        self._prev = (units, logs)
+
+        while len(self._entries) > self.MAX_ENTRIES:
+            self._drop_oldest()
+        self._spill_cold()
+
+        logger.log(f"🕰️ Undo: +{kind} round {entry.round} ({len(self._entries)} entries)", LogLevel.VERBOSE, "State")
+
+    def _since_keyframe(self) -> int:
+        count = 0
+        for e in reversed(self._entries):
+            if e.kind == "key":
+                return count
+            count += 1
+        return count
+
+    def _ensure_prev(self):
+        if self._prev is None and self._entries:
+            snap = self.snapshot(len(self._entries) - 1)
+            if snap is not None:
+                self._prev = ({t: snap[f"{t}_data"] for t in _TEAMS}, snap["battle_logs"])
+        return self._prev
+
+    # === ЧТЕНИЕ ===
+
+    def _record(self, idx: int) -> dict:
+        entry = self._entries[idx]
+        return entry.record if entry.record is not None else self._spill.read(entry.ref)
+
+    def snapshot(self, idx: int):
+        """Полный слепок записи idx (формат SnapshotMaker.get_state_snapshot) или None при ошибке чтения."""
+        if not 0 <= idx < len(self._entries):
+            return None
+        try:
+            key_idx = idx
+            while self._entries[key_idx].kind != "key":
+                key_idx -= 1
+
+            state = clone(self._record(key_idx)["state"])
+            for j in range(key_idx + 1, idx + 1):
+                delta = self._record(j)["state"]
+                for team in _TEAMS:
+                    for unit_data, diff in zip(state[f"{team}_data"], delta[f"{team}_diff"]):
+                        _apply_unit_diff(unit_data, clone(diff))
+                state.update({k: clone(v) for k, v in delta.items() if not k.endswith("_diff")})
+
+            record = self._record(idx)
+            state["battle_logs"] = self._logs(idx)
+            state["script_logs"] = record.get("script_logs", "")
+            state["type"] = "full"
+            return state
+        except (OSError, ValueError, KeyError, IndexError) as e:
+            logger.log(f"🕰️ Undo: failed to read entry {idx}: {e}", LogLevel.MINIMAL, "State")
+            return None
+
+    def _logs(self, idx: int) -> list:
+        tails = []
+        while True:
+            record = self._record(idx)
+            tails.append(record.get("logs_tail", []))
+            if not record.get("logs_base") or idx == 0:
+                break
+            idx -= 1
+        logs = []
+        for tail in reversed(tails):
+            logs.extend(clone(tail))
+        return logs
+
+    # === ОБРЕЗКА ===
+
+    def truncate(self, count: int):
+        """Оставляет первые count записей (откат к раунду)."""
+        for entry in self._entries[count:]:
+            if entry.ref is not None:
+                self._spill.release(entry.ref)
+        del self._entries[count:]
+        self._prev = None
+        self._maybe_compact()
+
+    def clear(self):
+        self._entries = []
+        self._prev = None
+        self._spill.clear()
+
+    def _drop_oldest(self):
+        """Удаляет первую запись, превращая вторую в самостоятельный полный кадр."""
+        nxt = self._entries[1]
+        snap = self.snapshot(1)
+        record = {
+            "state": {k: v for k, v in snap.items() if k not in ("type", "battle_logs", "script_logs")},
+            "script_logs": snap["script_logs"],
+            "logs_tail": snap["battle_logs"],
+        }
+        record["state"]["type"] = "full"
+        for old in self._entries[:2]:
+            if old.ref is not None:
+                self._spill.release(old.ref)
+        nxt.kind, nxt.record, nxt.ref = "key", record, None
+        del self._entries[0]
+        self._maybe_compact()
+
+    def _spill_cold(self):
+        """Сбрасывает записи старше HOT_ENTRIES в сжатый побочный файл."""
+        for entry in self._entries[:-self.HOT_ENTRIES]:
+            if entry.record is not None:
+                entry.ref = self._spill.append(entry.record)
+                entry.record = None
+
+    def _maybe_compact(self):
+        if not self._spill.needs_compaction():
+            return
+        cold = [e for e in self._entries if e.ref is not None]
+        for entry, ref in zip(cold, self._spill.compact([e.ref for e in cold])):
+            entry.ref = ref
+
+    # === СОХРАНЕНИЕ ===
+
+    def to_dict(self) -> dict:
+        """Манифест для файла сейва: свежие записи целиком, старые - ссылками в побочный файл."""
+        entries = []
+        for e in self._entries:
+            item = {"id": e.id, "round": e.round, "kind": e.kind}
+            if e.record is not None:
+                item["record"] = e.record
+            else:
+                item["ref"] = e.ref
+            entries.append(item)
+        return {"version": self.VERSION, "gen": self._spill.gen, "next_id": self._next_id, "entries": entries}
+
+    @classmethod
+    def from_dict(cls, data: dict, name: str = None) -> "UndoHistory":
+        history = cls(name, data.get("gen", 0))
+        history._next_id = data.get("next_id", 0)
+        for item in data.get("entries", []):
+            history._entries.append(_Entry(item["id"], item.get("round", 1), item.get("kind", "key"),
+                                           record=item.get("record"), ref=item.get("ref")))
+
+        refs = [e.ref for e in history._entries if e.ref is not None]
+        spill = history._spill
+        spill.live_bytes = sum(r[1] for r in refs)
+        if refs and spill.path:
+            if not os.path.exists(spill.path):
+                # Побочный файл потерян: оставляем только записи после последнего кадра в памяти
+                logger.log(f"🕰️ Undo: side file {spill.path} missing, old rounds dropped", LogLevel.MINIMAL, "State")
+                history._drop_unreadable()
+            else:
+                spill.garbage_bytes = max(0, os.path.getsize(spill.path) - spill.live_bytes)
+        if name is not None:
+            # Поколения до сжатия, которое уже попало в сохраненный манифест
+            StateFileManager.prune_history(name, spill.gen)
+        return history
+
+    def _drop_unreadable(self):
+        keep_from = len(self._entries)
+        for idx in range(len(self._entries) - 1, -1, -1):
+            entry = self._entries[idx]
+            if entry.record is None:
+                break
+            if entry.kind == "key":
+                keep_from = idx
+        self._entries = self._entries[keep_from:]
+        if self._entries:
+            self._entries[0].record.pop("logs_base", None)
+        self._spill.live_bytes = 0
+
+    @classmethod
+    def from_legacy(cls, stack: list, name: str = None) -> "UndoHistory":
+        """Старый формат undo_stack: [полный слепок, динамические слепки...]."""
+        history = cls(name)
+        if name is not None:
+            # До первого сохранения старый стек переливается при каждой загрузке: начинаем с пустого файла
+            StateFileManager.prune_history(name)
+        base = stack[0] if stack and stack[0].get("type") == "full" else None
+        for snap in stack:
+            if snap.get("type") == "dynamic":
+                if base is None:
+                    continue
+                full = dict(base)
+                full.update({k: v for k, v in snap.items() if not k.endswith("_dyn")})
+                for team in _TEAMS:
+                    dyn = snap.get(f"{team}_dyn", [])
+                    full[f"{team}_data"] = [{**u, **dyn[i]} if i < len(dyn) else u
+                                            for i, u in enumerate(base.get(f"{team}_data", []))]
+                snap = full
+            history.push(snap)
+        return history
+
+    @classmethod
+    def load(cls, data: dict, name: str = None) -> "UndoHistory":
+        """История из данных файла сейва (новый манифест, старый undo_stack или пусто)."""
+        if isinstance(data.get("undo_history"), dict):
+            return cls.from_dict(data["undo_history"], name)
+        if data.get("undo_stack"):
+            return cls.from_legacy(data["undo_stack"], name)
+        return cls(name)
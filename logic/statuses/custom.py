@@ -1,7 +1,6 @@
-import random
-
 from core.enums import DiceType
 from core.logging import logger, LogLevel
+from logic.battle_flow.battle_scope import get_rng
 from logic.context import RollContext
 from logic.statuses.common import StatusEffect
 
@@ -11,7 +10,7 @@ class SelfControlStatus(StatusEffect):
 
     def on_hit(self, ctx: RollContext, stack: int):
         chance = min(100, stack * 5)
-        roll = random.randint(1, 100)
+        roll = get_rng().randint(1, 100)
         if roll <= chance:
             ctx.damage_multiplier *= 2.0
             ctx.is_critical = True
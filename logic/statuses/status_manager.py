@@ -16,29 +16,30 @@ class StatusManager:
         """
         logs = []
 
-        active_ids = list(unit._status_effects.keys())
+        store = unit._ensure_status_storage()
 
-        for status_id in active_ids:
-            if status_id not in unit._status_effects: continue
+        for status_id in list(store.keys()):
+            if status_id not in store: continue
 
             # --- ЛОГИКА ЭФФЕКТОВ ПЕРЕНЕСЕНА В TRIGGER_MECHANICS ---
             # Здесь мы только управляем длительностью (Duration)
 
-            # 1. Уменьшаем Duration
-            current_instances = unit._status_effects[status_id]
-            next_instances = []
-
+            # 1. Уменьшаем Duration (порядок по duration сохраняется)
+            current_instances = store[status_id]
             for item in current_instances:
                 item["duration"] -= 1
-                if item["duration"] > 0:
-                    next_instances.append(item)
-
-            # 2. Обновляем или удаляем
-            if next_instances:
-                unit._status_effects[status_id] = next_instances
-            else:
-                del unit._status_effects[status_id]
+
+            # 2. Истекшие экземпляры стоят в начале списка
+            expired = 0
+            while expired < len(current_instances) and current_instances[expired]["duration"] <= 0:
+                expired += 1
+
+            # 3. Обновляем или удаляем
+            if expired == len(current_instances):
+                del store[status_id]
                 logger.log(f"📉 Status Expired: {status_id} on {unit.name}", LogLevel.VERBOSE, "Status")
+            elif expired:
+                store.set_sorted(status_id, current_instances[expired:])
 
         # Обработка Delayed
         if unit.delayed_queue:
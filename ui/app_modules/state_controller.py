@@ -3,6 +3,7 @@ import streamlit as st
 from core.unit.unit import Unit
 from core.unit.unit_library import UnitLibrary
 from logic.state.state_manager import StateManager
+from logic.state.undo_history import UndoHistory
 
 
 def update_and_save_state():
@@ -111,9 +112,8 @@ def load_initial_state():
         st.session_state['turn_phase'] = saved_data.get('turn_phase', 'planning')
         st.session_state['action_idx'] = saved_data.get('action_idx', 0)
 
-        st.session_state['executed_slots'] = set()
-        for item in saved_data.get('executed_slots', []):
-            st.session_state['executed_slots'].add(tuple(item))
+        st.session_state['executed_slots'] = StateManager.restore_executed_slots(
+            saved_data.get('executed_slots', []), team_left, team_right)
 
         # Actions
         raw_actions = saved_data.get('turn_actions', [])
@@ -122,6 +122,9 @@ def load_initial_state():
         else:
             st.session_state['turn_actions'] = []
 
+        # История ходов (манифест UndoHistory или старый undo_stack)
+        st.session_state['undo_history'] = UndoHistory.load(saved_data, current_file)
+
         # Селекторы
         selector_mapping = {
             "profile_unit": "profile_selected_unit",
@@ -2,6 +2,7 @@ import copy
 
 import streamlit as st
 
+from logic.battle_flow.team_index import invalidate_team_index
 from ui.app_modules.state_controller import update_and_save_state
 
 
@@ -38,6 +39,7 @@ def render_team_builder_sidebar():
 
         if as_template:
             unit_to_add = copy.deepcopy(base_unit)
+            unit_to_add.renew_uid()
             existing_names = [u.name for u in st.session_state['team_left'] + st.session_state['team_right']]
             count = 0
             for name in existing_names:
@@ -59,6 +61,7 @@ def render_team_builder_sidebar():
         }
 
         st.session_state[target_list_key].append(unit_to_add)
+        invalidate_team_index(st.session_state[target_list_key])
         st.session_state['battle_logs'] = []
         update_and_save_state()
 
@@ -74,6 +77,7 @@ def render_team_builder_sidebar():
 
     def remove_unit(team_key, idx):
         st.session_state[team_key].pop(idx)
+        invalidate_team_index(st.session_state[team_key])
         update_and_save_state()
         st.rerun()
 
@@ -0,0 +1,100 @@
+import hashlib
+import os
+import threading
+
+# Исходные аватары и кэш уменьшенных копий
+AVATAR_DIR = "data/avatars"
+THUMB_DIR = "data/cache/avatars"
+
+# Размеры превью (ширина, px): 64 - иконки в списках, 128 - карточки, 256 - шапки профиля
+THUMB_SIZES = (64, 128, 256)
+THUMB_QUALITY = 85
+
+# (путь исходника, размер) -> (mtime_ns исходника, путь превью)
+_thumbs = {}
+_lock = threading.Lock()
+
+
+def _thumb_prefix(path: str, size: int) -> str:
+    # Имя превью привязано к пути исходника (разные папки/расширения не пересекаются)
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}_{digest}_{size}_"
+
+
+def _fit_size(size: int) -> int:
+    """Ближайший размер из THUMB_SIZES, не меньше запрошенного."""
+    for s in THUMB_SIZES:
+        if s >= size:
+            return s
+    return THUMB_SIZES[-1]
+
+
+def _build_thumb(path: str, size: int, mtime: int):
+    """Уменьшает исходник до ширины size и пишет WebP в THUMB_DIR. Возвращает путь или None."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    prefix = _thumb_prefix(path, size)
+    thumb_path = os.path.join(THUMB_DIR, f"{prefix}{mtime}.webp")
+    if os.path.exists(thumb_path):
+        return thumb_path
+
+    try:
+        with Image.open(path) as img:
+            img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+            if img.width > size:
+                img = img.resize((size, max(1, round(img.height * size / img.width))), Image.LANCZOS)
+            os.makedirs(THUMB_DIR, exist_ok=True)
+            tmp_path = thumb_path + ".tmp"
+            img.save(tmp_path, format="WEBP", quality=THUMB_QUALITY, method=4)
+            os.replace(tmp_path, thumb_path)
+    except Exception:
+        return None
+
+    # Устаревшие превью этого исходника (от прежних версий файла)
+    for name in os.listdir(THUMB_DIR):
+        if name.startswith(prefix) and os.path.join(THUMB_DIR, name) != thumb_path:
+            try:
+                os.remove(os.path.join(THUMB_DIR, name))
+            except OSError:
+                pass
+    return thumb_path
+
+
+def get_avatar_thumb(path: str, size: int = 128):
+    """
+    Путь к WebP-превью аватара шириной size (округляется вверх до THUMB_SIZES).
+    Превью создается при первом запросе и пересоздается при изменении исходника (по mtime).
+    Если исходника нет - None; если превью не получилось (нет Pillow, битый файл) - исходный путь.
+    """
+    if not path:
+        return None
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    size = _fit_size(size)
+    cached = _thumbs.get((path, size))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _lock:
+        thumb_path = _build_thumb(path, size, mtime) or path
+        _thumbs[(path, size)] = (mtime, thumb_path)
+    return thumb_path
+
+
+def build_avatar_thumbs(path: str):
+    """Создает все размеры превью сразу (после загрузки нового аватара)."""
+    for size in THUMB_SIZES:
+        get_avatar_thumb(path, size)
+
+
+def unit_avatar(unit, size: int = 128, placeholder: str = None):
+    """Превью аватара юнита (avatar или icon_path) или placeholder, если картинки нет."""
+    path = getattr(unit, 'avatar', None) or getattr(unit, 'icon_path', None)
+    return get_avatar_thumb(path, size) or placeholder
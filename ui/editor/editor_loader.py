@@ -49,7 +49,7 @@ def load_card_to_state(card):
     st.session_state["ed_desc"] = card.description
     st.session_state["ed_tier"] = card.tier
     st.session_state["ed_loaded_id"] = card.id
-    st.session_state["ed_flags"] = card.flags if card.flags else []
+    st.session_state["ed_flags"] = list(card.flags) if card.flags else []
     source = Library.get_source(card.id)
     if source:
         st.session_state["ed_source_file"] = source
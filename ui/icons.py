@@ -1,8 +1,9 @@
 import base64
+import io
+import math
 import mimetypes
 import os
-
-import streamlit as st
+import threading
 
 # Путь к папке с иконками
 ICON_DIR = "data/icons"
@@ -144,43 +145,131 @@ FALLBACK_EMOJIS = {
 }
 
 
-@st.cache_data
-def get_icon_html(key: str, width: int = 20) -> str:
-    """
-    Возвращает HTML-тег <img>. Автоматически определяет MIME-тип (png/webp/jpeg).
-    """
-    key = key.lower()
+# Спрайт-лист: все иконки в одной картинке (одна data-URI в CSS вместо base64 в каждом теге).
+# Выключен по умолчанию: включите USE_SPRITE, CSS подключается в apply_styles()
+USE_SPRITE = False
+SPRITE_CELL = 64  # Размер ячейки спрайта, px
+SPRITE_CLASS = "lor-icon"
+
+# Кэши на процесс (иконки не меняются во время работы приложения)
+_data_uris = {}  # filename -> data-URI (или None, если файла нет / ошибка чтения)
+_icon_html = {}  # (key, width, sprite) -> HTML
+_sprite = None  # (css, {filename: (col, row)}, cols, rows) после первой сборки
+_lock = threading.Lock()
+
+
+def _mime_type(filename: str) -> str:
+    mime_type, _ = mimetypes.guess_type(filename)
+    if not mime_type:
+        # Фолбек для webp, если mimetypes его не знает
+        mime_type = "image/webp" if filename.endswith(".webp") else "image/png"
+    return mime_type
+
+
+def _data_uri(filename: str):
+    """data-URI файла иконки (читается и кодируется один раз)."""
+    if filename in _data_uris:
+        return _data_uris[filename]
+    uri = None
+    path = os.path.join(ICON_DIR, filename)
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                encoded = base64.b64encode(f.read()).decode()
+            uri = f"data:{_mime_type(filename)};base64,{encoded}"
+        except Exception:
+            uri = None
+    _data_uris[filename] = uri
+    return uri
+
+
+def _build_sprite():
+    """Склеивает все иконки ICON_FILES в сетку SPRITE_CELL x SPRITE_CELL (нужен Pillow)."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return "", {}, 0, 0
+
+    files = [f for f in dict.fromkeys(ICON_FILES.values()) if os.path.exists(os.path.join(ICON_DIR, f))]
+    if not files:
+        return "", {}, 0, 0
 
-    # Пытаемся найти прямое совпадение
-    filename = ICON_FILES.get(key)
+    cols = math.ceil(math.sqrt(len(files)))
+    rows = math.ceil(len(files) / cols)
+    sheet = Image.new("RGBA", (cols * SPRITE_CELL, rows * SPRITE_CELL), (0, 0, 0, 0))
+    positions = {}
+    for i, filename in enumerate(files):
+        try:
+            with Image.open(os.path.join(ICON_DIR, filename)) as img:
+                icon = img.convert("RGBA")
+        except Exception:
+            continue
+        icon.thumbnail((SPRITE_CELL, SPRITE_CELL))
+        col, row = i % cols, i // cols
+        # Иконка по центру ячейки (пропорции сохраняются)
+        x = col * SPRITE_CELL + (SPRITE_CELL - icon.width) // 2
+        y = row * SPRITE_CELL + (SPRITE_CELL - icon.height) // 2
+        sheet.paste(icon, (x, y), icon)
+        positions[filename] = (col, row)
 
-    # Если не нашли, пробуем эвристику для типов атак (Counter Slash -> contrslash)
-    if not filename:
-        if "counter" in key:
-            # Пример: "counter_slash" -> ищем "contrslash" (но у нас ключи маппинга есть)
-            pass
+    buf = io.BytesIO()
+    sheet.save(buf, format="WEBP", lossless=True)
+    encoded = base64.b64encode(buf.getvalue()).decode()
+    css = (f"<style>.{SPRITE_CLASS} {{ display: inline-block; vertical-align: middle; margin-bottom: 2px; "
+           f"background-image: url(data:image/webp;base64,{encoded}); background-repeat: no-repeat; }}</style>")
+    return css, positions, cols, rows
 
+
+def _get_sprite():
+    global _sprite
+    if _sprite is None:
+        with _lock:
+            if _sprite is None:
+                _sprite = _build_sprite()
+    return _sprite
+
+
+def get_icon_sprite_css() -> str:
+    """<style> со спрайт-листом (собирается один раз на процесс). Пустая строка, если спрайт недоступен."""
+    return _get_sprite()[0]
+
+
+def _sprite_html(filename: str, width: int):
+    _, positions, cols, rows = _get_sprite()
+    pos = positions.get(filename)
+    if pos is None:
+        return None
+    col, row = pos
+    return (f'<span class="{SPRITE_CLASS}" style="width: {width}px; height: {width}px; '
+            f'background-size: {cols * width}px {rows * width}px; '
+            f'background-position: -{col * width}px -{row * width}px;"></span>')
+
+
+def get_icon_html(key: str, width: int = 20, sprite: bool = None) -> str:
+    """
+    Возвращает HTML-тег <img> (MIME-тип определяется по файлу: png/webp/jpeg).
+    Результат кэшируется на процесс по (key, width): файл читается и кодируется один раз.
+    sprite=True (по умолчанию USE_SPRITE) - <span> из спрайт-листа, нужен CSS из get_icon_sprite_css().
+    """
+    if sprite is None:
+        sprite = USE_SPRITE
+    cache_key = (key, width, sprite)
+    html = _icon_html.get(cache_key)
+    if html is not None:
+        return html
+
+    lower = key.lower()
+    filename = ICON_FILES.get(lower)
+    html = None
     if filename:
-        path = os.path.join(ICON_DIR, filename)
-        if os.path.exists(path):
-            try:
-                # 1. Определяем MIME-тип
-                mime_type, _ = mimetypes.guess_type(path)
-                if not mime_type:
-                    # Фолбек для webp, если mimetypes его не знает
-                    if filename.endswith(".webp"):
-                        mime_type = "image/webp"
-                    else:
-                        mime_type = "image/png"
-
-                # 2. Читаем и кодируем
-                with open(path, "rb") as f:
-                    data = f.read()
-                    encoded = base64.b64encode(data).decode()
-
-                # 3. Вставляем
-                return f'<img src="data:{mime_type};base64,{encoded}" width="{width}" style="vertical-align: middle; margin-bottom: 2px;">'
-            except Exception:
-                pass
-
-    return FALLBACK_EMOJIS.get(key, "❓")
\ No newline at end of file
+        if sprite:
+            html = _sprite_html(filename, width)
+        if html is None:
+            uri = _data_uri(filename)
+            if uri:
+                html = f'<img src="{uri}" width="{width}" style="vertical-align: middle; margin-bottom: 2px;">'
+
+    if html is None:
+        html = FALLBACK_EMOJIS.get(lower, "❓")
+    _icon_html[cache_key] = html
+    return html
@@ -4,6 +4,8 @@ from collections import Counter
 
 import streamlit as st
 
+from core.library import Library
+
 BUILDS_DIR = "data/builds"
 
 def ensure_builds_dir():
@@ -31,25 +33,15 @@ def load_build_ids(filename):
         return []
 
 def get_card_source_files():
-    """Возвращает список файлов .json из папки data/cards"""
-    path = "data/cards"
-    if not os.path.exists(path): return []
-    return sorted([f for f in os.listdir(path) if f.endswith(".json")])
+    """Возвращает список файлов .json из папки data/cards (каталог Library)"""
+    return Library.get_source_files()
 
 def load_ids_from_source(filename):
     """Извлекает ID всех карт из файла источника"""
-    path = os.path.join("data/cards", filename)
-    ids = []
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            cards = data.get("cards", []) if isinstance(data, dict) else data
-            if isinstance(cards, list):
-                for c in cards:
-                    if isinstance(c, dict) and "id" in c:
-                        ids.append(c["id"])
-    except Exception as e:
-        st.error(f"Ошибка чтения файла источника: {e}")
+    ids = Library.get_file_ids(filename, refresh=True)
+    if ids is None:
+        st.error(f"Файл источника не найден: {filename}")
+        return []
     return ids
 
 def force_update_deck_ui(u_key, new_deck_ids, all_valid_ids):
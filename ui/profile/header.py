@@ -6,6 +6,7 @@ from core.game_templates import CHARACTER_TEMPLATES
 from core.ranks import RANK_THRESHOLDS
 from core.unit.unit import Unit
 from core.unit.unit_library import UnitLibrary
+from ui.avatars import build_avatar_thumbs, unit_avatar
 
 
 def save_avatar_file(uploaded, unit_name):
@@ -13,6 +14,7 @@ def save_avatar_file(uploaded, unit_name):
     safe = "".join(c for c in unit_name if c.isalnum() or c in (' ', '_', '-')).strip().replace(" ", "_")
     path = f"data/avatars/{safe}.{uploaded.name.split('.')[-1]}"
     with open(path, "wb") as f: f.write(uploaded.getbuffer())
+    build_avatar_thumbs(path)
     return path
 
 
@@ -205,8 +207,7 @@ def render_header(roster):
 
 def render_basic_info(unit, u_key):
     # Avatar
-    img = unit.avatar if unit.avatar and os.path.exists(
-        unit.avatar) else "https://placehold.co/150x150/png?text=No+Image"
+    img = unit_avatar(unit, 256, "https://placehold.co/150x150/png?text=No+Image")
     st.image(img, width='stretch')
     upl = st.file_uploader("Загрузить арт", type=['png', 'jpg'], label_visibility="collapsed", key=f"upl_{u_key}")
     if upl:
@@ -25,7 +25,7 @@ def render_profile_page():
     # 2. Обновить значения unit (HP, SP и т.д.), чтобы render_stats показал актуальные цифры.
 
     logger.clear()  # Очищаем логгер перед расчетом
-    unit.recalculate_stats()  # Запускаем расчет (он пишет в logger)
+    unit.recalculate_stats(force=True)  # Полный расчет (он пишет в logger)
     calculation_logs = logger.get_logs()  # Забираем то, что насчитали
 
     # === ОТРИСОВКА ИНТЕРФЕЙСА ===
@@ -1,18 +1,16 @@
 import streamlit as st
-import os
 
 # Импортируем библиотеку для сохранения файлов напрямую
 from core.unit.unit_library import UnitLibrary
 from ui.app_modules.state_controller import update_and_save_state
+from ui.avatars import unit_avatar
 # Импортируем Enum для красивых названий типов
 from core.enums import UnitType
 
 
-def get_avatar_path(unit):
-    path = getattr(unit, 'avatar', None) or getattr(unit, 'icon_path', None)
-    if path and os.path.exists(path):
-        return path
-    return "https://placehold.co/200x300?text=No+Image"
+def get_avatar_path(unit, size: int = 256):
+    """Превью аватара (WebP из кэша) или заглушка."""
+    return unit_avatar(unit, size, "https://placehold.co/200x300?text=No+Image")
 
 
 def save_unit_data(unit):
@@ -170,7 +168,7 @@ def render_relationships_page():
 
                 # 1. Аватар собеседника
                 with c_img:
-                    st.image(get_avatar_path(target_unit), width='stretch')
+                    st.image(get_avatar_path(target_unit, 128), width='stretch')
 
                 # 2. Информация (Две строки)
                 with c_info:
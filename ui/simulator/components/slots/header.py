@@ -26,4 +26,9 @@ def render_slot_header(slot, slot_idx):
 
     lock_icon = "🔒 " if slot.get('locked') else ""
 
-    return f"{lock_icon}S{slot_idx + 1} ({spd_label}) | {ui_stat['icon']} {ui_stat['text']} | {card_name_header}"
\ No newline at end of file
+    odds = slot.get('ui_odds')
+    odds_label = ""
+    if odds:
+        odds_label = f" | 🎯 {odds['win']:.0%} · 💥 {odds['dmg_dealt']:.1f}/{odds['dmg_taken']:.1f}"
+
+    return f"{lock_icon}S{slot_idx + 1} ({spd_label}) | {ui_stat['icon']} {ui_stat['text']}{odds_label} | {card_name_header}"
\ No newline at end of file
@@ -82,6 +82,19 @@ def render_card_info(unit, slot):
 
         st.markdown(" ".join(dice_display), unsafe_allow_html=True)
 
+        # === ШАНСЫ ПО КУБИКАМ (precalculate_interactions) ===
+        odds = slot.get('ui_odds')
+        if odds:
+            odds_lines = []
+            for i, o in enumerate(odds['dice']):
+                line = f"#{i + 1}: 🏆 {o.win:.0%} / 🤝 {o.draw:.0%} / ❌ {o.loss:.0%}"
+                if o.dmg_dealt or o.dmg_taken:
+                    line += f" | 💥 {o.dmg_dealt:.1f} / 🩸 {o.dmg_taken:.1f}"
+                if o.stagger_dealt or o.stagger_taken:
+                    line += f" | 😵 {o.stagger_dealt:.1f} / {o.stagger_taken:.1f}"
+                odds_lines.append(line)
+            st.caption("🎯 " + " · ".join(odds_lines))
+
     # Scripts info
     desc_text = []
     if "on_use" in selected_card.scripts:
@@ -1,16 +1,19 @@
-from logic.clash import ClashSystem
+from logic.battle_flow.interaction_graph import InteractionGraph, LEFT, RIGHT
+from logic.mechanics.rolling.dice_odds import slot_clash_odds as _clash_odds, slot_onesided_odds as _onesided_odds
 
 
 def precalculate_interactions(team_left: list, team_right: list):
     """
     Финальная версия с визуализацией сломанных кубиков (Speed Break).
     """
-    ClashSystem.calculate_redirections(team_left, team_right)
-    ClashSystem.calculate_redirections(team_right, team_left)
+    graph = InteractionGraph(team_left, team_right)
+    graph.resolve_redirections()
 
-    def update_ui_status(my_team, enemy_team):
+    def update_ui_status(side):
+        my_team, enemy_team = graph.teams[side], graph.teams[1 - side]
         for my_idx, me in enumerate(my_team):
             for my_slot_idx, my_slot in enumerate(me.active_slots):
+                my_slot.pop('ui_odds', None)
 
                 if my_slot.get('stunned'):
                     my_slot['ui_status'] = {"text": "ОГЛУШЕН", "icon": "❌", "color": "gray"}
@@ -23,26 +26,11 @@ def precalculate_interactions(team_left: list, team_right: list):
                 target_team_list = my_team if is_friendly else enemy_team
 
                 # --- 1. ПРОВЕРКА: ПЕРЕХВАТИЛИ ЛИ МЕНЯ? ---
-                intercepted_by = None
-                if not is_friendly:
-                    for e_idx, enemy in enumerate(enemy_team):
-                        if enemy.is_dead(): continue
-                        for e_s_idx, e_slot in enumerate(enemy.active_slots):
-                            if e_slot.get('force_clash'):
-                                # Враг перехватывает именно этот слот
-                                if e_slot.get('target_unit_idx') == my_idx and \
-                                        e_slot.get('target_slot_idx') == my_slot_idx:
-
-                                    # Если я тоже целюсь в него в этот слот - это Взаимно, не перехват
-                                    if t_u_idx == e_idx and t_s_idx == e_s_idx:
-                                        continue
-
-                                    intercepted_by = (enemy, e_slot, e_s_idx)
-                                    break
-                        if intercepted_by: break
+                intercepted_by = None if is_friendly else graph.interceptor_of(side, my_idx, my_slot_idx)
 
                 if intercepted_by:
                     enemy, e_slot, e_s_idx = intercepted_by
+                    my_slot['ui_odds'] = _clash_odds(me, my_slot, enemy, e_slot)
 
                     # === ПРОВЕРКА: Ломает ли враг меня (даже пустым слотом с талантом) ===
                     is_broken = False
@@ -134,6 +122,12 @@ def precalculate_interactions(team_left: list, team_right: list):
                         if e_intent and e_has:
                             enemy_breaks_me_mutual = True
 
+                # === ШАНСЫ (точное распределение кубиков) ===
+                if is_mutual or (my_slot.get('force_clash') and not my_slot.get('force_onesided')):
+                    my_slot['ui_odds'] = _clash_odds(me, my_slot, target_unit, target_slot)
+                else:
+                    my_slot['ui_odds'] = _onesided_odds(me, my_slot, target_unit, target_slot)
+
                 if i_break_enemy:
                     my_slot['ui_status'] = {
                         "text": f"✨ SPEED BREAK -> {target_unit.name} | Уничтожение ({my_slot['speed']} >> {tgt_spd})",
@@ -191,5 +185,5 @@ def precalculate_interactions(team_left: list, team_right: list):
                         "color": "blue"
                     }
 
-    update_ui_status(team_left, team_right)
-    update_ui_status(team_right, team_left)
\ No newline at end of file
+    update_ui_status(LEFT)
+    update_ui_status(RIGHT)
\ No newline at end of file
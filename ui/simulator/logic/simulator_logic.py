@@ -5,8 +5,7 @@ from io import StringIO
 import streamlit as st
 
 from core.card import Card
-from core.enums import CardType
-from core.library import Library
+from logic.battle_flow.rounds import init_unit_for_battle
 
 
 @contextmanager
@@ -26,50 +25,10 @@ def get_teams():
 
 
 def set_cooldowns(u):
-    if not u.memory.get("battle_initialized"):
-        u.memory["battle_initialized"] = True
-
-        if not hasattr(u, "card_cooldowns") or u.card_cooldowns is None:
-            u.card_cooldowns = {}
-
-        if getattr(u, 'deck', None):
-            # Считаем, сколько копий каждой карты
-            from collections import Counter
-            deck_counts = Counter(u.deck)
-
-            for card_id, count in deck_counts.items():
-                card = Library.get_card(card_id)
-                if card:
-                    # Пропускаем предметы
-                    if card.card_type.upper() == CardType.ITEM.name:
-                        continue
-
-                    # Начальный кулдаун (Tier - 1)
-                    initial_cd = max(0, card.tier - 1)
-
-                    if initial_cd > 0:
-                        # Если есть "разогрев", он накладывается на ВСЕ копии карты в начале боя
-                        # Создаем список длиной равной количеству копий
-                        u.card_cooldowns[card_id] = [initial_cd] * count
-
-        # === ВЫЗОВ ON_COMBAT_START ===
-        l_team, r_team = get_teams()
-        opponents = r_team if u in l_team else l_team
-        my_allies = l_team if u in l_team else r_team
-
-        def log_start(msg):
-            if 'battle_logs' not in st.session_state:
-                st.session_state['battle_logs'] = []
-
-            st.session_state['battle_logs'].append({
-                "round": "Start",
-                "rolls": "Event",
-                "details": f"🚩 **{u.name}**: {msg}"
-            })
-
-        if hasattr(u, "trigger_mechanics"):
-            u.trigger_mechanics("on_combat_start", u, log_start,
-                                enemies=opponents, allies=my_allies)
+    l_team, r_team = get_teams()
+    if 'battle_logs' not in st.session_state:
+        st.session_state['battle_logs'] = []
+    init_unit_for_battle(u, l_team, r_team, logs=st.session_state['battle_logs'])
 
 
 def sync_state_from_widgets(team_left: list, team_right: list):
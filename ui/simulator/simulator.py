@@ -1,7 +1,10 @@
 import streamlit as st
 
+from logic.state.undo_history import UndoHistory
+
 from ui.simulator.views.controls import render_top_controls
 from ui.simulator.views.logs import render_logs
+from ui.simulator.views.profiler import render_profiler_panel
 from ui.simulator.views.sidebar import render_sidebar
 # Импорты новых представлений
 from ui.simulator.views.styles import inject_simulator_styles
@@ -12,7 +15,8 @@ def render_simulator_page():
     # Инициализация состояния
     if 'phase' not in st.session_state: st.session_state['phase'] = 'roll'
     if 'round_number' not in st.session_state: st.session_state['round_number'] = 1
-    if 'undo_stack' not in st.session_state: st.session_state['undo_stack'] = []
+    if 'undo_history' not in st.session_state:
+        st.session_state['undo_history'] = UndoHistory(st.session_state.get("current_state_file", "default"))
 
     # 1. CSS
     inject_simulator_styles()
@@ -33,4 +37,7 @@ def render_simulator_page():
     render_teams(team_left, team_right)
 
     # 6. Логи
-    render_logs(log_level, log_mode_label)
\ No newline at end of file
+    render_logs(log_level, log_mode_label)
+
+    # 7. Отладка
+    render_profiler_panel()
\ No newline at end of file
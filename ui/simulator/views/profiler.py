@@ -0,0 +1,99 @@
+import os
+
+import streamlit as st
+
+from core.profiler import profiler, tracer
+
+SORT_OPTIONS = {
+    "Общее время": "total_ms",
+    "Собственное время": "self_ms",
+    "Вызовы": "calls",
+    "Среднее": "avg_us",
+    "Максимум": "max_us",
+}
+
+
+def render_profiler_panel():
+    """Панель отладки: время пассивок, талантов, статусов и скриптов карт по хукам."""
+    with st.expander("🧪 Профилировщик механик", expanded=False):
+        c_toggle, c_sort, c_reset = st.columns([1.2, 1.5, 1])
+
+        with c_toggle:
+            # Профилировщик общий для процесса: виджет показывает его текущее состояние
+            # и меняет его только по действию пользователя (а не на каждом rerun каждой сессии)
+            st.session_state["sim_profiler_enabled"] = profiler.enabled
+            st.toggle("Замерять (глобально)", key="sim_profiler_enabled", on_change=_toggle_profiler,
+                      help="Отладка: записывать время каждого хука механик и скрипта карт. "
+                           "Включается для всего сервера - замедляет и попадает в замеры боев всех сессий")
+
+        with c_sort:
+            sort_label = st.selectbox("Сортировка", list(SORT_OPTIONS), key="sim_profiler_sort",
+                                      label_visibility="collapsed")
+            sort_by = SORT_OPTIONS[sort_label]
+
+        with c_reset:
+            if st.button("🧹 Сбросить", width='stretch', key="sim_profiler_reset"):
+                profiler.reset()
+
+        _render_trace_controls()
+
+        rows = profiler.rows(sort_by)
+        if not rows:
+            st.caption("Нет замеров. Включите профилировщик и проведите ход.")
+            return
+
+        total_ms = sum(r["self_ms"] for r in rows)
+        st.caption(f"Записей: {len(rows)} | Время механик и скриптов (без вложенных): {total_ms:.1f} мс")
+
+        st.dataframe(
+            rows, hide_index=True, width='stretch',
+            column_config={
+                "kind": st.column_config.TextColumn("Вид"),
+                "source": st.column_config.TextColumn("Механика / скрипт"),
+                "hook": st.column_config.TextColumn("Хук"),
+                "calls": st.column_config.NumberColumn("Вызовы"),
+                "total_ms": st.column_config.NumberColumn("Всего, мс", format="%.3f"),
+                "self_ms": st.column_config.NumberColumn("Свое, мс", format="%.3f"),
+                "avg_us": st.column_config.NumberColumn("Среднее, мкс", format="%.2f"),
+                "max_us": st.column_config.NumberColumn("Макс, мкс", format="%.2f"),
+            },
+        )
+
+        st.download_button("💾 Экспорт CSV", profiler.to_csv(sort_by), file_name="mechanics_profile.csv",
+                           mime="text/csv", key="sim_profiler_csv")
+
+
+def _toggle_profiler():
+    profiler.enable(bool(st.session_state.get("sim_profiler_enabled")))
+
+
+def _toggle_trace():
+    if st.session_state.get("sim_trace_enabled"):
+        profiler.start_trace()
+    else:
+        profiler.stop_trace()
+
+
+def _render_trace_controls():
+    """Запись интервалов хода (turn -> action -> clash -> roll -> hook -> script) для chrome://tracing / Perfetto."""
+    c_trace, c_save = st.columns([2.7, 1])
+    with c_trace:
+        st.session_state["sim_trace_enabled"] = tracer.recording
+        st.toggle("Трассировка хода (глобально)", key="sim_trace_enabled", on_change=_toggle_trace,
+                  help="Записывать вложенные интервалы с отметками времени (файл для Perfetto / chrome://tracing). "
+                       "Как и профилировщик, общая для всех сессий сервера")
+        if tracer.recording or tracer.events:
+            dropped = f", отброшено {tracer.dropped}" if tracer.dropped else ""
+            st.caption(f"Событий: {len(tracer.events)}{dropped}")
+
+    with c_save:
+        if st.button("💾 Трасса", width='stretch', key="sim_trace_save", disabled=not tracer.events,
+                     help="Сохранить трассировку в data/logs"):
+            st.session_state["sim_trace_path"] = tracer.save()
+
+    path = st.session_state.get("sim_trace_path")
+    if path and os.path.exists(path):
+        st.caption(f"Сохранено: `{path}` (откройте в https://ui.perfetto.dev)")
+        with open(path, "rb") as f:
+            st.download_button("⬇️ Скачать трассировку", f.read(), file_name=os.path.basename(path),
+                               mime="application/json", key="sim_trace_download")
@@ -17,34 +17,26 @@ def render_sidebar():
             st.rerun()
 
         # 2. МАШИНА ВРЕМЕНИ
-        undo_stack = st.session_state.get('undo_stack', [])
-        if undo_stack:
+        history = st.session_state.get('undo_history')
+        if history:
             with st.expander("🕰️ История ходов", expanded=True):
-                available_rounds = list(range(1, len(undo_stack) + 1))
-                target_round = st.selectbox(
+                rounds = history.rounds()
+                target_idx = st.selectbox(
                     "Вернуться к началу раунда:",
-                    options=available_rounds,
-                    index=len(available_rounds) - 1,
-                    format_func=lambda x: f"Раунд {x}",
+                    options=list(range(len(rounds))),
+                    index=len(rounds) - 1,
+                    format_func=lambda i: f"Раунд {rounds[i]}",
                     key="timeline_selector"
                 )
 
                 if st.button("⏪ Загрузить состояние", type="primary", width='stretch'):
-                    stack_index = target_round - 1
-                    if 0 <= stack_index < len(undo_stack):
-                        snapshot = undo_stack[stack_index]
-                        if snapshot.get("type") == "dynamic":
-                            base_snapshot = undo_stack[0]
-                            if base_snapshot.get("type") != "full":
-                                st.error("❌ Ошибка истории: Базовый снимок поврежден!")
-                            else:
-                                StateManager.restore_from_dynamic_snapshot(st.session_state, snapshot, base_snapshot)
-                                st.toast(f"Раунд {target_round} восстановлен (Delta)! 🕰️")
-                        else:
-                            StateManager.restore_state_from_snapshot(st.session_state, snapshot)
-                            st.toast(f"Раунд {target_round} восстановлен (Full)! 🕰️")
-
-                        st.session_state['undo_stack'] = undo_stack[:stack_index + 1]
+                    snapshot = history.snapshot(target_idx)
+                    if snapshot is None:
+                        st.error("❌ Ошибка истории: снимок поврежден или недоступен!")
+                    else:
+                        StateManager.restore_state_from_snapshot(st.session_state, snapshot)
+                        history.truncate(target_idx + 1)
+                        st.toast(f"Раунд {rounds[target_idx]} восстановлен! 🕰️")
                         st.rerun()
         else:
             st.caption("История ходов пуста (Раунд 1)")
@@ -1,14 +1,38 @@
 import streamlit as st
 
 from logic.revival import render_death_overlay
+from logic.simulation.planner import suggest_plan
+from logic.state.state_manager import StateManager
+from ui.avatars import unit_avatar
 from ui.components import render_unit_stats
 from ui.simulator.components.abilities import render_active_abilities
 from ui.simulator.components.inventory import render_inventory
 from ui.simulator.components.slots import render_slot_strip
 
 
+def _apply_suggested_plan(team, opposing_team, key_prefix):
+    """Подбирает карты и цели для команды и сбрасывает виджеты слотов, чтобы они показали план."""
+    plan = suggest_plan(team, opposing_team)
+    plan.apply(team)
+    for c in plan.choices:
+        base_key = f"{key_prefix}_{c.unit_idx}_{team[c.unit_idx].name}"
+        st.session_state.pop(f"{base_key}_card_{c.slot_idx}", None)
+        st.session_state.pop(f"{base_key}_tgt_{c.slot_idx}", None)
+
+    StateManager.save_state(st.session_state, filename=st.session_state.get("current_state_file", "default"))
+    st.toast(f"🧭 План: {plan.baseline:+.1f} → {plan.score:+.1f} "
+             f"({plan.rollouts} прогонов, {plan.elapsed:.2f} с)")
+
+
 def render_team_column(team, label, key_prefix, opposing_team):
     st.markdown(f"### {label} ({len(team)})")
+
+    if st.session_state['phase'] == 'planning' and team and opposing_team:
+        if st.button("🧭 Предложить план", key=f"{key_prefix}_suggest_plan", width='stretch',
+                     help="Подобрать карты и цели по симуляции хода (оценка за ~1 с)"):
+            _apply_suggested_plan(team, opposing_team, key_prefix)
+            st.rerun()
+
     for i, unit in enumerate(team):
         with st.container(border=True):
             # Шапка
@@ -16,7 +40,7 @@ def render_team_column(team, label, key_prefix, opposing_team):
             with c_stats:
                 render_unit_stats(unit)
             with c_img:
-                img = unit.avatar if unit.avatar else "https://placehold.co/150?text=Unit"
+                img = unit_avatar(unit, 128, "https://placehold.co/150?text=Unit")
                 st.image(img, width='stretch')
 
             # Способности
@@ -22,4 +22,11 @@ def apply_styles():
         /* Стиль для логов скриптов */
         .script-log { font-family: monospace; color: #00ff41; background-color: #0d1117; padding: 5px; border-radius: 5px; margin-bottom: 5px; font-size: 0.8em; }
     </style>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """, unsafe_allow_html=True)
+
+    # Спрайт-лист иконок (один раз на страницу, если включен ui.icons.USE_SPRITE)
+    from ui import icons
+    if icons.USE_SPRITE:
+        sprite_css = icons.get_icon_sprite_css()
+        if sprite_css:
+            st.markdown(sprite_css, unsafe_allow_html=True)